@@ -0,0 +1,627 @@
+"""
+Scaling benchmarks for the simulator and its data structures.
+
+Each suite times one operation across growing input sizes and reports one record per
+(suite, case, size). Results are written as JSON, and can be compared against a saved baseline:
+
+    python benchmark.py                                   # run every suite, print a table
+    python benchmark.py hash_table --max-keys 100000      # run one suite, with smaller sizes
+    python benchmark.py --output baseline.json            # save the results
+    python benchmark.py --compare baseline.json           # flag cases slower than the baseline
+
+The exit code is 1 when --compare finds a regression beyond --threshold.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from typing import Callable, Iterable
+
+from concurrent_lazy_double_table import ConcurrentLazyDoubleTable
+from cuckoo_table import CuckooTable
+from data_structures.referential_array import ArrayR
+from enums import PlayerPosition, ScheduleGenerator
+from hashy_date_table import HashyDateTable
+from lazy_double_table import LazyDoubleTable
+from mapped_double_table import MappedDoubleTable
+from player import Player
+from random_stream import RandomStream
+from robin_hood_table import RobinHoodTable
+from season import Season
+from stat_schema import PlayerStats, StatSchema
+from team import Team
+
+
+TEAM_SIZES = (10, 50, 100, 500, 1000, 5000)
+KEY_SIZES = (10, 100, 1000, 10_000, 100_000, 1_000_000)
+ROSTER_SIZES = (10, 100, 1000, 10_000)
+# The greedy generator and full simulations grow too quickly to run at every team size by default.
+GREEDY_MAX_TEAMS = 100
+SIMULATE_MAX_TEAMS = 1000
+# HashyDateTable cannot grow past its last table size of 16 * 366.
+DATE_MAX_KEYS = 3000
+# Each strategy is run on three key sets, so its sizes are capped lower than the other hash table suites.
+STRATEGY_MAX_KEYS = 100_000
+# The growth suite runs well past the last of LazyDoubleTable.TABLE_SIZES, in this many timed chunks.
+GROWTH_KEYS = 10_000_000
+GROWTH_CHUNKS = 20
+READER_THREADS = (1, 2, 4, 8)
+PLAYER_COUNTS = (1000, 10_000, 100_000, 500_000)
+STATS_PER_PLAYER = 8
+READER_LOOKUPS = 50_000
+STRATEGIES = (("double_hashing", LazyDoubleTable), ("robin_hood", RobinHoodTable), ("cuckoo", CuckooTable))
+
+FIRST_NAMES = ("James", "Mohamed", "Luca", "Kai", "Mateo", "Noah", "Oliver", "Ethan", "Leo", "Hugo",
+               "Sofia", "Amelia", "Aisha", "Yuki", "Ava", "Mia", "Zara", "Emma", "Lea", "Chloe")
+LAST_NAMES = ("Smith", "Silva", "Muller", "Rossi", "Garcia", "Kim", "Nguyen", "Jones", "Martin", "Dubois",
+              "Santos", "Kowalski", "Ali", "Sato", "Brown", "Lopez", "Fischer", "Costa", "Ivanov", "Walker")
+
+SUITES: dict[str, Callable[[argparse.Namespace], Iterable[dict]]] = {}
+
+
+def suite(name: str) -> Callable:
+    """
+    Registers a benchmark suite under `name`. A suite takes the parsed arguments and yields result records.
+    """
+    def register(function: Callable) -> Callable:
+        SUITES[name] = function
+        return function
+    return register
+
+
+def record(suite_name: str, case: str, size: int, seconds: float, operations: int | None = None, **extra) -> dict:
+    """
+    Builds one result record. ops_per_second is included when the number of timed operations is known.
+    """
+    result = {"suite": suite_name, "case": case, "size": size, "seconds": seconds}
+    if operations:
+        result["ops_per_second"] = operations / seconds if seconds else float("inf")
+    result.update(extra)
+    return result
+
+
+def best_of(repeat: int, setup: Callable[[], object], operation: Callable[[object], object]) -> float:
+    """
+    Returns the fastest of `repeat` timings of operation(setup()); setup is not timed.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        state = setup()
+        started = time.perf_counter()
+        operation(state)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def sizes_up_to(sizes: Iterable[int], limit: int) -> list[int]:
+    return [size for size in sizes if size <= limit]
+
+
+def player_names(count: int) -> list[str]:
+    """
+    Returns `count` distinct, realistic-looking player names ("First Last", numbered after the first 400).
+    """
+    names = []
+    for index in range(count):
+        first = FIRST_NAMES[index % len(FIRST_NAMES)]
+        last = LAST_NAMES[(index // len(FIRST_NAMES)) % len(LAST_NAMES)]
+        cycle = index // (len(FIRST_NAMES) * len(LAST_NAMES))
+        names.append(f"{first} {last}" if cycle == 0 else f"{first} {last} {cycle + 1}")
+    return names
+
+
+def stat_keys(count: int) -> list[str]:
+    """
+    Returns `count` distinct stat names like the ones stored in Player.stats.
+    """
+    bases = ("goals", "assists", "tackles", "interceptions", "passes", "shots", "saves", "fouls")
+    return [f"{bases[index % len(bases)]}_{index // len(bases)}" for index in range(count)]
+
+
+def date_keys(count: int) -> list[str]:
+    """
+    Returns `count` distinct dates in the four formats HashyDateTable accepts.
+    """
+    start = datetime.date(2000, 1, 1)
+    formats = ("%d/%m/%Y", "%d-%m-%Y", "%Y/%m/%d", "%Y-%m-%d")
+    return [(start + datetime.timedelta(days=index)).strftime(formats[index % len(formats)]) for index in range(count)]
+
+
+def make_players(count: int, prefix: str = "") -> ArrayR[Player]:
+    positions = tuple(PlayerPosition)
+    players = ArrayR(count)
+    for index, name in enumerate(player_names(count)):
+        players[index] = Player(prefix + name, positions[index % len(positions)], 18 + index % 20)
+    return players
+
+
+def make_teams(count: int, players_per_team: int = 11) -> ArrayR[Team]:
+    teams = ArrayR(count)
+    for index in range(count):
+        teams[index] = Team(f"Team {index:05d}", make_players(players_per_team, f"T{index} "), 5)
+    return teams
+
+
+@suite("season_init")
+def bench_season_init(args: argparse.Namespace) -> Iterable[dict]:
+    """
+    Season.__init__, i.e. schedule generation, for each generator.
+    """
+    cases = (
+        ("greedy", {}, GREEDY_MAX_TEAMS),
+        ("circle", {"schedule_generator": ScheduleGenerator.CIRCLE}, args.max_teams),
+        ("circle_compact", {"schedule_generator": ScheduleGenerator.CIRCLE, "compact_fixtures": True}, args.max_teams),
+        ("circle_lazy", {"schedule_generator": ScheduleGenerator.CIRCLE, "lazy_schedule": True}, args.max_teams),
+    )
+    for case, options, limit in cases:
+        for size in sizes_up_to(TEAM_SIZES, min(limit, args.max_teams)):
+            teams = make_teams(size)
+            seconds = best_of(args.repeat, lambda: None, lambda _: Season(teams, **options))
+            yield record("season_init", case, size, seconds)
+
+
+@suite("simulate_season")
+def bench_simulate_season(args: argparse.Namespace) -> Iterable[dict]:
+    """
+    Season.simulate_season on a circle schedule, with the indexed and the deferred leaderboard.
+    """
+    for case, deferred in (("indexed", False), ("deferred", True)):
+        for size in sizes_up_to(TEAM_SIZES, min(SIMULATE_MAX_TEAMS, args.max_teams)):
+            def setup() -> Season:
+                return Season(make_teams(size), deferred, ScheduleGenerator.CIRCLE, compact_fixtures=True)
+
+            seconds = best_of(args.repeat, setup, lambda season: season.simulate_season(RandomStream(size)))
+            yield record("simulate_season", case, size, seconds, size * (size - 1))
+
+
+@suite("hash_table")
+def bench_hash_table(args: argparse.Namespace) -> Iterable[dict]:
+    """
+    LazyDoubleTable insert, bulk construction, lookup, delete and a single growing rehash, on stat-like keys.
+    """
+    for size in sizes_up_to(KEY_SIZES, args.max_keys):
+        keys = stat_keys(size)
+
+        def filled() -> LazyDoubleTable:
+            table = LazyDoubleTable()
+            for key in keys:
+                table[key] = 0
+            return table
+
+        def insert(table: LazyDoubleTable) -> None:
+            for key in keys:
+                table[key] = 1
+
+        def lookup(table: LazyDoubleTable) -> None:
+            for key in keys:
+                table[key]
+
+        def delete(table: LazyDoubleTable) -> None:
+            for key in keys:
+                del table[key]
+
+        yield record("hash_table", "insert", size, best_of(args.repeat, LazyDoubleTable, insert), size)
+        yield record("hash_table", "from_items", size, best_of(
+            args.repeat, lambda: None, lambda _: LazyDoubleTable.from_items((key, 0) for key in keys)), size)
+        yield record("hash_table", "lookup", size, best_of(args.repeat, filled, lookup), size)
+        yield record("hash_table", "delete", size, best_of(args.repeat, filled, delete), size)
+        yield record("hash_table", "rehash", size, min(time_next_rehash(filled()) for _ in range(args.repeat)))
+
+
+def time_next_rehash(table: LazyDoubleTable) -> float:
+    """
+    Inserts new keys until the table grows, and returns how long the insert that grew it took.
+    """
+    size = table.table_size
+    index = 0
+    while True:
+        key = f"extra_{index}"
+        started = time.perf_counter()
+        table[key] = 0
+        elapsed = time.perf_counter() - started
+        if table.table_size != size:
+            return elapsed
+        index += 1
+
+
+class FirstLetterStepTable(LazyDoubleTable):
+    """
+    LazyDoubleTable with its original secondary hash, which took the probe step from the first character
+    of the key only. Kept here as the baseline of the collisions suite.
+    """
+
+    def hash2(self, key: str, key_hash: int | None = None) -> int:
+        step = 17 - (ord(key[0]) % 17)
+        for _ in range(step, self.table_size):
+            if self.table_size % step != 0:
+                return step
+        return 1
+
+
+def probe_lengths(table: LazyDoubleTable, keys: list[str], missing: list[str]) -> tuple[float, float, int]:
+    """
+    Replays inserting `keys` into an empty table of `table`'s size, using its hash functions, and returns
+    the average probe length of a successful lookup, the average for looking up each of `missing`, and the
+    longest probe sequence seen.
+    """
+    size = table.table_size
+    occupied = bytearray(size)
+    total = longest = 0
+    for key in keys:
+        key_hash = table.full_hash(key)
+        position, step, probes = key_hash % size, table.hash2(key, key_hash), 1
+        while occupied[position]:
+            position = (position + step) % size
+            probes += 1
+        occupied[position] = 1
+        total += probes
+        longest = max(longest, probes)
+
+    missing_total = 0
+    for key in missing:
+        key_hash = table.full_hash(key)
+        position, step, probes = key_hash % size, table.hash2(key, key_hash), 1
+        while occupied[position] and probes < size:
+            position = (position + step) % size
+            probes += 1
+        missing_total += probes
+        longest = max(longest, probes)
+    return total / len(keys), missing_total / len(missing), longest
+
+
+@suite("collisions")
+def bench_collisions(args: argparse.Namespace) -> Iterable[dict]:
+    """
+    Probe lengths and lookup time on player names, for the first-letter probe step and the full-key step.
+    """
+    for size in sizes_up_to(ROSTER_SIZES + (100_000,), args.max_keys):
+        names = player_names(size)
+        missing = [f"{name} Jr" for name in names]
+        for case, table_class in (("first_letter_step", FirstLetterStepTable), ("full_key_step", LazyDoubleTable)):
+            def filled() -> LazyDoubleTable:
+                table = table_class()
+                for name in names:
+                    table[name] = 0
+                return table
+
+            def lookup(table: LazyDoubleTable) -> None:
+                for name in names:
+                    table[name]
+
+            hit, miss, longest = probe_lengths(filled(), names, missing)
+            yield record("collisions", case, size, best_of(args.repeat, filled, lookup), size,
+                         average_probes_hit=hit, average_probes_miss=miss, max_probes=longest)
+
+
+def probe_summary(table, keys: list[str], missing: list[str]) -> dict:
+    """
+    Looks up every key in `keys` and `missing` with statistics enabled on `table`, and returns the
+    mean, variance and maximum of the probe lengths of the hits, and the mean for the misses.
+    """
+    statistics = table.enable_statistics()
+    for key in keys:
+        table[key]
+    for key in missing:
+        key in table
+    table.disable_statistics()
+
+    report = statistics.report()
+    mean = report["average_hit_probes"]
+    variance = sum(count * (probes - mean) ** 2 for probes, count in report["hit_histogram"].items()) / len(keys)
+    return {"average_probes_hit": mean, "probe_variance": variance,
+            "average_probes_miss": report["average_miss_probes"], "max_probes": report["max_probes"]}
+
+
+@suite("strategies")
+def bench_strategies(args: argparse.Namespace) -> Iterable[dict]:
+    """
+    Insert and lookup throughput and probe-length spread of each collision strategy, on player names,
+    stat keys and dates, to choose Team.PLAYER_TABLE, Player.STATS_TABLE and the posts table.
+    """
+    key_sets = (("names", player_names), ("stats", stat_keys), ("dates", date_keys))
+    for size in sizes_up_to(KEY_SIZES, min(STRATEGY_MAX_KEYS, args.max_keys)):
+        for key_set, make_keys in key_sets:
+            # The missing keys are the next `size` keys of the same kind, so dates stay valid dates.
+            keys, missing = make_keys(size), make_keys(2 * size)[size:]
+            strategies = STRATEGIES
+            if key_set == "dates" and 2 * size <= DATE_MAX_KEYS:
+                strategies += (("linear_date_hash", HashyDateTable),)
+
+            for strategy, table_class in strategies:
+                def filled():
+                    table = table_class()
+                    for key in keys:
+                        table[key] = 0
+                    return table
+
+                def insert(table) -> None:
+                    for key in keys:
+                        table[key] = 0
+
+                def lookup(table) -> None:
+                    for key in keys:
+                        table[key]
+
+                case = f"{key_set}/{strategy}"
+                yield record("strategies", f"{case}/insert", size, best_of(args.repeat, table_class, insert), size)
+                yield record("strategies", f"{case}/lookup", size, best_of(args.repeat, filled, lookup), size,
+                             **probe_summary(filled(), keys, missing))
+
+
+@suite("growth")
+def bench_growth(args: argparse.Namespace) -> Iterable[dict]:
+    """
+    Insert throughput of one LazyDoubleTable filled to --growth-keys entries, timed in equal chunks, so a
+    drop once the table grows past its predefined sizes would show up as a slower chunk.
+    """
+    table = LazyDoubleTable()
+    chunk = max(args.growth_keys // GROWTH_CHUNKS, 1)
+    for start in range(0, args.growth_keys, chunk):
+        keys = [f"key {index}" for index in range(start, min(start + chunk, args.growth_keys))]
+        started = time.perf_counter()
+        for key in keys:
+            table[key] = 0
+        seconds = time.perf_counter() - started
+        yield record("growth", "insert", start + len(keys), seconds, len(keys), table_size=table.table_size)
+
+
+@suite("concurrent")
+def bench_concurrent(args: argparse.Namespace) -> Iterable[dict]:
+    """
+    Lookup throughput of reader threads while one writer thread keeps updating stats and inserting new
+    keys, which makes the table rehash as it grows. A ConcurrentLazyDoubleTable, whose readers take no
+    lock, is compared with a LazyDoubleTable behind one lock shared by readers and the writer.
+    """
+    size = min(args.max_keys, STRATEGY_MAX_KEYS)
+    keys = stat_keys(size)
+    inserts = [f"new {key}" for key in stat_keys(size)]
+
+    for case in ("seqlock", "locked"):
+        for readers in READER_THREADS:
+            if case == "seqlock":
+                table = ConcurrentLazyDoubleTable.from_items((key, 0) for key in keys)
+                read = table.__getitem__
+                write = table.__setitem__
+            else:
+                table = LazyDoubleTable.from_items((key, 0) for key in keys)
+                lock = threading.Lock()
+
+                def read(key: str, table=table, lock=lock) -> int:
+                    with lock:
+                        return table[key]
+
+                def write(key: str, data: int, table=table, lock=lock) -> None:
+                    with lock:
+                        table[key] = data
+
+            done = threading.Event()
+            writes = []
+
+            def writer() -> None:
+                count = 0
+                while not done.is_set():
+                    write(keys[count % size], count)
+                    write(inserts[count % size], count)
+                    count += 2
+                writes.append(count)
+
+            def reader(offset: int) -> None:
+                for index in range(offset, offset + READER_LOOKUPS):
+                    read(keys[index % size])
+
+            threads = [threading.Thread(target=reader, args=(index * READER_LOOKUPS,)) for index in range(readers)]
+            writing = threading.Thread(target=writer)
+            writing.start()
+            started = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            seconds = time.perf_counter() - started
+            done.set()
+            writing.join()
+
+            yield record("concurrent", f"{case}/{readers}_readers", size, seconds, readers * READER_LOOKUPS,
+                         writes=writes[0])
+
+
+@suite("player_stats")
+def bench_player_stats(args: argparse.Namespace) -> Iterable[dict]:
+    """
+    Memory, read time and season-rollover reset time of STATS_PER_PLAYER stats for many players, stored as
+    a private LazyDoubleTable per player against PlayerStats rows over one shared StatSchema. Memory is
+    measured with tracemalloc, separately from the timings.
+    """
+    items = [(key, index) for index, key in enumerate(stat_keys(STATS_PER_PLAYER))]
+    name = items[-1][0]
+    for size in sizes_up_to(PLAYER_COUNTS, args.max_keys):
+        schema = StatSchema()
+        builders = (("table", lambda: LazyDoubleTable.from_items(items), lambda stats: stats.fill_values(0)),
+                    ("schema", lambda: PlayerStats.from_items(items, schema=schema), PlayerStats.reset))
+        for case, build, reset_one in builders:
+            tracemalloc.start()
+            rows = [build() for _ in range(size)]
+            allocated = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+
+            def read(rows) -> None:
+                for stats in rows:
+                    stats[name]
+
+            seconds = best_of(1, lambda: None, lambda _: [build() for _ in range(size)])
+            yield record("player_stats", f"{case}/build", size, seconds, size,
+                         bytes=allocated, bytes_per_player=allocated / size)
+            def reset(rows) -> None:
+                for stats in rows:
+                    reset_one(stats)
+
+            yield record("player_stats", f"{case}/read", size, best_of(args.repeat, lambda: rows, read), size)
+            yield record("player_stats", f"{case}/reset", size, best_of(args.repeat, lambda: rows, reset), size)
+            del rows
+
+        column = schema[name]
+        rows = [PlayerStats.from_items(items, schema=schema) for _ in range(size)]
+
+        def read_column(rows) -> None:
+            for stats in rows:
+                stats.value_at(column)
+
+        yield record("player_stats", "schema/read_column", size, best_of(args.repeat, lambda: rows, read_column), size)
+
+
+@suite("mapped")
+def bench_mapped(args: argparse.Namespace) -> Iterable[dict]:
+    """
+    Cold start of a stat store: rebuilding a LazyDoubleTable from its items, against opening a
+    MappedDoubleTable file read-only and reading one stat, plus lookups on each.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes_up_to(KEY_SIZES, args.max_keys):
+            keys = stat_keys(size)
+            items = [(key, index) for index, key in enumerate(keys)]
+            path = os.path.join(directory, f"stats_{size}.table")
+
+            started = time.perf_counter()
+            MappedDoubleTable.from_items(path, items).close()
+            yield record("mapped", "build_file", size, time.perf_counter() - started, size)
+
+            def open_and_read(_) -> None:
+                with MappedDoubleTable(path) as table:
+                    table[keys[-1]]
+
+            def lookup(table) -> None:
+                for key in keys:
+                    table[key]
+
+            yield record("mapped", "cold_start_rebuild", size,
+                         best_of(args.repeat, lambda: None, lambda _: LazyDoubleTable.from_items(items)), size)
+            yield record("mapped", "cold_start_open", size, best_of(args.repeat, lambda: None, open_and_read))
+            yield record("mapped", "lookup_in_memory", size,
+                         best_of(args.repeat, lambda: LazyDoubleTable.from_items(items), lookup), size)
+            with MappedDoubleTable(path) as table:
+                yield record("mapped", "lookup_mapped", size, best_of(args.repeat, lambda: table, lookup), size)
+
+
+@suite("date_table")
+def bench_date_table(args: argparse.Namespace) -> Iterable[dict]:
+    """
+    HashyDateTable insert, lookup and delete on dates in every accepted format.
+    """
+    for size in sizes_up_to(KEY_SIZES, min(DATE_MAX_KEYS, args.max_keys)):
+        keys = date_keys(size)
+
+        def filled() -> HashyDateTable:
+            table = HashyDateTable()
+            for key in keys:
+                table[key] = "post"
+            return table
+
+        def insert(table: HashyDateTable) -> None:
+            for key in keys:
+                table[key] = "post"
+
+        def lookup(table: HashyDateTable) -> None:
+            for key in keys:
+                table[key]
+
+        def delete(table: HashyDateTable) -> None:
+            for key in keys:
+                del table[key]
+
+        yield record("date_table", "insert", size, best_of(args.repeat, HashyDateTable, insert), size)
+        yield record("date_table", "lookup", size, best_of(args.repeat, filled, lookup), size)
+        yield record("date_table", "delete", size, best_of(args.repeat, filled, delete), size)
+
+
+@suite("team")
+def bench_team(args: argparse.Namespace) -> Iterable[dict]:
+    """
+    Team construction and Team.get_players, for all players and for a single position.
+    """
+    for size in sizes_up_to(ROSTER_SIZES, args.max_keys):
+        players = make_players(size)
+        yield record("team", "init", size,
+                     best_of(args.repeat, lambda: None, lambda _: Team("Bench FC", players, 5)), size)
+
+        team = Team("Bench FC", players, 5)
+        yield record("team", "get_players", size, best_of(args.repeat, lambda: team, lambda t: t.get_players()))
+        yield record("team", "get_players_striker", size,
+                     best_of(args.repeat, lambda: team, lambda t: t.get_players(PlayerPosition.STRIKER)))
+
+
+def compare(results: list[dict], baseline: list[dict], threshold: float) -> list[dict]:
+    """
+    Matches results to the baseline by (suite, case, size) and returns one row per match,
+    with the ratio of the new time to the baseline time and whether it exceeds `threshold`.
+    """
+    baseline_times = {(item["suite"], item["case"], item["size"]): item["seconds"] for item in baseline}
+    rows = []
+    for item in results:
+        key = (item["suite"], item["case"], item["size"])
+        if key not in baseline_times or not baseline_times[key]:
+            continue
+        ratio = item["seconds"] / baseline_times[key]
+        rows.append({"suite": key[0], "case": key[1], "size": key[2], "baseline": baseline_times[key],
+                     "seconds": item["seconds"], "ratio": ratio, "regression": ratio > threshold})
+    return rows
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Scaling benchmarks for the simulator and its data structures.")
+    p.add_argument("suites", nargs="*", help=f"Suites to run (default: all). Available: {', '.join(SUITES)}")
+    p.add_argument("--output", help="Write the results to this JSON file.")
+    p.add_argument("--compare", help="Compare the results against this baseline JSON file.")
+    p.add_argument("--threshold", type=float, default=1.10,
+                   help="Slowdown ratio above which a case counts as a regression (default 1.10).")
+    p.add_argument("--repeat", type=int, default=3, help="Timings per case; the fastest is kept (default 3).")
+    p.add_argument("--max-teams", type=int, default=max(TEAM_SIZES), help="Largest number of teams to run.")
+    p.add_argument("--max-keys", type=int, default=max(KEY_SIZES), help="Largest number of keys to run.")
+    p.add_argument("--growth-keys", type=int, default=GROWTH_KEYS,
+                   help=f"Entries inserted by the growth suite (default {GROWTH_KEYS:,}).")
+    args = p.parse_args()
+
+    unknown = [name for name in args.suites if name not in SUITES]
+    if unknown:
+        p.error(f"unknown suites: {', '.join(unknown)}")
+
+    results = []
+    for name in args.suites or SUITES:
+        for item in SUITES[name](args):
+            results.append(item)
+            probes = f"{item['average_probes_hit']:>8.2f} / {item['average_probes_miss']:.2f} probes" \
+                if "average_probes_hit" in item else ""
+            print(f"{item['suite']:<16}{item['case']:<24}{item['size']:>10}{item['seconds']:>14.6f}s{probes}", flush=True)
+
+    output = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(output, file, indent=2)
+
+    if not args.compare:
+        return 0
+
+    with open(args.compare, encoding="utf-8") as file:
+        rows = compare(results, json.load(file)["results"], args.threshold)
+    print()
+    for row in rows:
+        flag = "  REGRESSION" if row["regression"] else ""
+        print(f"{row['suite']:<16}{row['case']:<24}{row['size']:>10}{row['ratio']:>10.2f}x{flag}")
+    return 1 if any(row["regression"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterable, Iterator, Mapping, TypeVar
+
+from data_structures.referential_array import ArrayR
+from lazy_double_table import LazyDoubleTable
+
+
+V = TypeVar('V')
+R = TypeVar('R')
+
+
+class ConcurrentLazyDoubleTable(LazyDoubleTable[V]):
+    """
+    A LazyDoubleTable that threads can read while one thread at a time writes to it.
+
+    Writers take a lock and bump a version counter before and after each change, so the version is odd
+    while a change is in progress (a seqlock). Readers take no lock: they note the version, run the
+    lookup, and keep the result only if the version was even and is unchanged afterwards; otherwise
+    the lookup saw a half-made change, such as a rehash swapping the slot arrays, and is retried after
+    yielding the processor. A reader never holds up a writer, but it does wait while a write is in
+    progress: it retries up to SPIN_LIMIT times, and after that takes the lock, which it then holds
+    until it finishes. Single inserts and updates are short enough to end within the retries; long
+    writes such as a rehash, update or fill_values, or a steady stream of writes, make readers take
+    the lock.
+
+    Reads made by the thread that is writing, such as a lookup inside a function passed to map_values,
+    run directly, without retries.
+
+    Whole-table reads (keys, values, items and their iterators) copy the entries under the lock, and
+    iterate over that copy.
+
+    Type Arguments:
+        - V: Value Type.
+    """
+
+    SPIN_LIMIT = 64
+
+    def __init__(self, sizes = None) -> None:
+        """
+        No complexity analysis is required for this function.
+        """
+        self.__lock = threading.RLock()
+        self.__version = 0
+        self.__depth = 0
+        self.__writer: int | None = None
+        LazyDoubleTable.__init__(self, sizes)
+
+    @property
+    def version(self) -> int:
+        """
+        Returns the write version: odd while a write is in progress, and changed by every write.
+        """
+        return self.__version
+
+    @contextmanager
+    def __writing(self) -> Iterator[None]:
+        """
+        Holds the writer lock and marks the table as being written for the duration of the block.
+        Writes nested inside another write, such as the inserts made by update, share its version bump.
+
+        Complexity: O(1), plus waiting for another writer.
+        """
+        with self.__lock:
+            self.__depth += 1
+            if self.__depth == 1:
+                self.__writer = threading.get_ident()
+                self.__version += 1
+            try:
+                yield
+            finally:
+                if self.__depth == 1:
+                    self.__version += 1
+                    self.__writer = None
+                self.__depth -= 1
+
+    def __read(self, operation: Callable[..., R], *args) -> R:
+        """
+        Runs a read-only `operation` without the lock, retrying it while writes overlap it, and falls
+        back to running it under the lock after SPIN_LIMIT tries. A read by the writing thread itself
+        runs at once, since it sees the table as its own write left it.
+
+        Complexity: The cost of `operation`, times the number of retries.
+        """
+        if self.__writer == threading.get_ident():
+            return operation(*args)
+
+        for _ in range(self.SPIN_LIMIT):
+            version = self.__version
+            if version % 2 == 0:
+                try:
+                    result = operation(*args)
+                except Exception:
+                    if self.__version == version:
+                        raise
+                else:
+                    if self.__version == version:
+                        return result
+            time.sleep(0)
+
+        with self.__lock:
+            return operation(*args)
+
+    def __getitem__(self, key: str) -> V:
+        """
+        Get the value at a certain key, without taking the lock unless writes keep overlapping, see __read.
+
+        :complexity: See LazyDoubleTable.__getitem__.
+        :raises KeyError: when the key doesn't exist.
+        """
+        return self.__read(LazyDoubleTable.__getitem__, self, key)
+
+    def __contains__(self, key: str) -> bool:
+        """
+        Checks to see if the given key is in the Hash Table, see __getitem__.
+
+        :complexity: See LazyDoubleTable.__getitem__.
+        """
+        try:
+            _ = self[key]
+        except KeyError:
+            return False
+        return True
+
+    def __setitem__(self, key: str, data: V) -> None:
+        """
+        Set a (key, value) pair under the writer lock.
+
+        :complexity: See LazyDoubleTable.__setitem__.
+        """
+        with self.__writing():
+            LazyDoubleTable.__setitem__(self, key, data)
+
+    def __delitem__(self, key: str) -> None:
+        """
+        Deletes a (key, value) pair under the writer lock.
+
+        :complexity: See LazyDoubleTable.__delitem__.
+        """
+        with self.__writing():
+            LazyDoubleTable.__delitem__(self, key)
+
+    def update(self, items: Iterable[tuple[str, V]] | Mapping[str, V], size_hint: int | None = None) -> None:
+        """
+        Sets every item as one write: readers see the table before the update or after it.
+
+        :complexity: See LazyDoubleTable.update.
+        """
+        with self.__writing():
+            LazyDoubleTable.update(self, items, size_hint)
+
+    def reserve(self, count: int) -> None:
+        """
+        Grows the table under the writer lock, see LazyDoubleTable.reserve.
+        """
+        with self.__writing():
+            LazyDoubleTable.reserve(self, count)
+
+    def map_values(self, function: Callable[[V], V]) -> None:
+        """
+        Replaces every value with function(value) as one write, see LazyDoubleTable.map_values.
+        """
+        with self.__writing():
+            LazyDoubleTable.map_values(self, function)
+
+    def fill_values(self, data: V) -> None:
+        """
+        Sets the value of every key to `data` as one write, see LazyDoubleTable.fill_values.
+        """
+        with self.__writing():
+            LazyDoubleTable.fill_values(self, data)
+
+    def keys(self) -> ArrayR[str]:
+        """
+        Returns all keys in the hash table, read under the writer lock.
+
+        complexity: O(N + S)
+        """
+        with self.__lock:
+            return LazyDoubleTable.keys(self)
+
+    def values(self) -> ArrayR[V]:
+        """
+        Returns all values in the hash table, read under the writer lock.
+
+        complexity: O(N + S)
+        """
+        with self.__lock:
+            return LazyDoubleTable.values(self)
+
+    def iter_keys(self) -> Iterator[str]:
+        """
+        Yields every key from a copy taken under the writer lock, so writes may go on while iterating.
+
+        complexity: O(N + S), O(N) extra space for the copy.
+        """
+        with self.__lock:
+            keys = list(LazyDoubleTable.iter_keys(self))
+        return iter(keys)
+
+    def iter_values(self) -> Iterator[V]:
+        """
+        Yields every value from a copy taken under the writer lock, see iter_keys.
+
+        complexity: O(N + S), O(N) extra space for the copy.
+        """
+        with self.__lock:
+            values = list(LazyDoubleTable.iter_values(self))
+        return iter(values)
+
+    def items(self) -> Iterator[tuple[str, V]]:
+        """
+        Yields every (key, value) pair from a copy taken under the writer lock, see iter_keys.
+
+        complexity: O(N + S), O(N) extra space for the copy.
+        """
+        with self.__lock:
+            items = list(LazyDoubleTable.items(self))
+        return iter(items)
+
+    def __str__(self) -> str:
+        with self.__lock:
+            return LazyDoubleTable.__str__(self)
@@ -0,0 +1,447 @@
+from __future__ import annotations
+
+import time
+from array import array
+from typing import Callable, Iterable, Iterator, Mapping, TypeVar
+
+from data_structures.referential_array import ArrayR
+from data_structures.abstract_hash_table import HashTable
+from lazy_double_table import LazyDoubleTable, next_prime
+from table_statistics import TableStatistics
+
+
+V = TypeVar('V')
+
+
+class CuckooTable(HashTable[str, V]):
+    """
+    Cuckoo Table keeps two tables of equal size, and every key has exactly one slot in each. A lookup
+    checks those two slots and nothing else, so it costs at most two probes however full the table is.
+    An insert whose two slots are both taken evicts one of the occupants, which moves to its slot in
+    the other table, possibly evicting another, until an entry lands in a free slot. If that chain
+    grows past MAX_KICKS the table is rebuilt with a new second hash, and only grown once
+    MAX_REHASHES such rebuilds in a row have failed.
+
+    Each table has its own polynomial hash, like LazyDoubleTable.full_hash but with its own prime base,
+    so keys that collide under one hash are spread by the other. A rebuild after a failed chain moves
+    both hashes on to new prime bases, so no fixed set of keys, such as keys with equal full hashes,
+    can keep colliding. The two tables are stored back to back in one set of parallel arrays: keys,
+    values, both hashes and a used flag per slot.
+
+    Type Arguments:
+        - V: Value Type.
+    """
+
+    TABLE_SIZES = LazyDoubleTable.TABLE_SIZES
+    # Prime bases of the first and second table's hashes; each rebuild moves on to the next primes.
+    HASH_BASES = (131, 137)
+    HASH_MODULUS = LazyDoubleTable.HASH_MODULUS
+    HASH_MIX = LazyDoubleTable.HASH_MIX
+    # Fraction of all slots, in both tables, that may be used before the table grows.
+    LOAD_LIMIT = 0.45
+    MAX_KICKS = 64
+    # Rebuilds with new hashes tried at one size before the table grows instead.
+    MAX_REHASHES = 4
+    # Past the last of TABLE_SIZES, each size is the next prime after GROWTH_FACTOR times the one before.
+    GROWTH_FACTOR = LazyDoubleTable.GROWTH_FACTOR
+
+    # Probe and resize numbers, recorded only after enable_statistics().
+    statistics: TableStatistics | None = None
+
+    def __init__(self, sizes: tuple[int, ...] | None = None) -> None:
+        """
+        No complexity analysis is required for this function.
+        """
+        if sizes is not None:
+            self.TABLE_SIZES = sizes
+
+        self.__size_index = 0
+        self.__sizes = list(self.TABLE_SIZES)
+        self.__bases = self.HASH_BASES
+        self.__allocate(self.TABLE_SIZES[self.__size_index])
+        self.__length = 0
+
+    def __allocate(self, size: int) -> None:
+        """
+        Replaces the slot arrays with empty ones for two tables of `size` slots each.
+
+        Complexity: O(size)
+        """
+        self.__half = size
+        self.__keys: list[str | None] = [None] * (2 * size)
+        self.__values: list[V | None] = [None] * (2 * size)
+        self.__hashes = array("q", bytes(16 * size))
+        self.__second_hashes = array("q", bytes(16 * size))
+        self.__used = bytearray(2 * size)
+
+    @classmethod
+    def from_items(cls, items: Iterable[tuple[str, V]] | Mapping[str, V], size_hint: int | None = None) -> CuckooTable[V]:
+        """
+        Builds a table holding `items`, choosing its final size once. See LazyDoubleTable.from_items.
+
+        Complexity: See update.
+        """
+        table = cls()
+        table.update(items, size_hint)
+        return table
+
+    def update(self, items: Iterable[tuple[str, V]] | Mapping[str, V], size_hint: int | None = None) -> None:
+        """
+        Sets every (key, value) pair of `items`, or every item of a mapping, growing the table at most once
+        unless an eviction chain fails. See LazyDoubleTable.update.
+
+        Complexity:
+            Best Case Complexity: O(N + M), N is the number of entries and M the number of new items.
+            Worst Case Complexity: O(M * N), when eviction chains keep failing and the table keeps growing.
+        """
+        if hasattr(items, "items"):
+            if size_hint is None and hasattr(items, "__len__"):
+                size_hint = len(items)
+            items = items.items()
+        if size_hint is None:
+            if not hasattr(items, "__len__"):
+                items = list(items)
+            size_hint = len(items)
+
+        self.reserve(self.__length + size_hint)
+        for key, data in items:
+            self[key] = data
+
+    def reserve(self, count: int) -> None:
+        """
+        Grows the table, at most once, so that it can hold `count` entries under the load limit.
+
+        Complexity:
+            Best Case Complexity: O(1), when the table is already large enough.
+            Worst Case Complexity: See __rebuild.
+        """
+        size_index = self.__size_index
+        while count > 2 * self.__size_at(size_index) * self.LOAD_LIMIT:
+            size_index += 1
+        if size_index != self.__size_index:
+            self.__rebuild(size_index, self.__entries())
+
+    def __size_at(self, size_index: int) -> int:
+        """
+        Returns the size of each of the two tables for `size_index`, see LazyDoubleTable.__size_at.
+
+        Complexity:
+            Best Case Complexity: O(1), for a size already known.
+            Worst Case Complexity: O(log S) primality checks for each new size generated.
+        """
+        while size_index >= len(self.__sizes):
+            self.__sizes.append(next_prime(int(self.__sizes[-1] * self.GROWTH_FACTOR) + 1))
+        return self.__sizes[size_index]
+
+    def enable_statistics(self) -> TableStatistics:
+        """
+        Starts recording probe lengths and resizes into a new TableStatistics, and returns it.
+
+        Complexity: O(1)
+        """
+        self.statistics = TableStatistics(self)
+        return self.statistics
+
+    def disable_statistics(self) -> None:
+        """
+        Stops recording probe lengths and resizes.
+
+        Complexity: O(1)
+        """
+        self.statistics = None
+
+    @property
+    def table_size(self) -> int:
+        return len(self.__used)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of elements in the hash table
+        """
+        return self.__length
+
+    def is_empty(self) -> bool:
+        return self.__length == 0
+
+    def hash(self, key: str) -> int:
+        """
+        Returns the slot of `key` in the first table.
+
+        :complexity: O(len(key))
+        """
+        return self.hashes(key)[0] % self.__half
+
+    def hashes(self, key: str) -> tuple[int, int]:
+        """
+        Returns the hashes of `key` that pick its slot in the first and the second table: polynomial hashes
+        like LazyDoubleTable.full_hash, with the table's current bases.
+
+        :complexity: O(len(key))
+        """
+        first_base, second_base = self.__bases
+        modulus = self.HASH_MODULUS
+        first = second = 0
+        for char in key:
+            code = ord(char)
+            first = (first * first_base + code) % modulus
+            second = (second * second_base + code) % modulus
+        return first * self.HASH_MIX % modulus, second * self.HASH_MIX % modulus
+
+    def __slots_of(self, key_hash: int, second_hash: int) -> tuple[int, int]:
+        """
+        Returns the slot of a key with hashes `key_hash` and `second_hash` in each of the two tables.
+
+        Complexity: O(1)
+        """
+        half = self.__half
+        return key_hash % half, half + second_hash % half
+
+    def keys(self) -> ArrayR[str]:
+        """
+        Returns all keys in the hash table.
+
+        complexity: O(N + S) where N is the number of items in the table and S is the table size.
+        """
+        res = ArrayR(self.__length)
+        for i, key in enumerate(self.iter_keys()):
+            res[i] = key
+        return res
+
+    def values(self) -> ArrayR[V]:
+        """
+        Returns all values in the hash table.
+
+        complexity: O(N + S) where N is the number of items in the table and S is the table size.
+        """
+        res = ArrayR(self.__length)
+        for i, data in enumerate(self.iter_values()):
+            res[i] = data
+        return res
+
+    def iter_keys(self) -> Iterator[str]:
+        """
+        Yields every key in the hash table. The table must not be changed while iterating.
+
+        complexity: O(N + S) for the whole iteration.
+        """
+        used, keys = self.__used, self.__keys
+        for x in range(len(used)):
+            if used[x]:
+                yield keys[x]
+
+    def iter_values(self) -> Iterator[V]:
+        """
+        Yields every value in the hash table. The table must not be changed while iterating.
+
+        complexity: O(N + S) for the whole iteration.
+        """
+        used, values = self.__used, self.__values
+        for x in range(len(used)):
+            if used[x]:
+                yield values[x]
+
+    def items(self) -> Iterator[tuple[str, V]]:
+        """
+        Yields every (key, value) pair in the hash table. The table must not be changed while iterating.
+
+        complexity: O(N + S) for the whole iteration.
+        """
+        used, keys, values = self.__used, self.__keys, self.__values
+        for x in range(len(used)):
+            if used[x]:
+                yield keys[x], values[x]
+
+    def map_values(self, function: Callable[[V], V]) -> None:
+        """
+        Replaces every value with function(value), in place.
+
+        complexity: O(N + S), plus the cost of the N calls to `function`.
+        """
+        used, values = self.__used, self.__values
+        for x in range(len(used)):
+            if used[x]:
+                values[x] = function(values[x])
+
+    def fill_values(self, data: V) -> None:
+        """
+        Sets the value of every key to `data`, in place.
+
+        complexity: O(N + S)
+        """
+        used, values = self.__used, self.__values
+        for x in range(len(used)):
+            if used[x]:
+                values[x] = data
+
+    def __contains__(self, key: str) -> bool:
+        """
+        Checks to see if the given key is in the Hash Table
+
+        :complexity: See __find.
+        """
+        return self.__find(key, *self.hashes(key)) is not None
+
+    def __getitem__(self, key: str) -> V:
+        """
+        Get the value at a certain key
+
+        :complexity: See __find.
+        :raises KeyError: when the key doesn't exist.
+        """
+        position = self.__find(key, *self.hashes(key))
+        if position is None:
+            raise KeyError(key)
+        return self.__values[position]
+
+    def __find(self, key: str, key_hash: int, second_hash: int) -> int | None:
+        """
+        Returns the slot holding `key`, or None when it is missing.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1), only the key's two slots are checked.
+        """
+        used, hashes, keys = self.__used, self.__hashes, self.__keys
+        for probes, position in enumerate(self.__slots_of(key_hash, second_hash), 1):
+            if used[position] and hashes[position] == key_hash and keys[position] == key:
+                if self.statistics is not None:
+                    self.statistics.record_hit(probes)
+                return position
+
+        if self.statistics is not None:
+            self.statistics.record_miss(2)
+        return None
+
+    def __setitem__(self, key: str, data: V) -> None:
+        """
+        Set a (key, value) pair in our hash table.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(N * MAX_KICKS), when the eviction chain fails and the table is rebuilt, see __rebuild.
+
+            Justification:
+            An existing key is updated in one of its two slots. A new key takes a free one of its two slots,
+            or starts an eviction chain of at most MAX_KICKS moves.
+        """
+        key_hash, second_hash = self.hashes(key)
+        position = self.__find(key, key_hash, second_hash)
+        if position is not None:
+            self.__values[position] = data
+            return
+
+        if self.__length + 1 > self.table_size * self.LOAD_LIMIT:
+            self.__rebuild(self.__size_index + 1, self.__entries())
+            key_hash, second_hash = self.hashes(key)
+
+        self.__length += 1
+        evicted = self.__place(key, data, key_hash, second_hash)
+        if evicted is not None:
+            #the eviction chain failed, so the table is rebuilt with new hashes, including the entry left over.
+            self.__rebuild(self.__size_index, self.__entries() + [evicted], reseed=True)
+
+    def __place(self, key: str, data: V, key_hash: int, second_hash: int) -> tuple[str, V, int, int] | None:
+        """
+        Places an entry whose key is known to be missing, evicting occupants to their other slot as needed.
+        Returns the entry left without a slot after MAX_KICKS evictions, or None once everything is placed.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(MAX_KICKS)
+        """
+        keys, values, hashes, second_hashes, used = \
+            self.__keys, self.__values, self.__hashes, self.__second_hashes, self.__used
+        first, second = self.__slots_of(key_hash, second_hash)
+        if not used[first]:
+            position = first
+        elif not used[second]:
+            position = second
+        else:
+            position = first
+            for _ in range(self.MAX_KICKS):
+                keys[position], key = key, keys[position]
+                values[position], data = data, values[position]
+                hashes[position], key_hash = key_hash, hashes[position]
+                second_hashes[position], second_hash = second_hash, second_hashes[position]
+
+                #the evicted entry moves to its slot in the other table.
+                first, second = self.__slots_of(key_hash, second_hash)
+                position = second if position == first else first
+                if not used[position]:
+                    break
+            else:
+                return key, data, key_hash, second_hash
+
+        keys[position] = key
+        values[position] = data
+        hashes[position] = key_hash
+        second_hashes[position] = second_hash
+        used[position] = 1
+        return None
+
+    def __delitem__(self, key: str) -> None:
+        """
+        Deletes a (key, value) pair in our hash table.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        position = self.__find(key, *self.hashes(key))
+        if position is None:
+            raise KeyError(key)
+
+        self.__keys[position] = None
+        self.__values[position] = None
+        self.__used[position] = 0
+        self.__length -= 1
+
+    def __entries(self) -> list[tuple[str, V, int, int]]:
+        """
+        Returns every entry as (key, value, first hash, second hash).
+
+        Complexity: O(S)
+        """
+        return [(self.__keys[x], self.__values[x], self.__hashes[x], self.__second_hashes[x])
+                for x in range(len(self.__used)) if self.__used[x]]
+
+    def __rebuild(self, size_index: int, entries: list[tuple[str, V, int, int]], reseed: bool = False) -> None:
+        """
+        Places `entries` into new tables of the size at `size_index`, first moving on to new hashes when
+        `reseed` is set. Whenever an entry cannot be placed, the tables are rebuilt with new hashes, and
+        after MAX_REHASHES failures in a row at one size, at the next size.
+
+        Complexity:
+            Best Case Complexity: O(S + N), when every entry is placed at the first try.
+            Worst Case Complexity: O(N * (MAX_KICKS + len(key))) for each rebuild tried.
+        """
+        started = time.perf_counter()
+        failures = 0
+        while True:
+            if reseed:
+                first_base = next_prime(self.__bases[1] + 1)
+                self.__bases = (first_base, next_prime(first_base + 1))
+                entries = [(key, data, *self.hashes(key)) for key, data, _, _ in entries]
+
+            self.__size_index = size_index
+            self.__allocate(self.__size_at(size_index))
+            if all(self.__place(*entry) is None for entry in entries):
+                break
+
+            failures += 1
+            if failures >= self.MAX_REHASHES:
+                size_index += 1
+                failures = 0
+            reseed = True
+
+        if self.statistics is not None:
+            self.statistics.record_rehash(time.perf_counter() - started)
+
+    def __str__(self) -> str:
+        """
+        Returns all they key/value pairs in our hash table (no particular order).
+        """
+        result = ""
+        for key, value in self.items():
+            result += "(" + str(key) + "," + str(value) + ")\n"
+        return result
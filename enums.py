@@ -21,3 +21,12 @@ class PlayerPosition(Enum):
     DEFENDER = "Defender"
     MIDFIELDER = "Midfielder"
     STRIKER = "Striker"
+
+
+class ScheduleGenerator(Enum):
+    """
+    Enum class to represent the ways a season's schedule can be generated
+    Valid generators are: Greedy, Circle
+    """
+    GREEDY = "Greedy"
+    CIRCLE = "Circle"
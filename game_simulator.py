@@ -1,11 +1,21 @@
 from __future__ import annotations
+from array import array
+from concurrent.futures import Executor
+from typing import Callable, Iterable, Iterator, Sequence, TYPE_CHECKING
 from data_structures.referential_array import ArrayR
 from data_structures.array_list import ArrayList
 from enums import PlayerPosition
 from player import Player
 from random_gen import RandomGen
+from random_stream import RandomStream
 from team import Team
 
+if TYPE_CHECKING:
+    from season import Game, WeekOfGames
+
+# Goals scored by a team, weighted towards low scores. Built once rather than on every simulated game.
+GOAL_DISTRIBUTION: tuple[int, ...] = (0,) * 30 + (1,) * 30 + (2,) * 20 + (3,) * 10 + (4,) * 5 + (5,) * 5
+
 
 class GameSimulationOutcome:
     def __init__(self, home_goals: int, away_goals: int, goal_scorers: ArrayList[str]):
@@ -32,7 +42,7 @@ class GameSimulationOutcome:
 class GameSimulator:
 
     @staticmethod
-    def simulate(home_team: Team, away_team: Team) -> GameSimulationOutcome:
+    def simulate(home_team: Team, away_team: Team, rng: RandomStream | None = None) -> GameSimulationOutcome:
         """
         Simulates a game between two teams, considering player stats for a more probabilistic outcome.
         Note: To call this method, use: GameSimulator.simulate(home_team, away_team)
@@ -40,15 +50,18 @@ class GameSimulator:
         Args:
             home_team (Team): The home team.
             away_team (Team): The away team.
+            rng (RandomStream or None): The generator to draw from. None uses the global RandomGen.
 
         Returns:
             LinearProbeTable: A table with keys 'Home Goals', 'Away Goals', 'Goal Scorers',
                             'Goal Assists', 'Interceptions', 'Tacklers'
         """
+        if rng is None:
+            rng = RandomGen
+
         # 1. Determine goals scored by each team with a higher likelihood of low scores
-        goal_distribution: list[int] = [0] * 30 + [1] * 30 + [2] * 20 + [3] * 10 + [4] * 5 + [5] * 5
-        home_goals: int = RandomGen.random_choice(goal_distribution)
-        away_goals: int = RandomGen.random_choice(goal_distribution)
+        home_goals: int = rng.random_choice(GOAL_DISTRIBUTION)
+        away_goals: int = rng.random_choice(GOAL_DISTRIBUTION)
 
         # 2. Select goal scorers based on stats
         goal_scorers = ArrayList[str]()
@@ -68,11 +81,304 @@ class GameSimulator:
             all_players[i + len(home_players)] = away_players[i]
 
         for _ in range(home_goals):
-            scorer: Player = RandomGen.random_choice(home_outfield)
+            scorer: Player = rng.random_choice(home_outfield)
             goal_scorers.append(scorer.name)
 
         for _ in range(away_goals):
-            scorer: Player = RandomGen.random_choice(away_outfield)
+            scorer: Player = rng.random_choice(away_outfield)
             goal_scorers.append(scorer.name)
 
         return GameSimulationOutcome(home_goals, away_goals, goal_scorers)
+
+    @staticmethod
+    def simulate_batch(games: Iterable[Game], rng: RandomStream | None = None) -> BatchSimulationOutcome:
+        """
+        Simulates every game in `games` in one pass, e.g. a whole WeekOfGames.
+        Note: To call this method, use: GameSimulator.simulate_batch(week)
+
+        The random draws happen in exactly the same order as calling simulate() on each game in turn,
+        so a batch produces the same results as the per-game path for the same random state.
+        The per-game overhead is removed instead: the goal distribution is shared, and each team's
+        outfield players are collected once per batch rather than once per game.
+
+        With an explicit `rng`, game i draws from rng.split(i) exactly as simulate(home, away, rng.split(i)) would,
+        so each game's outcome depends only on the generator and its position in the batch.
+
+        Args:
+            games (Iterable[Game]): The games to simulate, in order.
+            rng (RandomStream or None): The generator to split per game. None uses the global RandomGen.
+
+        Returns:
+            BatchSimulationOutcome: The outcomes of the games, in the same order as `games`.
+
+        Complexity:
+            Best Case Complexity: O(G + T * P)
+            Worst Case Complexity: O(G + T * P)
+
+            G is the number of games (and goals, which are bounded per game).
+            T is the number of distinct teams in the batch.
+            P is the number of players in a team.
+        """
+        if rng is None:
+            return GameSimulator._simulate_games((game, RandomGen) for game in games)
+        return GameSimulator._simulate_games((game, rng.split(index)) for index, game in enumerate(games))
+
+    @staticmethod
+    def simulate_schedule(schedule: Iterable[WeekOfGames], rng: RandomStream | None = None) -> BatchSimulationOutcome:
+        """
+        Simulates every game of every week in `schedule` as a single batch, e.g. a whole Season.schedule.
+
+        With an explicit `rng`, game i of a week draws from rng.split(week.week, i),
+        matching simulate_batch(week, rng.split(week.week)).
+
+        Args:
+            schedule (Iterable[WeekOfGames]): The weeks to simulate, in order.
+            rng (RandomStream or None): The generator to split per week and game. None uses the global RandomGen.
+
+        Returns:
+            BatchSimulationOutcome: The outcomes of all games, week by week, in schedule order.
+
+        Complexity:
+            See simulate_batch, with G being the number of games in the whole schedule.
+        """
+        if rng is None:
+            return GameSimulator._simulate_games((game, RandomGen) for week in schedule for game in week)
+        return GameSimulator._simulate_games(
+            (game, rng.split(week.week, index)) for week in schedule for index, game in enumerate(week)
+        )
+
+    @staticmethod
+    def _simulate_games(games: Iterable[tuple[Game, RandomStream]]) -> BatchSimulationOutcome:
+        """
+        Simulates each game with the generator paired with it. See simulate_batch.
+        """
+        outcomes = BatchSimulationOutcome()
+        outfield_by_team: dict[str, tuple[list[Player], range]] = {}
+
+        for game, game_rng in games:
+            home = outfield_by_team.get(game.home_team.name)
+            if home is None:
+                home = outfield_by_team[game.home_team.name] = GameSimulator._outfield(game.home_team)
+            away = outfield_by_team.get(game.away_team.name)
+            if away is None:
+                away = outfield_by_team[game.away_team.name] = GameSimulator._outfield(game.away_team)
+
+            GameSimulator._play(outcomes, home, away, game_rng.random_choice)
+
+        return outcomes
+
+    @staticmethod
+    def simulate_fixtures(teams: Sequence[Team], team_ids: array, rng: RandomStream | None = None) -> BatchSimulationOutcome:
+        """
+        Simulates compactly stored games, e.g. the team_ids of a week's FixtureList.
+        Gives the same outcomes as simulate_batch on the corresponding games, but reads the teams by id,
+        without creating any Game objects.
+
+        Args:
+            teams (Sequence[Team]): The teams the ids refer to.
+            team_ids (array): home_0, away_0, home_1, away_1, ... team ids.
+            rng (RandomStream or None): The generator to split per game. None uses the global RandomGen.
+
+        Returns:
+            BatchSimulationOutcome: The outcomes of the games, in order.
+
+        Complexity:
+            See simulate_batch.
+        """
+        outcomes = BatchSimulationOutcome()
+        outfield_by_id: dict[int, tuple[list[Player], range]] = {}
+
+        for index in range(len(team_ids) // 2):
+            home_id, away_id = team_ids[2 * index], team_ids[2 * index + 1]
+            home = outfield_by_id.get(home_id)
+            if home is None:
+                home = outfield_by_id[home_id] = GameSimulator._outfield(teams[home_id])
+            away = outfield_by_id.get(away_id)
+            if away is None:
+                away = outfield_by_id[away_id] = GameSimulator._outfield(teams[away_id])
+
+            choice = RandomGen.random_choice if rng is None else rng.split(index).random_choice
+            GameSimulator._play(outcomes, home, away, choice)
+
+        return outcomes
+
+    @staticmethod
+    def simulate_parallel(games: Iterable[Game], rng: RandomStream, executor: Executor, chunks: int) -> BatchSimulationOutcome:
+        """
+        Simulates independent games on `executor`, split into `chunks` contiguous chunks.
+
+        Only the number of outfield players of each side is sent to the workers, since scorers are drawn
+        as indices. Game i draws from rng.split(i) wherever it runs, and the chunks are merged back in order,
+        so the result is identical to simulate_batch(games, rng).
+
+        Args:
+            games (Iterable[Game]): The games to simulate, in order.
+            rng (RandomStream): The generator to split per game.
+            executor (Executor): The pool running the chunks, usually a ProcessPoolExecutor.
+            chunks (int): How many chunks to split the games into.
+
+        Returns:
+            BatchSimulationOutcome: The outcomes of the games, in the same order as `games`.
+
+        Complexity:
+            Best Case Complexity: O(G / K + T * P)
+            Worst Case Complexity: O(G / K + T * P)
+
+            K is the number of workers; see simulate_batch for the other variables.
+        """
+        outfield_by_team: dict[str, tuple[list[Player], range]] = {}
+        outfields: list[list[Player]] = []
+        sizes = array("H")
+
+        for game in games:
+            for team in (game.home_team, game.away_team):
+                side = outfield_by_team.get(team.name)
+                if side is None:
+                    side = outfield_by_team[team.name] = GameSimulator._outfield(team)
+                outfields.append(side[0])
+                sizes.append(len(side[0]))
+
+        num_games = len(sizes) // 2
+        bounds = [num_games * chunk // chunks for chunk in range(chunks + 1)]
+        jobs = [(rng, bounds[chunk], sizes[2 * bounds[chunk]:2 * bounds[chunk + 1]])
+                for chunk in range(chunks) if bounds[chunk] < bounds[chunk + 1]]
+
+        outcomes = BatchSimulationOutcome()
+        if jobs:
+            for part in executor.map(_simulate_outfield_sizes, *zip(*jobs)):
+                outcomes.extend(part)
+        outcomes.outfields = outfields
+        return outcomes
+
+    @staticmethod
+    def _play(outcomes: BatchSimulationOutcome, home: tuple[list[Player], range], away: tuple[list[Player], range],
+              choice: Callable) -> None:
+        """
+        Draws one game between two outfields and appends it to `outcomes`.
+        The draws are made in the same order as simulate(): home goals, away goals, home scorers, away scorers.
+        Only the index range of each outfield is needed to draw; the players are just recorded.
+
+        Complexity: O(1), as the number of goals is bounded.
+        """
+        home_goals: int = choice(GOAL_DISTRIBUTION)
+        away_goals: int = choice(GOAL_DISTRIBUTION)
+        outcomes.home_goals.append(home_goals)
+        outcomes.away_goals.append(away_goals)
+
+        # Scorers are stored as indices into the scoring side's outfield players, home goals first.
+        # Choosing from the index range consumes the same randomness as choosing from the players.
+        for _ in range(home_goals):
+            outcomes.scorer_indices.append(choice(home[1]))
+        for _ in range(away_goals):
+            outcomes.scorer_indices.append(choice(away[1]))
+
+        outcomes.scorer_offsets.append(len(outcomes.scorer_indices))
+        outcomes.outfields.append(home[0])
+        outcomes.outfields.append(away[0])
+
+    @staticmethod
+    def _outfield(team: Team) -> tuple[list[Player], range]:
+        """
+        Returns the players of `team` that are allowed to score, i.e. everyone but the goalkeepers,
+        together with the range of their indices.
+
+        Complexity:
+            Best Case Complexity: O(P)
+            Worst Case Complexity: O(P), P is the number of players in the team.
+        """
+        outfield = [player for player in team.get_players() if player.position != PlayerPosition.GOALKEEPER]
+        return outfield, range(len(outfield))
+
+
+class BatchSimulationOutcome:
+    """
+    Compact outcomes of a batch of simulated games.
+
+    Game i scored home_goals[i] and away_goals[i]. Its goal scorers are
+    scorer_indices[scorer_offsets[i]:scorer_offsets[i + 1]], home scorers first, where each index
+    refers to the outfield players of the scoring side (outfields[2 * i] for home, outfields[2 * i + 1] for away).
+    """
+
+    def __init__(self) -> None:
+        """
+        Creates an empty batch, filled in by GameSimulator.simulate_batch.
+
+        No complexity analysis is required for this function.
+        """
+        self.home_goals: array = array("B")
+        self.away_goals: array = array("B")
+        self.scorer_offsets: array = array("I", [0])
+        self.scorer_indices: array = array("H")
+        self.outfields: list[list[Player]] = []
+
+    def __len__(self) -> int:
+        """
+        Returns the number of games in the batch.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        return len(self.home_goals)
+
+    def extend(self, other: BatchSimulationOutcome) -> None:
+        """
+        Appends the games of `other` after the games of this batch.
+
+        Complexity:
+            Best Case Complexity: O(G)
+            Worst Case Complexity: O(G), G is the number of games (and goals) in `other`.
+        """
+        base = self.scorer_offsets[-1]
+        self.home_goals.extend(other.home_goals)
+        self.away_goals.extend(other.away_goals)
+        self.scorer_indices.extend(other.scorer_indices)
+        for offset in other.scorer_offsets[1:]:
+            self.scorer_offsets.append(base + offset)
+        self.outfields.extend(other.outfields)
+
+    def scorers(self, index: int) -> Iterator[Player]:
+        """
+        Yields the players that scored in game `index`, home scorers first.
+
+        Complexity:
+            Best Case Complexity: O(1) per scorer
+            Worst Case Complexity: O(1) per scorer
+        """
+        start = self.scorer_offsets[index]
+        home_end = start + self.home_goals[index]
+        end = self.scorer_offsets[index + 1]
+        home_outfield = self.outfields[2 * index]
+        away_outfield = self.outfields[2 * index + 1]
+
+        for position in range(start, home_end):
+            yield home_outfield[self.scorer_indices[position]]
+        for position in range(home_end, end):
+            yield away_outfield[self.scorer_indices[position]]
+
+    def __getitem__(self, index: int) -> GameSimulationOutcome:
+        """
+        Returns the outcome of game `index` in the same form as GameSimulator.simulate.
+
+        Complexity:
+            Best Case Complexity: O(1) per scorer
+            Worst Case Complexity: O(1) per scorer
+        """
+        goal_scorers = ArrayList[str]()
+        for scorer in self.scorers(index):
+            goal_scorers.append(scorer.name)
+        return GameSimulationOutcome(self.home_goals[index], self.away_goals[index], goal_scorers)
+
+
+def _simulate_outfield_sizes(rng: RandomStream, start: int, sizes: array) -> BatchSimulationOutcome:
+    """
+    Worker for GameSimulator.simulate_parallel: simulates games start, start + 1, ... given only
+    the outfield size of each side (home and away interleaved in `sizes`).
+    The returned outfields are None placeholders that the caller replaces with the real players.
+    """
+    outcomes = BatchSimulationOutcome()
+    for index in range(len(sizes) // 2):
+        home = (None, range(sizes[2 * index]))
+        away = (None, range(sizes[2 * index + 1]))
+        GameSimulator._play(outcomes, home, away, rng.split(start + index).random_choice)
+    return outcomes
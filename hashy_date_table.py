@@ -3,8 +3,10 @@ from __future__ import annotations
 from data_structures.hash_table_linear_probing import LinearProbeTable
 
 from data_structures.referential_array import ArrayR
+from table_statistics import TableStatistics
 
 import datetime
+import time
 
 class HashyDateTable(LinearProbeTable[str]):
     """
@@ -15,6 +17,13 @@ class HashyDateTable(LinearProbeTable[str]):
     
     All values will also be strings.
     """
+
+    # Probe and resize numbers, recorded only after enable_statistics().
+    statistics: TableStatistics | None = None
+    # Set while __setitem__ records its insert; rehash reinserts made meanwhile are not recorded.
+    __inserting = False
+    __insert_probes: int | None = None
+
     def __init__(self) -> None:
         """
         Initialise the Hash Table with with increments of 366 as the table size.
@@ -81,4 +90,92 @@ class HashyDateTable(LinearProbeTable[str]):
         return (day_index + years_from_start * 366) % self.table_size
 
 
-            
\ No newline at end of file
+    def enable_statistics(self) -> TableStatistics:
+        """
+        Starts recording probe lengths and resizes into a new TableStatistics, and returns it.
+        It stays readable as `statistics` while the table is in use.
+
+        Complexity: O(1)
+        """
+        self.statistics = TableStatistics(self)
+        return self.statistics
+
+    def disable_statistics(self) -> None:
+        """
+        Stops recording probe lengths and resizes.
+
+        Complexity: O(1)
+        """
+        self.statistics = None
+
+    def _linear_probe(self, key: str, is_insert: bool) -> int:
+        """
+        Runs LinearProbeTable's probe, and while statistics are enabled counts the slots it visited: the
+        distance from the key's hash position to the slot found, plus one. Lookups are recorded here; the
+        count of an insert is left for __setitem__, which knows whether the key was new.
+
+        LinearProbeTable does not say where a failed lookup stopped, so its length is taken from the empty
+        slot an insert of the key would use, which is where the lookup stopped. Only failed lookups pay
+        for this second probe.
+
+        Complexity: See LinearProbeTable._linear_probe, twice for a failed lookup while statistics are enabled.
+        """
+        statistics = self.statistics
+        if statistics is None:
+            return LinearProbeTable._linear_probe(self, key, is_insert)
+
+        try:
+            position = LinearProbeTable._linear_probe(self, key, is_insert)
+        except KeyError:
+            if not is_insert:
+                statistics.record_miss(self.__miss_probes(key))
+            raise
+
+        probes = (position - self.hash(key)) % self.table_size + 1
+        if not is_insert:
+            statistics.record_hit(probes)
+        elif self.__inserting and self.__insert_probes is None:
+            self.__insert_probes = probes
+        return position
+
+    def __miss_probes(self, key: str) -> int:
+        """
+        Returns the number of slots a lookup of the missing `key` visited: up to and including the first
+        empty slot from its hash position, or the whole table when there is none.
+
+        Complexity: See LinearProbeTable._linear_probe.
+        """
+        try:
+            position = LinearProbeTable._linear_probe(self, key, True)
+        except (KeyError, RuntimeError):
+            return self.table_size
+        return (position - self.hash(key)) % self.table_size + 1
+
+    def __setitem__(self, key: str, data: str) -> None:
+        """
+        Set the post for a date, recording the probe length and any resize while statistics are enabled.
+        Inserting a new date is a miss, and replacing the post of a date already in the table is a hit.
+
+        Complexity: See LinearProbeTable.__setitem__.
+        """
+        statistics = self.statistics
+        if statistics is None or self.__inserting:
+            LinearProbeTable.__setitem__(self, key, data)
+            return
+
+        length, table_size = len(self), self.table_size
+        started = time.perf_counter()
+        self.__inserting, self.__insert_probes = True, None
+        try:
+            LinearProbeTable.__setitem__(self, key, data)
+        finally:
+            self.__inserting = False
+
+        probes = self.__insert_probes
+        if probes is not None:
+            if len(self) > length:
+                statistics.record_miss(probes)
+            else:
+                statistics.record_hit(probes)
+        if self.table_size != table_size:
+            statistics.record_rehash(time.perf_counter() - started)
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import math
+import time
+from array import array
+
 from data_structures.referential_array import ArrayR
 from data_structures.abstract_hash_table import HashTable
-from typing import TypeVar
+from table_statistics import TableStatistics
+from typing import Callable, Iterable, Iterator, Mapping, TypeVar
 
 
 V = TypeVar('V')
@@ -17,6 +22,53 @@ class Sentinel:
 #Sentinel variable initialised to deal with deleted keys.
 SENTINEL = Sentinel()
 
+#Slot states. Deleted slots are marked DELETED in the table's state array, which plays the role SENTINEL used to.
+EMPTY = 0
+LIVE = 1
+DELETED = 2
+
+
+def is_prime(n: int) -> bool:
+    """
+    Checks whether `n` is prime, using Miller-Rabin with bases that make it exact for n < 3.3 * 10^24.
+
+    Complexity: O(log n) multiplications of n-bit numbers per base, with a fixed number of bases.
+    """
+    if n < 2:
+        return False
+    bases = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+    for base in bases:
+        if n % base == 0:
+            return n == base
+
+    odd, twos = n - 1, 0
+    while odd % 2 == 0:
+        odd //= 2
+        twos += 1
+    for base in bases:
+        witness = pow(base, odd, n)
+        if witness in (1, n - 1):
+            continue
+        for _ in range(twos - 1):
+            witness = witness * witness % n
+            if witness == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def next_prime(n: int) -> int:
+    """
+    Returns the smallest prime that is at least `n`.
+
+    Complexity: O(log n) primality checks on average, by the density of the primes.
+    """
+    candidate = max(n, 2)
+    while not is_prime(candidate):
+        candidate += 1
+    return candidate
+
 class LazyDoubleTable(HashTable[str, V]):
     """
     Lazy Double Table uses double hashing to resolve collisions, and implements lazy deletion.
@@ -24,29 +76,169 @@ class LazyDoubleTable(HashTable[str, V]):
     Feel free to check out the implementation of the LinearProbeTable class if you need to remind
     yourself how to implement the methods of this class.
 
+    Slots are stored as parallel arrays instead of one (key, value) tuple per slot: keys and values in
+    Python lists, the full hash of each key in a typed array and each slot's state (EMPTY, LIVE or DELETED)
+    in a bytearray. Updating the value of an existing key overwrites it in place without allocating, and
+    a slot costs three machine words and a byte. Lists are used rather than ArrayR because a ctypes array
+    also keeps a bookkeeping entry for every object stored in it, which costs more than the slot itself.
+
     Type Arguments:
         - V: Value Type.
     """
     
-    # No test case should exceed 1 million entries.
+    # Past the last of these, each size is the next prime after GROWTH_FACTOR times the one before.
     TABLE_SIZES = (5, 13, 29, 53, 97, 193, 389, 769, 1543, 3079, 6151, 12289, 24593, 49157, 98317, 196613, 393241, 786433, 1572869)
     HASH_BASE = 31
+    # Full-width hashes are reduced modulo this Mersenne prime, so they do not depend on the table size.
+    HASH_MODULUS = 2 ** 61 - 1
+    # Short keys only reach the low bits of the modulus; multiplying by this spreads them over all 61 bits.
+    HASH_MIX = 0x5851F42D4C957F2D % HASH_MODULUS
+    # The table is rebuilt at its current size once DELETED slots take up this fraction of the slots,
+    TOMBSTONE_LIMIT = 0.25
+    # and moved to a smaller size once fewer than this fraction of the slots hold live entries.
+    SHRINK_LOAD = 1 / 6
+    # The table grows before an insert would take it past this fraction of its slots.
+    LOAD_THRESHOLD = 2 / 3
+    GROWTH_FACTOR = 2
+
+    # Probe and resize numbers, recorded only after enable_statistics().
+    statistics: TableStatistics | None = None
 
     def __init__(self, sizes = None) -> None:
         """
         No complexity analysis is required for this function.
-        Do not make any changes to this function.
         """
         if sizes is not None:
             self.TABLE_SIZES = sizes
 
         self.__size_index = 0
-        self.__array: ArrayR[tuple[str, V]] = ArrayR(self.TABLE_SIZES[self.__size_index])
+        self.__sizes = list(self.TABLE_SIZES)
+        self.__allocate(self.TABLE_SIZES[self.__size_index])
         self.__length = 0
+        self.__tombstones = 0
+
+    def __allocate(self, size: int) -> None:
+        """
+        Replaces the slot arrays with empty ones of `size` slots.
+
+        Complexity: O(size)
+        """
+        self.__keys: list[str | None] = [None] * size
+        self.__values: list[V | None] = [None] * size
+        self.__hashes = array("q", bytes(8 * size))
+        self.__states = bytearray(size)
+
+    @classmethod
+    def from_items(cls, items: Iterable[tuple[str, V]] | Mapping[str, V], size_hint: int | None = None) -> LazyDoubleTable[V]:
+        """
+        Builds a table holding `items`, (key, value) pairs or a mapping, choosing its final size once.
+        See update.
+
+        Complexity: See update.
+        """
+        table = cls()
+        table.update(items, size_hint)
+        return table
+
+    def update(self, items: Iterable[tuple[str, V]] | Mapping[str, V], size_hint: int | None = None) -> None:
+        """
+        Sets every (key, value) pair of `items`, or every item of a mapping, in one pass.
+
+        The table is grown once, straight to the size that fits the current entries plus the new ones,
+        instead of stepping through every size in TABLE_SIZES with a rehash at each. `size_hint` is the
+        number of new items, for iterables whose length cannot be taken; without it such an iterable is
+        read into a list first. Keys that are already in the table are counted as new, so the table may
+        end one size larger than strictly needed.
+
+        Complexity:
+            Best Case Complexity: O(N + M), N is the number of entries and M the number of new items.
+            Worst Case Complexity: O(M * S), S is the table size.
+
+            Justification:
+
+            Best Case:
+            The table is resized at most once, O(N + S), and every item lands on its first probe.
+
+            Worst Case:
+            Every item probes through most of the table, see __setitem__.
+        """
+        if hasattr(items, "items"):
+            if size_hint is None and hasattr(items, "__len__"):
+                size_hint = len(items)
+            items = items.items()
+        if size_hint is None:
+            if not hasattr(items, "__len__"):
+                items = list(items)
+            size_hint = len(items)
+
+        self.reserve(self.__length + size_hint)
+        for key, data in items:
+            self[key] = data
+
+    def reserve(self, count: int) -> None:
+        """
+        Grows the table, at most once, so that it can hold `count` entries without another rehash.
+        The table never shrinks here.
+
+        Complexity:
+            Best Case Complexity: O(1), when the table is already large enough.
+            Worst Case Complexity: O(N * S), see __resize.
+        """
+        size_index = self.__size_index
+        while count > self.__capacity(self.__size_at(size_index)):
+            size_index += 1
+        if size_index != self.__size_index:
+            self.__resize(size_index)
     
+    def __size_at(self, size_index: int) -> int:
+        """
+        Returns the table size for `size_index`: an entry of TABLE_SIZES, or past its end, a prime
+        generated by growing the last size by GROWTH_FACTOR as many times as needed.
+
+        Complexity:
+            Best Case Complexity: O(1), for a size already known.
+            Worst Case Complexity: O(log S) primality checks for each new size generated.
+        """
+        while size_index >= len(self.__sizes):
+            self.__sizes.append(next_prime(int(self.__sizes[-1] * self.GROWTH_FACTOR) + 1))
+        return self.__sizes[size_index]
+
+    def __capacity(self, size: int) -> int:
+        """
+        Returns how many entries a table of `size` slots may hold under LOAD_THRESHOLD.
+
+        Complexity: O(1)
+        """
+        return int(size * self.LOAD_THRESHOLD)
+
+    def enable_statistics(self) -> TableStatistics:
+        """
+        Starts recording probe lengths and resizes into a new TableStatistics, and returns it.
+        It stays readable as `statistics` while the table is in use.
+
+        Complexity: O(1)
+        """
+        self.statistics = TableStatistics(self)
+        return self.statistics
+
+    def disable_statistics(self) -> None:
+        """
+        Stops recording probe lengths and resizes.
+
+        Complexity: O(1)
+        """
+        self.statistics = None
+
     @property
     def table_size(self) -> int:
-        return len(self.__array)
+        return len(self.__states)
+
+    @property
+    def tombstones(self) -> int:
+        """
+        Returns the number of slots marked DELETED by a deletion and not reused since.
+        """
+        return self.__tombstones
 
     def __len__(self) -> int:
         """
@@ -62,8 +254,8 @@ class LazyDoubleTable(HashTable[str, V]):
         res = ArrayR(self.__length)
         i = 0
         for x in range(self.table_size):
-            if self.__array[x] is not None:
-                res[i] = self.__array[x][0]
+            if self.__states[x] == LIVE:
+                res[i] = self.__keys[x]
                 i += 1
         return res
 
@@ -76,11 +268,70 @@ class LazyDoubleTable(HashTable[str, V]):
         res = ArrayR(self.__length)
         i = 0
         for x in range(self.table_size):
-            if self.__array[x] is not None:
-                res[i] = self.__array[x][1]
+            if self.__states[x] == LIVE:
+                res[i] = self.__values[x]
                 i += 1
         return res
 
+    def iter_keys(self) -> Iterator[str]:
+        """
+        Yields every key in the hash table, without building an array of them.
+        The table must not be changed while the iteration is in progress.
+
+        complexity: O(N + S) for the whole iteration, O(1) extra space.
+        """
+        states, keys = self.__states, self.__keys
+        for x in range(len(states)):
+            if states[x] == LIVE:
+                yield keys[x]
+
+    def iter_values(self) -> Iterator[V]:
+        """
+        Yields every value in the hash table, without building an array of them.
+        The table must not be changed while the iteration is in progress.
+
+        complexity: O(N + S) for the whole iteration, O(1) extra space.
+        """
+        states, values = self.__states, self.__values
+        for x in range(len(states)):
+            if states[x] == LIVE:
+                yield values[x]
+
+    def items(self) -> Iterator[tuple[str, V]]:
+        """
+        Yields every (key, value) pair in the hash table.
+        The table must not be changed while the iteration is in progress.
+
+        complexity: O(N + S) for the whole iteration, O(1) extra space.
+        """
+        states, keys, values = self.__states, self.__keys, self.__values
+        for x in range(len(states)):
+            if states[x] == LIVE:
+                yield keys[x], values[x]
+
+    def map_values(self, function: Callable[[V], V]) -> None:
+        """
+        Replaces every value with function(value), in place, in one walk over the slots.
+        No key is hashed or probed for, and the table does not grow or shrink.
+
+        complexity: O(N + S), plus the cost of the N calls to `function`.
+        """
+        states, values = self.__states, self.__values
+        for x in range(len(states)):
+            if states[x] == LIVE:
+                values[x] = function(values[x])
+
+    def fill_values(self, data: V) -> None:
+        """
+        Sets the value of every key to `data`, in place, in one walk over the slots.
+
+        complexity: O(N + S)
+        """
+        states, values = self.__states, self.__values
+        for x in range(len(states)):
+            if states[x] == LIVE:
+                values[x] = data
+
     def __contains__(self, key: str) -> bool:
         """
         Checks to see if the given key is in the Hash Table
@@ -101,8 +352,8 @@ class LazyDoubleTable(HashTable[str, V]):
         :complexity: See hashy probe.
         :raises KeyError: when the key doesn't exist.
         """
-        position = self.__hashy_probe(key, False)
-        return self.__array[position][1]
+        position = self.__hashy_probe(key, self.full_hash(key), False)
+        return self.__values[position]
     
     def is_empty(self) -> bool:
         return self.__length == 0
@@ -113,67 +364,77 @@ class LazyDoubleTable(HashTable[str, V]):
         order).
         """
         result = ""
-        for item in self.__array:
-            if item is not None:
-                (key, value) = item
-                result += "(" + str(key) + "," + str(value) + ")\n"
+        for x in range(self.table_size):
+            if self.__states[x] == LIVE:
+                result += "(" + str(self.__keys[x]) + "," + str(self.__values[x]) + ")\n"
         return result
 
-    def hash(self, key: str) -> int:
+    def full_hash(self, key: str) -> int:
         """
-        Hash a key for insert/retrieve/update into the hashtable.
+        Hash a key to a 61-bit value that does not depend on the table size.
+
+        Every slot keeps the full hash of its key, so a lookup can skip slots whose hash differs
+        without comparing the strings, and a rehash only has to reduce the stored hash modulo the
+        new table size instead of hashing every key again.
+
         :complexity: O(len(key))
         """
         value = 0
-        a = 31415
         for char in key:
-            value = (ord(char) + a * value) % self.table_size
-            a = a * self.HASH_BASE % (self.table_size - 1)
-        return value
+            value = (value * self.HASH_BASE + ord(char)) % self.HASH_MODULUS
+        return value * self.HASH_MIX % self.HASH_MODULUS
 
-    def hash2(self, key: str) -> int:
+    def hash(self, key: str) -> int:
+        """
+        Hash a key for insert/retrieve/update into the hashtable.
+        :complexity: O(len(key))
+        """
+        return self.full_hash(key) % self.table_size
+
+    def hash2(self, key: str, key_hash: int | None = None) -> int:
         """
         Used to determine the step size for our hash table.
 
+        The step is taken from the full hash of the whole key, using the bits above the ones that choose
+        the initial position. Keys that start at the same position, or with the same letter, therefore
+        still follow different probe sequences. Every step in [1, S - 1] is co-prime with a prime table
+        size S, so the probe sequence visits every slot; for custom sizes that are not prime, the step is
+        moved down to the nearest co-prime value.
+
+        Args:
+            key_hash (int): full_hash(key), when the caller has already computed it.
+
         Complexity:
-            Best Case Complexity: O(1)
-            Worst Case Complexity: O(S) , S refers to the Table Size.
+            Best Case Complexity: O(1), when key_hash is given.
+            Worst Case Complexity: O(len(key)), when the full hash has to be computed.
 
         Justification:
 
         Best Case:
-        The best case complexity of O(1) occurs initially when the step size chosen is Co-Prime wth the table size
-        and so the loop exits after one iteration and the step size is returned.
+        Picking the step is a division, a modulo and one gcd on fixed-width integers. For the default prime
+        table sizes the gcd is always 1, so no further steps are tried.
 
         Worst Case:
-
-        The worst case complexity of O(s) occurs when the step values divide the table size, requiring the hash function
-        to iterate through all the values < table size before 1 is returned.
-
+        Without key_hash, the key is hashed first, which takes O(len(key)). Custom sizes that are not prime can
+        need a few more gcd checks, but the gap to the nearest co-prime step is small and does not grow with S.
         """
-        # A prime number is choosen to generate a step size that's co-prime with table size and varies for each key 
-        # This reduces collision and evenly distributes the keys- proving to be a good conflict resolution strategy.
-        
-        PRIME_NUM =  17
-        # The function produces a step size based on the first character in the key.
-        step = PRIME_NUM - (ord(key[0]) % PRIME_NUM)
+        size = self.table_size
+        if size <= 2:
+            return 1
+        if key_hash is None:
+            key_hash = self.full_hash(key)
 
-        #Do not let the step size equal zero as this defies the purpose of the hash function.
-        if step == 0:
-            step = 1
+        step = 1 + (key_hash // size) % (size - 1)
 
         #this is done to ensure that the step size is co-prime with the table's size.
-        for _ in range(step, self.table_size):
+        while math.gcd(step, size) != 1:
+            step -= 1
+        return step
 
-            if self.table_size % step != 0:
-                return step
-        
-        # one is returned when all of the step sizes are invalid.   
-        return 1 
-
-    def __hashy_probe(self, key: str, is_insert: bool) -> int:
+    def __hashy_probe(self, key: str, key_hash: int, is_insert: bool) -> int:
         """
         Find the correct position for this key in the hash table using hashy probing.
+        `key_hash` is full_hash(key); slots holding a different hash are passed over without comparing keys.
 
         Raises:
             KeyError: When the key is not in the table, but is_insert is False.
@@ -192,34 +453,50 @@ class LazyDoubleTable(HashTable[str, V]):
 
             Worst Case:
 
-            The worst case occurs when the table is nearly full or has too many SENTINELS, and s probes have to be made 
-            to find an available position for the key or a matching key. However, SENTINELS allow insertions of keys into 
+            The worst case occurs when the table is nearly full or has too many DELETED slots, and s probes have to be made 
+            to find an available position for the key or a matching key. However, DELETED slots allow insertions of keys into 
             the table, they still increase probing as they are ignored during lookup of the key. 
             This causes the worst case time complexity to be O(s), s refers to the table size.
 
+            An insert keeps probing past the first DELETED slot until it reaches an empty slot, since the key may
+            still be stored further along the probe sequence, and then reuses that first DELETED slot.
         """
         # Initial position
-        position = self.hash(key)
-        step = self.hash2(key)
+        size = self.table_size
+        position = key_hash % size
+        step = self.hash2(key, key_hash)
+        states, hashes, keys = self.__states, self.__hashes, self.__keys
+
+        statistics = self.statistics
+        first_deleted = None
 
-        for _ in range(self.table_size):
+        for probes in range(1, size + 1):
+            state = states[position]
             
             #When the position is empty- the key is not already present in table.
-            if self.__array[position] is None:
+            if state == EMPTY:
+                if statistics is not None:
+                    statistics.record_miss(probes)
                 if is_insert:
-                    return position
+                    return position if first_deleted is None else first_deleted
                 raise KeyError(key)
             
-            #Position contains SENTINEL so it can be reused to insert a key.
-            elif self.__array[position] == SENTINEL:
-                if is_insert:
-                    return position
+            #Position was deleted so it can be reused to insert a key, if the key turns out to be missing.
+            elif state == DELETED:
+                if is_insert and first_deleted is None:
+                    first_deleted = position
             #The key-value pair already exists so the key is found- and either updated or read.  
-            elif self.__array[position][0] == key:
+            elif hashes[position] == key_hash and keys[position] == key:
+                if statistics is not None:
+                    statistics.record_hit(probes)
                 return position
             
-            position = (position + step) % self.table_size
+            position = (position + step) % size
         
+        if statistics is not None:
+            statistics.record_miss(size)
+        if is_insert and first_deleted is not None:
+            return first_deleted
         if is_insert:
             raise RuntimeError("Table is full")
         raise KeyError(key)
@@ -244,19 +521,25 @@ class LazyDoubleTable(HashTable[str, V]):
         Worst Case:
 
         The worst case complexity occurs when the hash table has to be rehashed as it exceeds the
-        2/3 of its capacity or when the table is full and a RunTime Error is called. So, all the 
+        LOAD_THRESHOLD (2/3) of its capacity or when the table is full and a RunTime Error is called. So, all the 
         N items in the table have to be rehashed and reinserted into a table with a larger capacity,
         this takes upto O(S) time in worst case due to excessive probing.
 
         Therefore, the worst case complexity is O(N * S).
 
         """
-        #We rehash the table if adding the key is about exceed 2/3 capacity of the table.
-        if (self.__length + 1) > (2 * self.table_size) //3:
+        #We rehash the table if adding the key is about exceed LOAD_THRESHOLD capacity of the table.
+        capacity = self.__capacity(self.table_size)
+        if (self.__length + 1) > capacity:
             self.__rehash()
+
+        #If it is DELETED slots that fill the table up instead, it is rebuilt at the same size to clear them.
+        elif (self.__length + self.__tombstones + 1) > capacity:
+            self.__resize(self.__size_index)
         
+        key_hash = self.full_hash(key)
         try:
-            position = self.__hashy_probe(key, True)
+            position = self.__hashy_probe(key, key_hash, True)
         
         #this handles the case when the hash table is full
         except RuntimeError:
@@ -264,20 +547,32 @@ class LazyDoubleTable(HashTable[str, V]):
             self.__setitem__(key,data)
             return
         #this is done to check if a new key is being added to the table. 
-        if self.__array[position] is None or self.__array[position] == SENTINEL:
-            self.__length += 1 
-        
-        #saves the key and value in the hashy table.
-        self.__array[position] = (key, data)
+        state = self.__states[position]
+        if state != LIVE:
+            self.__length += 1
+            if state == DELETED:
+                self.__tombstones -= 1
+
+            #saves the key and the key's full hash in the hashy table.
+            self.__states[position] = LIVE
+            self.__keys[position] = key
+            self.__hashes[position] = key_hash
+
+        #the value is written in place, also when an existing key is updated.
+        self.__values[position] = data
         
 
     def __delitem__(self, key: str) -> None:
         """
         Deletes a (key, value) pair in our hash table.
 
+        Once DELETED slots take up TOMBSTONE_LIMIT of the slots the table is rebuilt without them, and once
+        fewer than SHRINK_LOAD of the slots are live it is moved to a smaller size, so probe lengths and
+        memory follow the number of live entries rather than the most the table ever held.
+
         Complexity:
             Best Case Complexity: O(1)
-            Worst Case Complexity: O(S), s refers to the table size
+            Worst Case Complexity: O(N * S), N is the number of items and S the table size.
 
             Justification:
 
@@ -286,52 +581,95 @@ class LazyDoubleTable(HashTable[str, V]):
             spot probed, which requires only one operation and a constant-time deletion.
 
             Worst Case:
-            The worst case complexity is O(1) when the key is found after we probe through most of the table, due to 
-            clustering, and this requires up to s probes to locate and delete the key, which results in a worst case complexity of O(S).
+            The worst case occurs when the key is found after we probe through most of the table, due to
+            clustering, and the deletion then triggers a rebuild, see __resize. A rebuild clears at least
+            TOMBSTONE_LIMIT * S DELETED slots or halves the table, so over a sequence of deletions it costs O(1)
+            amortised per deletion.
         """
-        index_todelete = self.__hashy_probe(key, False)
+        index_todelete = self.__hashy_probe(key, self.full_hash(key), False)
 
-        self.__array[index_todelete] = SENTINEL
+        #the key and value are released, so the table does not keep them alive.
+        self.__states[index_todelete] = DELETED
+        self.__keys[index_todelete] = None
+        self.__values[index_todelete] = None
         self.__length-=1
+        self.__tombstones += 1
+
+        #this chooses the smallest table size that keeps the live entries at no more than half the load threshold.
+        #when no smaller size is that roomy (e.g. a sparse custom `sizes`), the table keeps its size.
+        if self.__length < self.table_size * self.SHRINK_LOAD and self.__size_index > 0:
+            size_index = self.__size_index
+            while size_index > 0 and self.__length <= self.__size_at(size_index - 1) * self.LOAD_THRESHOLD / 2:
+                size_index -= 1
+            if size_index < self.__size_index:
+                self.__resize(size_index)
+                return
+
+        if self.__tombstones > self.table_size * self.TOMBSTONE_LIMIT:
+            self.__resize(self.__size_index)
 
     def __rehash(self) -> None:
         """
         Need to resize table and reinsert all values
 
+        Complexity: See __resize.
+        """
+        #this chooses the next table size in the predefined hash table sizes.
+        self.__resize(self.__size_index + 1)
+
+    def __resize(self, size_index: int) -> None:
+        """
+        Moves every live entry into a new table of size __size_at(size_index), dropping all DELETED slots.
+        The index may be the current one, to clear DELETED slots, or a smaller one, to shrink the table.
+
         Complexity:
-            Best Case Complexity: O(N * S)
+            Best Case Complexity: O(S)
             Worst Case Complexity: O(N * S)
 
             N is the number of items in the table.
-            S is the table size.
+            S is the larger of the old and new table sizes.
 
             Justification:
 
-            Both the best and worst case complexities are O(N * S), as the rehash function starts off by creating a new table of size, S.
-            Then, all of the N key-value items in the old table are inserted into the new table which takes N operations using double hashing.
-            The reinsertion could also take up to S probes into the table, resulting in a O(S).
+            Best Case:
+            Each slot keeps its key's full hash, so a live entry is moved by reducing that hash modulo the new size
+            and copying its key, value and hash to the first empty position of its probe sequence. No key is hashed
+            again and the load factor is not checked again, as the new table is known to fit every entry. When every
+            entry lands on its first probe, the cost is allocating the new table and walking the old one, O(S).
 
-            Therefore, taking all these operations into account the best and worst case complexity is O(N * S).
+            Worst Case:
+            The new table has no DELETED slots, but clustered entries may still need up to S probes each, O(N * S).
         """
-        curr_table = self.__array
+        started = time.perf_counter()
+        old_keys, old_values, old_hashes, old_states = self.__keys, self.__values, self.__hashes, self.__states
 
-        #this chooses the next table size in the predefined hash table sizes.
-        self.__size_index += 1
+        self.__size_index = size_index
 
-        #this gets the next table size.
-        updated_table_size = self.TABLE_SIZES[self.__size_index]
+        #this gets the new table size.
+        updated_table_size = self.__size_at(self.__size_index)
 
         #A new empty table is created using the new size,
-        self.__array = ArrayR(updated_table_size)
+        self.__allocate(updated_table_size)
         self.__length = 0
+        self.__tombstones = 0
+        keys, values, hashes, states = self.__keys, self.__values, self.__hashes, self.__states
 
-        #existing key-value pairs are re-inserted into the new table. This excludes empty positions and deleted pairs (SENTINELS).
-        for pair in curr_table:
-            
-            if pair is not None and pair!= SENTINEL:
+        #existing entries are moved into the new table. This excludes empty positions and deleted pairs.
+        for x, state in enumerate(old_states):
 
-                key, data = pair 
-                self[key] = data
+            if state == LIVE:
 
+                key_hash = old_hashes[x]
+                position = key_hash % updated_table_size
+                step = self.hash2(old_keys[x], key_hash)
+                while states[position] != EMPTY:
+                    position = (position + step) % updated_table_size
 
+                states[position] = LIVE
+                keys[position] = old_keys[x]
+                values[position] = old_values[x]
+                hashes[position] = key_hash
+                self.__length += 1
 
+        if self.statistics is not None:
+            self.statistics.record_rehash(time.perf_counter() - started)
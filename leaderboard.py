@@ -0,0 +1,323 @@
+from __future__ import annotations
+
+from typing import Iterator
+
+from data_structures.array_list import ArrayList
+from lazy_double_table import LazyDoubleTable
+from random_stream import RandomStream
+from team import Team
+
+
+class _Node:
+    """
+    A node of the skip list. width[level] is how many positions forward[level] jumps ahead.
+    """
+    __slots__ = ("key", "team", "forward", "width")
+
+    def __init__(self, key: tuple[int, str] | None, team: Team | None, level: int) -> None:
+        self.key = key
+        self.team = team
+        self.forward: list[_Node | None] = [None] * level
+        self.width: list[int] = [1] * level
+
+
+class Leaderboard:
+    """
+    The teams of a season ordered like Team.__lt__: most points first, ties broken by name.
+
+    Teams are held in an indexed skip list, so moving a team after a result, finding a team's rank
+    and reading the team at a rank are all O(log N) expected, instead of the O(N) element shifting
+    of ArraySortedList. Each node remembers the points it was sorted by, so a team can be found again
+    after its points changed; call update(team) after changing a team's points.
+
+    In deferred mode update() only marks the leaderboard as stale, and the order is rebuilt once,
+    by flush() or by the next read. This suits simulations that only look at the table between weeks.
+    """
+
+    MAX_LEVEL = 32
+
+    def __init__(self, deferred: bool = False) -> None:
+        """
+        Args:
+            deferred (bool): Re-sort lazily on flush() instead of on every update().
+
+        No complexity analysis is required for this function.
+        """
+        self.deferred = deferred
+        self.__head = _Node(None, None, self.MAX_LEVEL)
+        self.__height = 1
+        self.__length = 0
+        self.__nodes: LazyDoubleTable[_Node] = LazyDoubleTable()
+        self.__stale = False
+        # The shape of the skip list never affects the order, this just keeps it reproducible.
+        self.__levels = RandomStream(0)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of teams on the leaderboard.
+
+        Complexity: O(1)
+        """
+        return self.__length
+
+    def is_empty(self) -> bool:
+        return self.__length == 0
+
+    def __contains__(self, team: Team) -> bool:
+        """
+        Checks whether `team` is on the leaderboard.
+
+        Complexity: See LazyDoubleTable.__contains__.
+        """
+        return team.name in self.__nodes
+
+    def add(self, team: Team) -> None:
+        """
+        Adds `team` at the position given by its current points.
+
+        Raises:
+            ValueError: When a team with the same name is already on the leaderboard.
+
+        Complexity:
+            Best Case Complexity: O(log N) expected
+            Worst Case Complexity: O(N), when the random levels degenerate into a plain linked list.
+        """
+        if team.name in self.__nodes:
+            raise ValueError("Team is already on the leaderboard")
+        self.__insert(team)
+
+    def remove(self, team: Team) -> None:
+        """
+        Removes `team` from the leaderboard.
+
+        Raises:
+            ValueError: When the team is not on the leaderboard.
+
+        Complexity: See add.
+        """
+        if team.name not in self.__nodes:
+            raise ValueError("Team is not on the leaderboard")
+        node = self.__nodes[team.name]
+        self.__unlink(node.key)
+        del self.__nodes[team.name]
+
+    def update(self, team: Team) -> None:
+        """
+        Moves `team` to the position given by its current points, adding it if it is missing.
+        In deferred mode the move is postponed until the next flush() or read.
+
+        Complexity: See add. O(1) in deferred mode, plus the table lookup.
+        """
+        if self.deferred and team.name in self.__nodes:
+            self.__stale = True
+            return
+        if team.name in self.__nodes:
+            node = self.__nodes[team.name]
+            if node.key == (-team.points, team.name):
+                return
+            self.__unlink(node.key)
+        self.__insert(team)
+
+    def flush(self) -> None:
+        """
+        Re-sorts the whole leaderboard by the teams' current points, if any update was deferred.
+
+        Complexity:
+            Best Case Complexity: O(1), when nothing changed since the last flush.
+            Worst Case Complexity: O(N log N)
+        """
+        if not self.__stale:
+            return
+        self.__stale = False
+
+        teams = [node.team for node in self.__walk()]
+        teams.sort(key=lambda team: (-team.points, team.name))
+
+        self.__head = _Node(None, None, self.MAX_LEVEL)
+        self.__height = 1
+        self.__length = 0
+        for team in teams:
+            self.__insert(team)
+
+    def index(self, team: Team) -> int:
+        """
+        Returns the 0-based rank of `team`.
+
+        Raises:
+            ValueError: When the team is not on the leaderboard.
+
+        Complexity: See add.
+        """
+        self.flush()
+        if team.name not in self.__nodes:
+            raise ValueError("Team is not on the leaderboard")
+        return self.__rank(self.__nodes[team.name].key)
+
+    def rank(self, team: Team) -> int:
+        """
+        Returns the 1-based league position of `team`.
+
+        Complexity: See index.
+        """
+        return self.index(team) + 1
+
+    def __getitem__(self, index: int) -> Team:
+        """
+        Returns the team at 0-based rank `index`. Negative indices count from the bottom.
+
+        Complexity: See add.
+        """
+        self.flush()
+        if index < 0:
+            index += self.__length
+        if not 0 <= index < self.__length:
+            raise IndexError("Leaderboard index out of range")
+
+        node = self.__head
+        remaining = index + 1
+        for level in range(self.__height - 1, -1, -1):
+            while node.forward[level] is not None and node.width[level] <= remaining:
+                remaining -= node.width[level]
+                node = node.forward[level]
+        return node.team
+
+    def delete_at_index(self, index: int) -> Team:
+        """
+        Removes and returns the team at 0-based rank `index`.
+
+        Complexity: See add.
+        """
+        team = self[index]
+        self.remove(team)
+        return team
+
+    def top(self, k: int) -> ArrayList[Team]:
+        """
+        Returns the best `k` teams in order (all of them if there are fewer).
+
+        Complexity:
+            Best Case Complexity: O(k)
+            Worst Case Complexity: O(k)
+        """
+        self.flush()
+        teams = ArrayList()
+        for node in self.__walk():
+            if len(teams) >= k:
+                break
+            teams.append(node.team)
+        return teams
+
+    def __iter__(self) -> Iterator[Team]:
+        """
+        Iterates over the teams from first to last place.
+
+        Complexity: O(N) for the whole iteration.
+        """
+        self.flush()
+        for node in self.__walk():
+            yield node.team
+
+    def __walk(self) -> Iterator[_Node]:
+        """
+        Yields the nodes along the bottom level, in their current order.
+        """
+        node = self.__head.forward[0]
+        while node is not None:
+            yield node
+            node = node.forward[0]
+
+    def __random_level(self) -> int:
+        """
+        Draws a node height with P(level > h) = 2^-h.
+
+        Complexity: O(1)
+        """
+        bits = self.__levels.next_int() | (1 << (self.MAX_LEVEL - 1))
+        return ((bits & -bits).bit_length())
+
+    def __rank(self, key: tuple[int, str]) -> int:
+        """
+        Returns how many nodes sort before `key`.
+
+        Complexity: O(log N) expected.
+        """
+        node = self.__head
+        position = 0
+        for level in range(self.__height - 1, -1, -1):
+            while node.forward[level] is not None and node.forward[level].key < key:
+                position += node.width[level]
+                node = node.forward[level]
+        return position
+
+    def __insert(self, team: Team) -> None:
+        """
+        Links a new node for `team`, keyed by its current points, and records it by name.
+
+        Complexity: O(log N) expected.
+        """
+        key = (-team.points, team.name)
+        level = self.__random_level()
+        head = self.__head
+        if level > self.__height:
+            for new_level in range(self.__height, level):
+                head.forward[new_level] = None
+                head.width[new_level] = self.__length + 1
+            self.__height = level
+
+        chain: list[_Node] = [head] * self.__height
+        steps_at_level = [0] * self.__height
+        node = head
+        for current in range(self.__height - 1, -1, -1):
+            while node.forward[current] is not None and node.forward[current].key < key:
+                steps_at_level[current] += node.width[current]
+                node = node.forward[current]
+            chain[current] = node
+
+        new_node = _Node(key, team, level)
+        steps = 0
+        for current in range(level):
+            previous = chain[current]
+            new_node.forward[current] = previous.forward[current]
+            previous.forward[current] = new_node
+            new_node.width[current] = previous.width[current] - steps
+            previous.width[current] = steps + 1
+            steps += steps_at_level[current]
+        for current in range(level, self.__height):
+            chain[current].width[current] += 1
+
+        self.__length += 1
+        self.__nodes[team.name] = new_node
+
+    def __unlink(self, key: tuple[int, str]) -> None:
+        """
+        Unlinks the node stored under `key`. The caller keeps the name table up to date.
+
+        Complexity: O(log N) expected.
+        """
+        chain: list[_Node] = [self.__head] * self.__height
+        node = self.__head
+        for current in range(self.__height - 1, -1, -1):
+            while node.forward[current] is not None and node.forward[current].key < key:
+                node = node.forward[current]
+            chain[current] = node
+
+        target = chain[0].forward[0]
+        for current in range(len(target.forward)):
+            previous = chain[current]
+            previous.width[current] += target.width[current] - 1
+            previous.forward[current] = target.forward[current]
+        for current in range(len(target.forward), self.__height):
+            chain[current].width[current] -= 1
+
+        self.__length -= 1
+
+    def __str__(self) -> str:
+        """
+        Returns the leaderboard as one "position. team (points)" line per team.
+
+        Complexity analysis not required.
+        """
+        return "\n".join(f"{position}. {team.name} ({team.points})" for position, team in enumerate(self, 1))
+
+    def __repr__(self) -> str:
+        return str(self)
@@ -0,0 +1,400 @@
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from typing import Iterable, Iterator, Mapping
+
+from lazy_double_table import LazyDoubleTable, EMPTY, LIVE, DELETED, next_prime
+
+
+class MappedDoubleTable:
+    """
+    A LazyDoubleTable of str keys and int values kept in a memory-mapped file instead of Python objects.
+
+    It uses the same full hash, probe step, load threshold and lazy deletion as LazyDoubleTable, but
+    every slot is a fixed-width record in the file:
+
+        state (1 byte) | key length (2 bytes) | full hash (8 bytes) | value (8 bytes) | key (KEY_WIDTH bytes)
+
+    after a header holding the key width, table size, number of entries and number of deleted slots.
+    Opening a table only maps the file, so any number of processes can open the same file read-only
+    and share its pages through the OS page cache, without rebuilding or copying anything. Values
+    are 64-bit signed integers and keys at most key_width bytes of UTF-8.
+
+    A writable table grows by writing the entries into a new, larger file next to it, replacing the
+    original with it and mapping the new file. Read-only tables opened before that keep the mapping
+    of the old file, which stays a consistent snapshot until they are closed and opened again.
+    """
+
+    MAGIC = b"MAPPEDDT"
+    VERSION = 1
+    HEADER = struct.Struct("<8sIIQQQ")
+    SLOT = struct.Struct("<BHqq")
+    KEY_WIDTH = 64
+
+    TABLE_SIZES = LazyDoubleTable.TABLE_SIZES
+    HASH_BASE = LazyDoubleTable.HASH_BASE
+    HASH_MODULUS = LazyDoubleTable.HASH_MODULUS
+    HASH_MIX = LazyDoubleTable.HASH_MIX
+    LOAD_THRESHOLD = LazyDoubleTable.LOAD_THRESHOLD
+    GROWTH_FACTOR = LazyDoubleTable.GROWTH_FACTOR
+
+    full_hash = LazyDoubleTable.full_hash
+    hash2 = LazyDoubleTable.hash2
+
+    def __init__(self, path: str, writable: bool = False) -> None:
+        """
+        Maps an existing table file. Use create() to make a new one.
+
+        Raises:
+            ValueError: When the file is not a table of this version.
+
+        No complexity analysis is required for this function.
+        """
+        self.path = path
+        self.writable = writable
+        self.__map()
+
+    @classmethod
+    def create(cls, path: str, key_width: int | None = None, size_hint: int = 0) -> MappedDoubleTable:
+        """
+        Creates an empty table file at `path`, replacing any file there, and opens it for writing.
+        The table starts large enough for `size_hint` entries.
+
+        Complexity: O(S), S is the initial table size, to write the empty slots.
+        """
+        key_width = cls.KEY_WIDTH if key_width is None else key_width
+        size = cls.TABLE_SIZES[0]
+        while size_hint > int(size * cls.LOAD_THRESHOLD):
+            size = cls.__next_size(size)
+        cls.__write_empty(path, key_width, size)
+        return cls(path, writable=True)
+
+    @classmethod
+    def from_items(cls, path: str, items: Iterable[tuple[str, int]] | Mapping[str, int],
+                   key_width: int | None = None) -> MappedDoubleTable:
+        """
+        Creates a table file at `path` holding `items`, sized once for all of them.
+
+        Complexity: O(M + S) when every item lands on its first probe, M is the number of items.
+        """
+        if hasattr(items, "items"):
+            items = items.items()
+        if not hasattr(items, "__len__"):
+            items = list(items)
+        table = cls.create(path, key_width, len(items))
+        for key, data in items:
+            table[key] = data
+        return table
+
+    @classmethod
+    def __next_size(cls, size: int) -> int:
+        """
+        Returns the table size after `size`, as LazyDoubleTable grows.
+
+        Complexity: O(log S) primality checks past the end of TABLE_SIZES.
+        """
+        for table_size in cls.TABLE_SIZES:
+            if table_size > size:
+                return table_size
+        return next_prime(int(size * cls.GROWTH_FACTOR) + 1)
+
+    @classmethod
+    def __write_empty(cls, path: str, key_width: int, size: int) -> None:
+        """
+        Writes a header and `size` empty slots to `path`.
+
+        Complexity: O(S)
+        """
+        with open(path, "wb") as file:
+            file.write(cls.HEADER.pack(cls.MAGIC, cls.VERSION, key_width, size, 0, 0))
+            file.truncate(cls.HEADER.size + size * (cls.SLOT.size + key_width))
+
+    def __map(self) -> None:
+        """
+        Maps the file at `path` and reads its header.
+
+        Complexity: O(1)
+        """
+        self.__file = open(self.path, "r+b" if self.writable else "rb")
+        self.__mm = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_WRITE if self.writable else mmap.ACCESS_READ)
+        magic, version, self.__key_width, self.__size, _, _ = self.HEADER.unpack_from(self.__mm, 0)
+        if magic != self.MAGIC or version != self.VERSION:
+            self.close()
+            raise ValueError(f"{self.path} is not a mapped table of version {self.VERSION}")
+        self.__slot_size = self.SLOT.size + self.__key_width
+
+    def close(self) -> None:
+        """
+        Flushes a writable table and unmaps the file.
+
+        Complexity: O(1), plus writing back dirty pages.
+        """
+        if self.writable:
+            self.__mm.flush()
+        self.__mm.close()
+        self.__file.close()
+
+    def flush(self) -> None:
+        """
+        Writes changes made through a writable table back to the file.
+        """
+        self.__mm.flush()
+
+    def __enter__(self) -> MappedDoubleTable:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def table_size(self) -> int:
+        return self.__size
+
+    @property
+    def key_width(self) -> int:
+        return self.__key_width
+
+    @property
+    def tombstones(self) -> int:
+        """
+        Returns the number of slots marked DELETED by a deletion and not reused since.
+        """
+        return self.HEADER.unpack_from(self.__mm, 0)[5]
+
+    def __len__(self) -> int:
+        """
+        Returns the number of entries, read from the header.
+
+        Complexity: O(1)
+        """
+        return self.HEADER.unpack_from(self.__mm, 0)[4]
+
+    def is_empty(self) -> bool:
+        return len(self) == 0
+
+    def __set_counts(self, length: int, tombstones: int) -> None:
+        """
+        Stores the number of entries and deleted slots in the header.
+
+        Complexity: O(1)
+        """
+        self.HEADER.pack_into(self.__mm, 0, self.MAGIC, self.VERSION, self.__key_width, self.__size, length, tombstones)
+
+    def hash(self, key: str) -> int:
+        """
+        Hash a key to its first slot, as LazyDoubleTable.hash does.
+
+        :complexity: O(len(key))
+        """
+        return self.full_hash(key) % self.__size
+
+    def __offset(self, position: int) -> int:
+        return self.HEADER.size + position * self.__slot_size
+
+    def __hashy_probe(self, key: bytes, key_hash: int, is_insert: bool) -> int:
+        """
+        Finds the slot of `key`, or where it would be inserted, with LazyDoubleTable's probe sequence.
+
+        Raises:
+            KeyError: When the key is not in the table, but is_insert is False.
+            RuntimeError: When a table is full and cannot be inserted.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(S), S refers to the table size.
+        """
+        size, mm, slot = self.__size, self.__mm, self.SLOT
+        position = key_hash % size
+        step = self.hash2(None, key_hash)
+        first_deleted = None
+
+        for _ in range(size):
+            offset = self.__offset(position)
+            state, key_length, slot_hash, _ = slot.unpack_from(mm, offset)
+            if state == EMPTY:
+                if is_insert:
+                    return position if first_deleted is None else first_deleted
+                raise KeyError(key.decode("utf-8"))
+            elif state == DELETED:
+                if is_insert and first_deleted is None:
+                    first_deleted = position
+            elif slot_hash == key_hash and mm[offset + slot.size:offset + slot.size + key_length] == key:
+                return position
+            position = (position + step) % size
+
+        if is_insert and first_deleted is not None:
+            return first_deleted
+        if is_insert:
+            raise RuntimeError("Table is full")
+        raise KeyError(key.decode("utf-8"))
+
+    def __getitem__(self, key: str) -> int:
+        """
+        Get the value at a certain key
+
+        :complexity: See __hashy_probe.
+        :raises KeyError: when the key doesn't exist.
+        """
+        position = self.__hashy_probe(key.encode("utf-8"), self.full_hash(key), False)
+        return self.SLOT.unpack_from(self.__mm, self.__offset(position))[3]
+
+    def __contains__(self, key: str) -> bool:
+        """
+        Checks to see if the given key is in the table
+
+        :complexity: See __getitem__.
+        """
+        try:
+            _ = self[key]
+        except KeyError:
+            return False
+        return True
+
+    def __setitem__(self, key: str, data: int) -> None:
+        """
+        Set a (key, value) pair in the table, growing it first when needed.
+
+        Raises:
+            OSError: When the table was opened read-only.
+            ValueError: When the key is longer than key_width bytes once encoded.
+            TypeError: When the value is not an int.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(N * S), when the table has to grow, see __resize.
+        """
+        if not self.writable:
+            raise OSError("Table is opened read-only")
+        if not isinstance(data, int):
+            raise TypeError("Mapped tables only hold int values")
+        encoded = key.encode("utf-8")
+        if len(encoded) > self.__key_width:
+            raise ValueError(f"Key is longer than {self.__key_width} bytes")
+
+        _, _, _, _, length, tombstones = self.HEADER.unpack_from(self.__mm, 0)
+        capacity = int(self.__size * self.LOAD_THRESHOLD)
+        if length + 1 > capacity:
+            self.__resize(self.__next_size(self.__size))
+        elif length + tombstones + 1 > capacity:
+            self.__resize(self.__size)
+        length, tombstones = len(self), self.tombstones
+
+        key_hash = self.full_hash(key)
+        position = self.__hashy_probe(encoded, key_hash, True)
+        offset = self.__offset(position)
+        state = self.__mm[offset]
+        if state == LIVE:
+            self.SLOT.pack_into(self.__mm, offset, LIVE, len(encoded), key_hash, data)
+            return
+
+        self.SLOT.pack_into(self.__mm, offset, LIVE, len(encoded), key_hash, data)
+        self.__mm[offset + self.SLOT.size:offset + self.SLOT.size + len(encoded)] = encoded
+        self.__set_counts(length + 1, tombstones - (state == DELETED))
+
+    def __delitem__(self, key: str) -> None:
+        """
+        Deletes a (key, value) pair by marking its slot DELETED.
+
+        Complexity: See __hashy_probe.
+        """
+        if not self.writable:
+            raise OSError("Table is opened read-only")
+        position = self.__hashy_probe(key.encode("utf-8"), self.full_hash(key), False)
+        self.__mm[self.__offset(position)] = DELETED
+        self.__set_counts(len(self) - 1, self.tombstones + 1)
+
+    def __live_slots(self, size: int | None = None) -> Iterator[int]:
+        """
+        Yields the offset of every LIVE slot of the current mapping, which has `size` slots
+        (table_size unless given; __resize passes the old size).
+
+        Complexity: O(S) for the whole iteration.
+        """
+        slot_size, mm = self.__slot_size, self.__mm
+        for position in range(self.__size if size is None else size):
+            offset = self.HEADER.size + position * slot_size
+            if mm[offset] == LIVE:
+                yield offset
+
+    def iter_keys(self) -> Iterator[str]:
+        """
+        Yields every key in the table.
+
+        complexity: O(N + S) for the whole iteration.
+        """
+        for offset in self.__live_slots():
+            key_length = self.SLOT.unpack_from(self.__mm, offset)[1]
+            yield self.__mm[offset + self.SLOT.size:offset + self.SLOT.size + key_length].decode("utf-8")
+
+    def iter_values(self) -> Iterator[int]:
+        """
+        Yields every value in the table.
+
+        complexity: O(N + S) for the whole iteration.
+        """
+        for offset in self.__live_slots():
+            yield self.SLOT.unpack_from(self.__mm, offset)[3]
+
+    def items(self) -> Iterator[tuple[str, int]]:
+        """
+        Yields every (key, value) pair in the table.
+
+        complexity: O(N + S) for the whole iteration.
+        """
+        for offset in self.__live_slots():
+            _, key_length, _, data = self.SLOT.unpack_from(self.__mm, offset)
+            yield self.__mm[offset + self.SLOT.size:offset + self.SLOT.size + key_length].decode("utf-8"), data
+
+    def keys(self) -> list[str]:
+        """
+        Returns all keys in the table.
+
+        complexity: O(N + S)
+        """
+        return list(self.iter_keys())
+
+    def values(self) -> list[int]:
+        """
+        Returns all values in the table.
+
+        complexity: O(N + S)
+        """
+        return list(self.iter_values())
+
+    def __resize(self, size: int) -> None:
+        """
+        Writes every live slot into a new file of `size` slots, using the stored hashes, replaces the
+        table's file with it and maps the new file.
+
+        Complexity:
+            Best Case Complexity: O(S)
+            Worst Case Complexity: O(N * S)
+        """
+        new_path = self.path + ".resize"
+        self.__write_empty(new_path, self.__key_width, size)
+        length = 0
+        with open(new_path, "r+b") as file, mmap.mmap(file.fileno(), 0) as new_mm:
+            self.__size, old_size = size, self.__size
+            for offset in self.__live_slots(old_size):
+                key_hash = self.SLOT.unpack_from(self.__mm, offset)[2]
+                position = key_hash % size
+                step = self.hash2(None, key_hash)
+                while new_mm[self.__offset(position)] != EMPTY:
+                    position = (position + step) % size
+                new_offset = self.__offset(position)
+                new_mm[new_offset:new_offset + self.__slot_size] = self.__mm[offset:offset + self.__slot_size]
+                length += 1
+            self.HEADER.pack_into(new_mm, 0, self.MAGIC, self.VERSION, self.__key_width, size, length, 0)
+            new_mm.flush()
+
+        self.close()
+        os.replace(new_path, self.path)
+        self.__map()
+
+    def __str__(self) -> str:
+        """
+        Returns all they key/value pairs in the table (no particular order).
+        """
+        return "".join(f"({key},{value})\n" for key, value in self.items())
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+
+class PhaseProfiler:
+    """
+    Accumulates wall time and call counts per phase of a season simulation, both in total and per week.
+
+    Season records into it when profiling is enabled (see Season.enable_profiling). Each phase is
+    timed once per week around all of that week's games, so the cost is a couple of clock reads
+    per phase per week, regardless of how many games the week has.
+    """
+
+    SIMULATE = "simulate"
+    ADD_RESULT = "add_result"
+    LEADERBOARD = "leaderboard"
+    GOAL_SCORERS = "goal_scorers"
+    PHASES = (SIMULATE, ADD_RESULT, LEADERBOARD, GOAL_SCORERS)
+
+    def __init__(self) -> None:
+        """
+        No complexity analysis is required for this function.
+        """
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Forgets everything recorded so far.
+
+        Complexity: O(1)
+        """
+        self.__totals: dict[str, list] = {phase: [0.0, 0] for phase in self.PHASES}
+        self.__weeks: dict[int, dict[str, list]] = {}
+
+    def record(self, phase: str, week: int, seconds: float, calls: int = 1) -> None:
+        """
+        Adds `seconds` spent in `calls` calls of `phase` during week number `week`.
+
+        Complexity: O(1)
+        """
+        total = self.__totals.setdefault(phase, [0.0, 0])
+        total[0] += seconds
+        total[1] += calls
+
+        week_phases = self.__weeks.setdefault(week, {})
+        week_total = week_phases.setdefault(phase, [0.0, 0])
+        week_total[0] += seconds
+        week_total[1] += calls
+
+    def total_seconds(self) -> float:
+        """
+        Returns the time recorded over all phases.
+
+        Complexity: O(1), as there is a fixed number of phases.
+        """
+        return sum(seconds for seconds, _ in self.__totals.values())
+
+    def report(self) -> dict:
+        """
+        Returns the recorded numbers as plain data:
+
+            {"total_seconds": float,
+             "phases": {phase: {"seconds": float, "calls": int, "share": float}},
+             "weeks": {week: {phase: {"seconds": float, "calls": int}}}}
+
+        where share is the phase's fraction of the total time.
+
+        Complexity: O(W), W is the number of weeks recorded.
+        """
+        total = self.total_seconds()
+        return {
+            "total_seconds": total,
+            "phases": {
+                phase: {"seconds": seconds, "calls": calls, "share": seconds / total if total else 0.0}
+                for phase, (seconds, calls) in self.__totals.items()
+            },
+            "weeks": {
+                week: {phase: {"seconds": seconds, "calls": calls} for phase, (seconds, calls) in phases.items()}
+                for week, phases in sorted(self.__weeks.items())
+            },
+        }
+
+    def __str__(self) -> str:
+        """
+        Returns one line per phase with its total time, calls and share of the total.
+
+        Complexity analysis not required.
+        """
+        report = self.report()
+        lines = [f"{'phase':<14}{'seconds':>12}{'calls':>10}{'share':>8}"]
+        for phase, numbers in report["phases"].items():
+            lines.append(f"{phase:<14}{numbers['seconds']:>12.6f}{numbers['calls']:>10}{numbers['share']:>8.1%}")
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        return str(self)
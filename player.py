@@ -1,7 +1,8 @@
 from __future__ import annotations
 from enums import PlayerPosition
 from data_structures import ArrayList
-from lazy_double_table import LazyDoubleTable
+from stat_schema import PlayerStats, StatSchema
+from typing import Iterable, Mapping
 
 # Do not change the import statement below
 # If you need more modules and classes from datetime, do not use
@@ -11,8 +12,14 @@ import datetime
 
 
 class Player:
-
-    def __init__(self, name: str, position: PlayerPosition, age: int) -> None:
+    # The storage behind a player's stats. PlayerStats keeps them as a row of the player's schema, which
+    # the player's Team, or the Season the team plays in, shares with the rest of the league (see
+    # use_schema). Any HashTable[str, int] with LazyDoubleTable's bulk API (from_items, update,
+    # fill_values, items) can be used instead, e.g. LazyDoubleTable or RobinHoodTable, giving every player
+    # a private table.
+    STATS_TABLE = PlayerStats
+
+    def __init__(self, name: str, position: PlayerPosition, age: int, schema: StatSchema | None = None) -> None:
         """
         Constructor for the Player class
 
@@ -20,6 +27,8 @@ class Player:
             name (str): The name of the player
             position (PlayerPosition): The position of the player
             age (int): The age of the player
+            schema (StatSchema): The stat columns shared with the rest of the league. By default the player gets a
+                schema of its own until it joins a team, see use_schema.
 
         Complexity:
             Best Case Complexity: O(1)
@@ -36,7 +45,50 @@ class Player:
         self.age_current = datetime.datetime.now().year - age 
         self.goals = 0
 
-        self.stats = LazyDoubleTable()
+        self.schema = schema if schema is not None else StatSchema()
+        self.stats = self.__new_stats(())
+
+    def __new_stats(self, stats: Iterable[tuple[str, int]] | Mapping[str, int]):
+        """
+        Builds the storage for `stats`, on the player's schema when STATS_TABLE is PlayerStats.
+
+        Complexity: See STATS_TABLE.from_items.
+        """
+        if issubclass(self.STATS_TABLE, PlayerStats):
+            return self.STATS_TABLE.from_items(stats, schema=self.schema)
+        return self.STATS_TABLE.from_items(stats)
+
+    def use_schema(self, schema: StatSchema) -> None:
+        """
+        Moves the player's stats onto `schema`, the stat columns of the league the player joins, and releases
+        the player's row in its previous schema.
+
+        Args:
+            schema (StatSchema): The schema of the player's team or season
+
+        Complexity:
+            Best Case Complexity: O(1), when the player already uses `schema`.
+            Worst Case Complexity: O(N * S + C' + R * C), see restore_checkpoint.
+
+            N is the number of stats the player has, C' the number of columns of its previous schema, and S, R and C
+            the size of the name table, the number of rows and the number of columns of `schema`.
+        """
+        if schema is self.schema:
+            return
+        self.schema = schema
+        if isinstance(self.stats, PlayerStats):
+            self.__replace_stats(self.stats.items())
+
+    def __replace_stats(self, stats: Iterable[tuple[str, int]] | Mapping[str, int]) -> None:
+        """
+        Replaces the player's stats with `stats`, releasing the row of the old ones when they are PlayerStats.
+
+        Complexity: See STATS_TABLE.from_items.
+        """
+        old = self.stats
+        self.stats = self.__new_stats(stats)
+        if isinstance(old, PlayerStats):
+            old.release()
 
     def reset_stats(self) -> None:
         """
@@ -46,25 +98,20 @@ class Player:
         I.e. all stats that were previously set should still be available, with a value of 0.
 
         Complexity:
-            Best Case Complexity: O(N)
-            Worst Case Complexity: O(N * S)
-
-            N is the number of stats 
-            S is the table size.
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(C), C is the number of stat columns; O(1) amortised.
 
             Justification:
 
-            Best Case:
-            The best case complexity of O(N), occurs when all the keys are retrieved seamlessly and each statistic is reset
-            without any collisions.
-
-            Worst Case:
-            The Worst Case complexity of O(N * S) occurs when the keys() method in HashyDoubleTable is called and it iterates
-            through several empty positions/SENTINELS costing O(N+S), and each reset causes a full probe of the table 
-            which costs O(S). Therefore, the worst case complexity simplifies to O(N*S).
+            Resetting PlayerStats only bumps the epoch of the player's row, see PlayerStats.reset. Values stamped with an
+            older epoch read back as 0, and their non-zero stamps keep the stats present, so no stat is visited. Once every
+            MAX_EPOCH resets the epoch wraps, and that one reset rewrites the row in O(C), which amortises to O(1).
+            A hash table used as STATS_TABLE is filled with 0 instead, in O(N) for its N stats.
         """
-        for key in self.stats.keys():
-            self.stats[key] = 0
+        if isinstance(self.stats, PlayerStats):
+            self.stats.reset()
+        else:
+            self.stats.fill_values(0)
 
     def __setitem__(self, statistic: str, value: int) -> None:
         """
@@ -76,21 +123,44 @@ class Player:
 
         Complexity:
             Best Case Complexity: O(1)
-            Worst Case Complexity: O(S), S refers to the table size.
+            Worst Case Complexity: O(S + R * C), S refers to the size of the schema's name table, R to its number of rows
+            (the players of the league) and C to its number of columns.
 
             Justification:
 
             Best Case:
-            The best case happens when the value for the statistic (key) lands in an empty position or if it's already 
-            in the table and the statistic's value has to updated.
+            The best case happens when the statistic (key) is found on the first probe of the schema's name table, and
+            the value is written into the player's value array at its column.
 
             Worst Case:
-            The Worst case happens when the value for the statistic (key) requires probing through the most of the table 
-            due to collisions/SENTINELS, which results in S probes and an overall worst case complexity of O(S).
+            The Worst case happens when the statistic (key) requires probing through most of the schema's name table
+            due to collisions, and is new to the league while every row is full, so the schema widens and copies the
+            C columns of all R rows, see StatSchema.intern.
         """
         self.stats[statistic] = value
 
 
+    def update_stats(self, stats: Iterable[tuple[str, int]] | Mapping[str, int], size_hint: int | None = None) -> None:
+        """
+        Sets many stats at once, from (statistic, value) pairs or a mapping of statistic to value.
+
+        Args:
+            stats: The stats to set
+            size_hint (int): The number of stats, for iterables whose length cannot be taken
+
+        Complexity:
+            Best Case Complexity: O(M)
+            Worst Case Complexity: O(M * S + R * C)
+
+            M is the number of stats given, and S, R and C the size of the schema's name table, its number of rows
+            and its number of columns.
+
+            Justification:
+            Each stat costs one lookup of its column in the schema, see __setitem__. New stats may widen the schema,
+            copying every row; as the width doubles, the copies add up to O(R * C).
+        """
+        self.stats.update(stats, size_hint)
+
     def __getitem__(self, statistic: str) -> int:
         """
         Get the value of the player's stat based on the passed key.
@@ -103,19 +173,46 @@ class Player:
 
         Complexity:
             Best Case Complexity: O(1)
-            Worst Case Complexity: O(S), S refers to the table size.
+            Worst Case Complexity: O(S), S refers to the size of the schema's name table.
 
             Justification:
 
             Best Case:
-            The Best case occurs when the key is found on the first probe, so only one operation is done in constant time.
+            The Best case occurs when the key's column is found on the first probe of the schema's name table, after which
+            the value is a single read from the player's value array.
 
             Worst Case:
-            The Worst case occurs when multiple positions must be probed through due to collisions/SENTINELS, which
-            requires S probes resulting in an overall worst case complexity of O(S).
+            The Worst case occurs when multiple positions of the schema's name table must be probed through due to
+            collisions, which requires S probes resulting in an overall worst case complexity of O(S).
         """
         return self.stats[statistic]
 
+    def checkpoint(self) -> dict:
+        """
+        Returns the state the player builds up during a season (goals and stats) as JSON-compatible data.
+
+        Complexity:
+            Best Case Complexity: O(C)
+            Worst Case Complexity: O(C)
+
+            C is the number of columns in the player's schema, see PlayerStats.items.
+        """
+        return {"name": self.name, "goals": self.goals, "stats": dict(self.stats.items())}
+
+    def restore_checkpoint(self, checkpoint: dict) -> None:
+        """
+        Replaces the player's goals and stats with those saved by checkpoint().
+
+        Complexity:
+            Best Case Complexity: O(N + C)
+            Worst Case Complexity: O(N * S + R * C)
+
+            N is the number of stats, and S, R and C the size of the schema's name table, its number of rows and its
+            number of columns. Releasing the old row costs O(C), see update_stats for the rest.
+        """
+        self.goals = checkpoint["goals"]
+        self.__replace_stats(checkpoint["stats"])
+
     def get_age(self) -> int:
         """
         Get the age of the player
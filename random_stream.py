@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import os
+from typing import Sequence, TypeVar
+
+T = TypeVar("T")
+
+MASK_64 = (1 << 64) - 1
+GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+
+
+def _mix(value: int) -> int:
+    """
+    SplitMix64 finaliser: scrambles a 64-bit integer so that nearby inputs give unrelated outputs.
+
+    Complexity: O(1)
+    """
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & MASK_64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & MASK_64
+    return value ^ (value >> 31)
+
+
+class RandomStream:
+    """
+    Seedable random generator that can be split into independent child streams.
+
+    Every draw is a pure function of the stream's key and how many draws came before it,
+    so a stream produces the same numbers on any machine and in any process.
+    Splitting derives a child key from the parent key and a label (e.g. a season, week or game number)
+    without consuming anything from the parent, which makes results independent of execution order:
+
+        root = RandomStream(2024)
+        game_rng = root.split(season, week, game)   # same as root.split(season).split(week).split(game)
+
+    It offers random_choice like RandomGen, so either can be passed wherever a generator is expected.
+    """
+
+    def __init__(self, seed: int | None = None) -> None:
+        """
+        Args:
+            seed (int or None): The root seed. None picks a random one.
+
+        No complexity analysis is required for this function.
+        """
+        if seed is None:
+            seed = int.from_bytes(os.urandom(8), "big")
+        self.__key = _mix(seed & MASK_64)
+        self.__counter = 0
+
+    @classmethod
+    def _from_key(cls, key: int) -> RandomStream:
+        """
+        Creates a fresh stream for an already-derived key.
+
+        Complexity: O(1)
+        """
+        stream = cls.__new__(cls)
+        stream.__key = key
+        stream.__counter = 0
+        return stream
+
+    @property
+    def key(self) -> int:
+        """
+        The 64-bit key identifying this stream.
+        """
+        return self.__key
+
+    def split(self, *labels: int) -> RandomStream:
+        """
+        Returns the child stream for `labels`. Splitting twice with the same labels gives the same child,
+        and split(a, b) is the same stream as split(a).split(b).
+
+        Args:
+            labels (int): The path to the child, e.g. season, week and game numbers.
+
+        Complexity:
+            Best Case Complexity: O(L)
+            Worst Case Complexity: O(L), L is the number of labels.
+        """
+        key = self.__key
+        for label in labels:
+            key = _mix(key ^ _mix((label * GOLDEN_GAMMA) & MASK_64))
+        return RandomStream._from_key(key)
+
+    def next_int(self) -> int:
+        """
+        Returns the next 64-bit random integer of the stream.
+
+        Complexity: O(1)
+        """
+        self.__counter += 1
+        return _mix((self.__key + self.__counter * GOLDEN_GAMMA) & MASK_64)
+
+    def random(self) -> float:
+        """
+        Returns the next random float in [0, 1).
+
+        Complexity: O(1)
+        """
+        return (self.next_int() >> 11) * (1.0 / (1 << 53))
+
+    def randint(self, lo: int, hi: int) -> int:
+        """
+        Returns a random integer in [lo, hi], both inclusive.
+
+        Complexity: O(1)
+        """
+        return lo + ((self.next_int() * (hi - lo + 1)) >> 64)
+
+    def random_choice(self, items: Sequence[T]) -> T:
+        """
+        Returns a random element of `items`.
+
+        Complexity: O(1)
+        """
+        return items[(self.next_int() * len(items)) >> 64]
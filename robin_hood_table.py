@@ -0,0 +1,403 @@
+from __future__ import annotations
+
+import time
+from array import array
+from typing import Callable, Iterable, Iterator, Mapping, TypeVar
+
+from data_structures.referential_array import ArrayR
+from data_structures.abstract_hash_table import HashTable
+from lazy_double_table import LazyDoubleTable, next_prime
+from table_statistics import TableStatistics
+
+
+V = TypeVar('V')
+
+#Distance stored for a slot that holds no entry.
+EMPTY = -1
+
+
+class RobinHoodTable(HashTable[str, V]):
+    """
+    Robin Hood Table uses linear probing, where an entry that has travelled further from its home
+    slot takes the slot of one that has travelled less. Every key therefore sits close to its home
+    slot, probe lengths vary little, and a lookup for a missing key stops as soon as it meets an entry
+    closer to home than itself. Deletion shifts the following entries back by one slot instead of
+    leaving a deleted marker behind, so the table never fills up with tombstones.
+
+    Slots are parallel arrays like LazyDoubleTable's: keys, values, the full hash of each key and
+    each slot's distance from its home slot (EMPTY when the slot is free).
+
+    Type Arguments:
+        - V: Value Type.
+    """
+
+    TABLE_SIZES = LazyDoubleTable.TABLE_SIZES
+    HASH_BASE = LazyDoubleTable.HASH_BASE
+    HASH_MODULUS = LazyDoubleTable.HASH_MODULUS
+    HASH_MIX = LazyDoubleTable.HASH_MIX
+    # Robin Hood hashing keeps probes short at higher loads than plain open addressing.
+    LOAD_LIMIT = 0.8
+    # Past the last of TABLE_SIZES, each size is the next prime after GROWTH_FACTOR times the one before.
+    GROWTH_FACTOR = LazyDoubleTable.GROWTH_FACTOR
+
+    # Probe and resize numbers, recorded only after enable_statistics().
+    statistics: TableStatistics | None = None
+
+    full_hash = LazyDoubleTable.full_hash
+
+    def __init__(self, sizes: tuple[int, ...] | None = None) -> None:
+        """
+        No complexity analysis is required for this function.
+        """
+        if sizes is not None:
+            self.TABLE_SIZES = sizes
+
+        self.__size_index = 0
+        self.__sizes = list(self.TABLE_SIZES)
+        self.__allocate(self.TABLE_SIZES[self.__size_index])
+        self.__length = 0
+
+    def __allocate(self, size: int) -> None:
+        """
+        Replaces the slot arrays with empty ones of `size` slots.
+
+        Complexity: O(size)
+        """
+        self.__keys: list[str | None] = [None] * size
+        self.__values: list[V | None] = [None] * size
+        self.__hashes = array("q", bytes(8 * size))
+        self.__distances = array("l", [EMPTY]) * size
+
+    @classmethod
+    def from_items(cls, items: Iterable[tuple[str, V]] | Mapping[str, V], size_hint: int | None = None) -> RobinHoodTable[V]:
+        """
+        Builds a table holding `items`, choosing its final size once. See LazyDoubleTable.from_items.
+
+        Complexity: See update.
+        """
+        table = cls()
+        table.update(items, size_hint)
+        return table
+
+    def update(self, items: Iterable[tuple[str, V]] | Mapping[str, V], size_hint: int | None = None) -> None:
+        """
+        Sets every (key, value) pair of `items`, or every item of a mapping, growing the table at most once.
+        See LazyDoubleTable.update.
+
+        Complexity:
+            Best Case Complexity: O(N + M), N is the number of entries and M the number of new items.
+            Worst Case Complexity: O(M * S), S is the table size.
+        """
+        if hasattr(items, "items"):
+            if size_hint is None and hasattr(items, "__len__"):
+                size_hint = len(items)
+            items = items.items()
+        if size_hint is None:
+            if not hasattr(items, "__len__"):
+                items = list(items)
+            size_hint = len(items)
+
+        self.reserve(self.__length + size_hint)
+        for key, data in items:
+            self[key] = data
+
+    def reserve(self, count: int) -> None:
+        """
+        Grows the table, at most once, so that it can hold `count` entries without another resize.
+
+        Complexity:
+            Best Case Complexity: O(1), when the table is already large enough.
+            Worst Case Complexity: O(N * S), see __resize.
+        """
+        size_index = self.__size_index
+        while count > self.__size_at(size_index) * self.LOAD_LIMIT:
+            size_index += 1
+        if size_index != self.__size_index:
+            self.__resize(size_index)
+
+    def __size_at(self, size_index: int) -> int:
+        """
+        Returns the table size for `size_index`, see LazyDoubleTable.__size_at.
+
+        Complexity:
+            Best Case Complexity: O(1), for a size already known.
+            Worst Case Complexity: O(log S) primality checks for each new size generated.
+        """
+        while size_index >= len(self.__sizes):
+            self.__sizes.append(next_prime(int(self.__sizes[-1] * self.GROWTH_FACTOR) + 1))
+        return self.__sizes[size_index]
+
+    def enable_statistics(self) -> TableStatistics:
+        """
+        Starts recording probe lengths and resizes into a new TableStatistics, and returns it.
+
+        Complexity: O(1)
+        """
+        self.statistics = TableStatistics(self)
+        return self.statistics
+
+    def disable_statistics(self) -> None:
+        """
+        Stops recording probe lengths and resizes.
+
+        Complexity: O(1)
+        """
+        self.statistics = None
+
+    @property
+    def table_size(self) -> int:
+        return len(self.__distances)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of elements in the hash table
+        """
+        return self.__length
+
+    def is_empty(self) -> bool:
+        return self.__length == 0
+
+    def hash(self, key: str) -> int:
+        """
+        Returns the home slot of `key`.
+
+        :complexity: O(len(key))
+        """
+        return self.full_hash(key) % self.table_size
+
+    def keys(self) -> ArrayR[str]:
+        """
+        Returns all keys in the hash table.
+
+        complexity: O(N + S) where N is the number of items in the table and S is the table size.
+        """
+        res = ArrayR(self.__length)
+        for i, key in enumerate(self.iter_keys()):
+            res[i] = key
+        return res
+
+    def values(self) -> ArrayR[V]:
+        """
+        Returns all values in the hash table.
+
+        complexity: O(N + S) where N is the number of items in the table and S is the table size.
+        """
+        res = ArrayR(self.__length)
+        for i, data in enumerate(self.iter_values()):
+            res[i] = data
+        return res
+
+    def iter_keys(self) -> Iterator[str]:
+        """
+        Yields every key in the hash table. The table must not be changed while iterating.
+
+        complexity: O(N + S) for the whole iteration.
+        """
+        distances, keys = self.__distances, self.__keys
+        for x in range(len(distances)):
+            if distances[x] != EMPTY:
+                yield keys[x]
+
+    def iter_values(self) -> Iterator[V]:
+        """
+        Yields every value in the hash table. The table must not be changed while iterating.
+
+        complexity: O(N + S) for the whole iteration.
+        """
+        distances, values = self.__distances, self.__values
+        for x in range(len(distances)):
+            if distances[x] != EMPTY:
+                yield values[x]
+
+    def items(self) -> Iterator[tuple[str, V]]:
+        """
+        Yields every (key, value) pair in the hash table. The table must not be changed while iterating.
+
+        complexity: O(N + S) for the whole iteration.
+        """
+        distances, keys, values = self.__distances, self.__keys, self.__values
+        for x in range(len(distances)):
+            if distances[x] != EMPTY:
+                yield keys[x], values[x]
+
+    def map_values(self, function: Callable[[V], V]) -> None:
+        """
+        Replaces every value with function(value), in place.
+
+        complexity: O(N + S), plus the cost of the N calls to `function`.
+        """
+        distances, values = self.__distances, self.__values
+        for x in range(len(distances)):
+            if distances[x] != EMPTY:
+                values[x] = function(values[x])
+
+    def fill_values(self, data: V) -> None:
+        """
+        Sets the value of every key to `data`, in place.
+
+        complexity: O(N + S)
+        """
+        distances, values = self.__distances, self.__values
+        for x in range(len(distances)):
+            if distances[x] != EMPTY:
+                values[x] = data
+
+    def __contains__(self, key: str) -> bool:
+        """
+        Checks to see if the given key is in the Hash Table
+
+        :complexity: See __find.
+        """
+        return self.__find(key, self.full_hash(key)) is not None
+
+    def __getitem__(self, key: str) -> V:
+        """
+        Get the value at a certain key
+
+        :complexity: See __find.
+        :raises KeyError: when the key doesn't exist.
+        """
+        position = self.__find(key, self.full_hash(key))
+        if position is None:
+            raise KeyError(key)
+        return self.__values[position]
+
+    def __find(self, key: str, key_hash: int) -> int | None:
+        """
+        Returns the slot holding `key`, or None when it is missing.
+
+        The probe stops at the first slot whose entry is closer to its home slot than the probe is to
+        the key's home slot: had the key been inserted, it would have taken that slot.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(S), S refers to the table size.
+
+            Justification:
+            The best case is a key found in, or ruled out at, its home slot. The worst case is a run of
+            entries that all share one home slot, which a missing key with that home slot walks to its end.
+        """
+        size = self.table_size
+        position = key_hash % size
+        distances, hashes, keys = self.__distances, self.__hashes, self.__keys
+
+        distance = 0
+        while distances[position] >= distance:
+            if hashes[position] == key_hash and keys[position] == key:
+                if self.statistics is not None:
+                    self.statistics.record_hit(distance + 1)
+                return position
+            position = (position + 1) % size
+            distance += 1
+
+        if self.statistics is not None:
+            self.statistics.record_miss(distance + 1)
+        return None
+
+    def __setitem__(self, key: str, data: V) -> None:
+        """
+        Set a (key, value) pair in our hash table.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(N * S), when the table has to grow first, see __resize.
+
+            Justification:
+            The best case finds the key, or a free slot, at its home slot. Otherwise the probe walks forward,
+            swapping the entry being placed with any entry closer to its home slot, until a free slot is found.
+            Only a new key can make the table grow; overwriting an existing key never does.
+        """
+        key_hash = self.full_hash(key)
+        position = self.__find(key, key_hash)
+        if position is not None:
+            self.__values[position] = data
+            return
+
+        if self.__length + 1 > self.table_size * self.LOAD_LIMIT:
+            self.__resize(self.__size_index + 1)
+
+        self.__place(key, data, key_hash)
+        self.__length += 1
+
+    def __place(self, key: str, data: V, key_hash: int) -> None:
+        """
+        Places an entry whose key is known to be missing, displacing entries closer to their home slot.
+
+        Complexity: See __setitem__.
+        """
+        size = self.table_size
+        keys, values, hashes, distances = self.__keys, self.__values, self.__hashes, self.__distances
+        position = key_hash % size
+        distance = 0
+        while distances[position] != EMPTY:
+            if distances[position] < distance:
+                #the entry in this slot is closer to home, so it gives up the slot and is carried on instead.
+                keys[position], key = key, keys[position]
+                values[position], data = data, values[position]
+                hashes[position], key_hash = key_hash, hashes[position]
+                distances[position], distance = distance, distances[position]
+            position = (position + 1) % size
+            distance += 1
+
+        keys[position] = key
+        values[position] = data
+        hashes[position] = key_hash
+        distances[position] = distance
+
+    def __delitem__(self, key: str) -> None:
+        """
+        Deletes a (key, value) pair in our hash table, then shifts the entries after it back by one slot
+        until one is at its home slot or a slot is free.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(S), S refers to the table size.
+        """
+        position = self.__find(key, self.full_hash(key))
+        if position is None:
+            raise KeyError(key)
+
+        size = self.table_size
+        keys, values, hashes, distances = self.__keys, self.__values, self.__hashes, self.__distances
+        following = (position + 1) % size
+        while distances[following] > 0:
+            keys[position] = keys[following]
+            values[position] = values[following]
+            hashes[position] = hashes[following]
+            distances[position] = distances[following] - 1
+            position = following
+            following = (following + 1) % size
+
+        keys[position] = None
+        values[position] = None
+        distances[position] = EMPTY
+        self.__length -= 1
+
+    def __resize(self, size_index: int) -> None:
+        """
+        Moves every entry into a new table of the size at `size_index`, using the stored hashes.
+
+        Complexity:
+            Best Case Complexity: O(S)
+            Worst Case Complexity: O(N * S)
+        """
+        started = time.perf_counter()
+        old_keys, old_values, old_hashes, old_distances = self.__keys, self.__values, self.__hashes, self.__distances
+
+        self.__size_index = size_index
+        self.__allocate(self.__size_at(size_index))
+        for x, distance in enumerate(old_distances):
+            if distance != EMPTY:
+                self.__place(old_keys[x], old_values[x], old_hashes[x])
+
+        if self.statistics is not None:
+            self.statistics.record_rehash(time.perf_counter() - started)
+
+    def __str__(self) -> str:
+        """
+        Returns all they key/value pairs in our hash table (no particular order).
+        """
+        result = ""
+        for key, value in self.items():
+            result += "(" + str(key) + "," + str(value) + ")\n"
+        return result
@@ -1,5 +1,7 @@
 import argparse
+import math
 import re
+import time
 import unittest
 
 import json
@@ -10,6 +12,140 @@ from unittest.runner import TextTestResult
 
 NUMBER_OF_TASKS_FOR_ASSIGNMENT = 6
 
+# Complexity classes in increasing order of growth, with their growth function.
+COMPLEXITY_CLASSES = (
+    ("O(1)", lambda n: 1.0),
+    ("O(log N)", lambda n: math.log2(n)),
+    ("O(N)", lambda n: float(n)),
+    ("O(N log N)", lambda n: n * math.log2(n)),
+    ("O(N^2)", lambda n: float(n) ** 2),
+    ("O(N^3)", lambda n: float(n) ** 3),
+)
+
+
+def parse_complexity(declared):
+    """
+    Returns the index in COMPLEXITY_CLASSES of a complexity written like "O(log N)" or "O(n^2)".
+    Spaces and letter case are ignored.
+    """
+    normalised = re.sub(r"\s+", "", declared).lower()
+    for index, (name, _) in enumerate(COMPLEXITY_CLASSES):
+        if re.sub(r"\s+", "", name).lower() == normalised:
+            return index
+    raise ValueError(f"Unknown complexity class: {declared}")
+
+
+def fit_complexity(samples):
+    """
+    Finds the complexity class that best explains the measured (size, seconds) samples.
+
+    For each class f, the time per unit of f, log(seconds / f(size)), should stay flat as the size grows.
+    The class whose time per unit deviates least from its mean, by sum of squares, is the measured class.
+    Comparing the classes against each other separates neighbours like O(N) and O(N log N), whose ratio
+    grows too slowly for any fixed threshold on one class alone to tell them apart.
+
+    Returns the index of the measured class in COMPLEXITY_CLASSES, and for every class the residual
+    sum of squares and the least squares slope of log(seconds / f(size)) against log(size).
+    """
+    xs = [math.log(size) for size, _ in samples]
+    mean_x = sum(xs) / len(xs)
+    spread = sum((x - mean_x) ** 2 for x in xs)
+
+    residuals = []
+    slopes = []
+    for _, growth in COMPLEXITY_CLASSES:
+        ys = [math.log(max(seconds, 1e-12) / growth(size)) for size, seconds in samples]
+        mean_y = sum(ys) / len(ys)
+        residuals.append(sum((y - mean_y) ** 2 for y in ys))
+        slopes.append(sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / spread)
+
+    measured = min(range(len(COMPLEXITY_CLASSES)), key=lambda index: residuals[index])
+    return measured, residuals, slopes
+
+
+class ComplexityTestCase(unittest.TestCase):
+    """
+    Test case for the #complexity tag: checks that an operation scales no worse than the complexity
+    declared in the test's docstring, e.g.
+
+        def test_lookup(self):
+            '''
+            #name(Lookup stays logarithmic)
+            #complexity(O(log N))
+            '''
+            self.assert_complexity(lambda n: build_leaderboard(n), lambda board: board[len(board) // 2])
+
+    The operation is timed on inputs of geometrically increasing size and the growth curve is fitted
+    against the classes in COMPLEXITY_CLASSES (see fit_complexity). The test fails when the best fitting
+    class grows faster than the declared one, and the time per unit of the declared class also keeps
+    growing, with a log-log slope above SLOPE_TOLERANCE. The fit is reported in the test feedback,
+    including in the Ed JSON output.
+    """
+
+    # Sizes span 2^4..2^16, so that the ratio of neighbouring classes, e.g. log N between O(N) and O(N log N),
+    # changes by a factor of 4 across them.
+    SIZES = tuple(2 ** exponent for exponent in range(4, 17, 2))
+    # Over SIZES, a class one log factor too slow leaves a slope of about 0.17; timer and cache noise stay below 0.1.
+    SLOPE_TOLERANCE = 0.1
+    REPEAT = 5
+    # Fast operations are repeated until each sample takes at least this long, to beat timer noise.
+    MIN_SAMPLE_SECONDS = 0.002
+
+    complexity_report = None
+
+    def declared_complexity(self):
+        docstring = getattr(self, self._testMethodName).__doc__ or ""
+        match = re.search(r"#complexity\((.*?\)?)\)", docstring, re.DOTALL)
+        if not match:
+            raise ValueError("A complexity test needs a #complexity(...) tag in its docstring.")
+        return match.group(1).strip()
+
+    def measure_growth(self, setup, operation, sizes):
+        """
+        Returns (size, seconds per call) for each size. setup(size) builds the input outside the timing;
+        operation(input) must leave the input unchanged, since it may be called several times on it.
+        """
+        samples = []
+        for size in sizes:
+            state = setup(size)
+            loops = 1
+            while True:
+                started = time.perf_counter()
+                for _ in range(loops):
+                    operation(state)
+                if time.perf_counter() - started >= self.MIN_SAMPLE_SECONDS or loops >= 1 << 20:
+                    break
+                loops *= 2
+
+            best = float("inf")
+            for _ in range(self.REPEAT):
+                started = time.perf_counter()
+                for _ in range(loops):
+                    operation(state)
+                best = min(best, (time.perf_counter() - started) / loops)
+            samples.append((size, best))
+        return samples
+
+    def assert_complexity(self, setup, operation, sizes=None):
+        """
+        Fails the test when operation(setup(n)) grows faster than the #complexity tag allows.
+        """
+        declared = self.declared_complexity()
+        declared_index = parse_complexity(declared)
+        samples = self.measure_growth(setup, operation, tuple(sizes or self.SIZES))
+        measured_index, residuals, slopes = fit_complexity(samples)
+
+        measured = COMPLEXITY_CLASSES[measured_index][0]
+        self.complexity_report = (
+            f"Declared {declared}, measured {measured} "
+            f"(residual slope {slopes[declared_index]:+.2f} against {declared}, "
+            f"residuals {residuals[declared_index]:.3f} against {declared} and {residuals[measured_index]:.3f} "
+            f"against {measured}, sizes {samples[0][0]}..{samples[-1][0]}, "
+            f"{samples[0][1]:.3g}s..{samples[-1][1]:.3g}s per call)"
+        )
+        if measured_index > declared_index and slopes[declared_index] > self.SLOPE_TOLERANCE:
+            self.fail(f"Scales worse than declared. {self.complexity_report}")
+
 
 class SingleTaskTestResult(TextTestResult):
     """
@@ -30,6 +166,7 @@ class SingleTaskTestResult(TextTestResult):
     #private: If the test is private
     #approach: If the test is an approach test (used for aggregating results)
     #hurdle: If the test is a hurdle test (if not passed, that task gets 0)
+    #complexity(O(...)): If the test checks scaling (see ComplexityTestCase), the fit is added to the feedback
     """
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -119,6 +256,11 @@ class SingleTaskTestResult(TextTestResult):
         hurdle_test = bool(re.search(r"#hurdle", docstring, re.DOTALL))
         self.any_hurdles_failed = self.any_hurdles_failed or (hurdle_test and not passed)
 
+        # Complexity tests report the fitted growth whether they pass or fail
+        complexity_report = getattr(test, "complexity_report", None)
+        if complexity_report and complexity_report not in feedback:
+            feedback = f"{feedback.strip()}\n{complexity_report}"
+
         # Update the Ed output
         result = {
             "name": test_name,
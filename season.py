@@ -1,12 +1,22 @@
 from __future__ import annotations
+import json
+import os
+import random
+from array import array
+from concurrent.futures import Executor, ProcessPoolExecutor
 from data_structures.array_set import ArraySet
 from data_structures.referential_array import ArrayR
 from data_structures.array_list import ArrayList
-from enums import TeamGameResult
-from game_simulator import GameSimulator, GameSimulationOutcome
-from dataclasses import dataclass
+from enums import ScheduleGenerator, TeamGameResult
+from game_simulator import GameSimulator, GameSimulationOutcome, GOAL_DISTRIBUTION
+from random_stream import RandomStream
+from stat_schema import StatSchema
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Iterator
 from team import Team
-from data_structures import ArraySortedList
+from leaderboard import Leaderboard
+from phase_profiler import PhaseProfiler
 
 
 @dataclass
@@ -79,14 +89,215 @@ class WeekOfGames:
             raise StopIteration 
 
 
+class FixtureList:
+    """
+    The games of one week stored compactly: a single integer array holding the home and away team id
+    of every game, interleaved. A team id is the team's position in the season's teams.
+
+    Indexing or iterating creates a Game view on demand, so it can be used anywhere the games of a
+    WeekOfGames are expected. Views are fresh objects; changing one does not change the fixture.
+    Batched simulators can read team_ids directly instead.
+    """
+
+    def __init__(self, teams: ArrayR[Team] | ArrayList[Team], team_ids: array) -> None:
+        """
+        Args:
+            teams (ArrayR[Team]): The teams the ids refer to.
+            team_ids (array): home_0, away_0, home_1, away_1, ... team ids.
+
+        No complexity analysis is required for this function.
+        """
+        self.teams = teams
+        self.team_ids = team_ids
+
+    def __len__(self) -> int:
+        """
+        Returns the number of games.
+
+        Complexity: O(1)
+        """
+        return len(self.team_ids) // 2
+
+    def __getitem__(self, index: int) -> Game:
+        """
+        Returns a Game view of game `index`.
+
+        Complexity: O(1)
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Fixture index out of range")
+        return Game(self.teams[self.team_ids[2 * index]], self.teams[self.team_ids[2 * index + 1]])
+
+    def __iter__(self) -> Iterator[Game]:
+        """
+        Yields a Game view of every game, in order.
+
+        Complexity: O(1) per game.
+        """
+        for index in range(len(self)):
+            yield self[index]
+
+
+class LazySchedule:
+    """
+    A circle-method schedule that builds each WeekOfGames only when it is accessed.
+
+    Only the order of the week numbers is stored, so memory stays O(W) instead of holding all O(N^2) games
+    for the whole season. Week w of the first half is circle round w - 1, and week R + w repeats it with
+    home and away flipped, where R is the number of rounds. Delaying a week just moves its number,
+    so Season.delay_week_of_games works unchanged through delete_at_index and insert.
+    """
+
+    def __init__(self, season: Season) -> None:
+        """
+        Args:
+            season (Season): The season whose teams are scheduled.
+
+        No complexity analysis is required for this function.
+        """
+        self.__season = season
+        self.__rounds = season._circle_rounds()
+        self.__order: ArrayList[int] = ArrayList()
+        for week in range(1, 2 * self.__rounds + 1):
+            self.__order.append(week)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of weeks in the schedule.
+
+        Complexity: O(1)
+        """
+        return len(self.__order)
+
+    def week_number_at(self, index: int) -> int:
+        """
+        Returns the week number currently scheduled at position `index`, without building its games.
+
+        Complexity: O(1)
+        """
+        return self.__order[index]
+
+    def reorder(self, week_numbers: list[int]) -> None:
+        """
+        Replaces the order of the weeks, e.g. when restoring a checkpoint.
+
+        Complexity: O(W), W is the number of weeks.
+        """
+        self.__order = ArrayList()
+        for week in week_numbers:
+            self.__order.append(week)
+
+    def __getitem__(self, index: int) -> WeekOfGames:
+        """
+        Builds the week of games at position `index`.
+
+        Complexity:
+            Best Case Complexity: O(N)
+            Worst Case Complexity: O(N), N is the number of teams in the season.
+        """
+        return self.__build(self.__order[index])
+
+    def __iter__(self) -> Iterator[WeekOfGames]:
+        """
+        Builds the weeks one at a time, in schedule order.
+
+        Complexity: O(N) per week.
+        """
+        for index in range(len(self.__order)):
+            yield self.__build(self.__order[index])
+
+    def delete_at_index(self, index: int) -> WeekOfGames:
+        """
+        Removes the week at position `index` and returns it.
+
+        Complexity:
+            Best Case Complexity: O(N)
+            Worst Case Complexity: O(N + W), W is the number of weeks.
+        """
+        return self.__build(self.__order.delete_at_index(index))
+
+    def insert(self, index: int, week: WeekOfGames) -> None:
+        """
+        Schedules `week` at position `index`. Only its week number is kept.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(W), W is the number of weeks.
+        """
+        self.__order.insert(index, week.week)
+
+    def __build(self, week: int) -> WeekOfGames:
+        """
+        Creates the fixtures of week number `week` from its circle round.
+
+        Complexity: O(N)
+        """
+        round_index = (week - 1) % self.__rounds
+        flipped = week > self.__rounds
+        return WeekOfGames(week, self.__season._circle_fixtures(round_index, flipped))
+
+
+@dataclass
+class TeamForecast:
+    """
+    Aggregated Monte Carlo results for one team.
+
+    position_counts[p] is the number of replicas in which the team finished in position p + 1.
+    """
+    name: str
+    title_probability: float = 0.0
+    expected_points: float = 0.0
+    position_counts: list[int] = field(default_factory=list)
+
+
+@dataclass
+class MonteCarloSummary:
+    """
+    Result of Season.monte_carlo: one TeamForecast per team, in the same order as Season.teams.
+    """
+    seasons: int
+    forecasts: list[TeamForecast]
+
+    def __getitem__(self, team_name: str) -> TeamForecast:
+        """
+        Returns the forecast for the team called `team_name`.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(N), N is the number of teams.
+        """
+        for forecast in self.forecasts:
+            if forecast.name == team_name:
+                return forecast
+        raise KeyError(team_name)
+
+
 class Season:
 
-    def __init__(self, teams: ArrayR[Team] | ArrayList[Team]) -> None:
+    CHECKPOINT_VERSION = 1
+
+    def __init__(self, teams: ArrayR[Team] | ArrayList[Team], deferred_leaderboard: bool = False,
+                 schedule_generator: ScheduleGenerator = ScheduleGenerator.GREEDY, lazy_schedule: bool = False,
+                 compact_fixtures: bool = False, schema: StatSchema | None = None) -> None:
         """
         Initializes the season with a schedule.
 
         Args:
             teams (ArrayR[Team]): The teams played in this season.
+            deferred_leaderboard (bool): Re-sort the leaderboard once per week instead of after every game.
+            schedule_generator (ScheduleGenerator): How to build the schedule. CIRCLE scales to large leagues,
+                see _generate_circle_schedule.
+            lazy_schedule (bool): Build each week only when it is accessed, see LazySchedule.
+                Requires the CIRCLE generator, whose weeks can be derived from their week number.
+                Lazy weeks always hold their games as a FixtureList.
+            compact_fixtures (bool): Store each week's games as a FixtureList of team ids instead of Game objects.
+            schema (StatSchema): The stat columns shared by every player in the season, a new one by default.
+                Each team moves its players' stats onto it, see Team.use_schema.
+
+        Raises:
+            ValueError: When a lazy schedule is requested with a generator other than CIRCLE.
 
         Complexity:
             Best Case Complexity: O(N^2)
@@ -97,30 +308,51 @@ class Season:
             Justification:
 
             Best Case:
-            The best case complexity is O(N^2), as regardless of the best case of the add function being O(log N) and 
+            The best case complexity is O(N^2), as regardless of the Leaderboard add function being O(log N) and 
             the insert function for ArrayList being O(1), these are dominated by the generate_schedule function
             which always performs nested loops across all teams in the season, resulting in a best case complexity of 
             O(N^2).
 
             Worst Case:
-            The worst case complexity is O(N^2), as regardless of the worst case of the add function in ArraySortedList
+            The worst case complexity is O(N^2), as regardless of the worst case of the add function in Leaderboard
             being O(N) and the insert function for ArrayList being O(N), these are dominated by the generate_schedule function
             which always performs nested loops across all teams in the season, resulting in a worst case complexity of 
             O(N^2).
+
+            Moving the teams onto the season's schema adds the cost of Team.use_schema for each team.
         """
         self.teams = teams
-        self.leaderboard = ArraySortedList()
+        self.schema = schema if schema is not None else StatSchema()
+        self.leaderboard = Leaderboard(deferred_leaderboard)
         for team in teams:
+            team.use_schema(self.schema)
             self.leaderboard.add(team)
 
-        self.schedule = ArrayList()
-        populated_schedule = self._generate_schedule()
-        
-        #schedule is updated for each week.
-        week_count = 1
-        for weekly_games in populated_schedule:
-            self.schedule.insert(len(self.schedule), WeekOfGames(week_count,weekly_games))
-            week_count +=1 
+        if lazy_schedule:
+            if schedule_generator != ScheduleGenerator.CIRCLE:
+                raise ValueError("A lazy schedule needs the CIRCLE schedule generator!")
+            self.schedule = LazySchedule(self)
+        else:
+            self.schedule = ArrayList()
+            if compact_fixtures and schedule_generator == ScheduleGenerator.CIRCLE:
+                populated_schedule = self._generate_compact_circle_schedule()
+            elif schedule_generator == ScheduleGenerator.CIRCLE:
+                populated_schedule = self._generate_circle_schedule()
+            else:
+                populated_schedule = self._generate_schedule()
+                if compact_fixtures:
+                    populated_schedule = self._compact_schedule(populated_schedule)
+
+            #schedule is updated for each week.
+            week_count = 1
+            for weekly_games in populated_schedule:
+                self.schedule.insert(len(self.schedule), WeekOfGames(week_count,weekly_games))
+                week_count +=1 
+
+        #the number of weeks at the start of the schedule that have already been played.
+        self.current_week = 0
+        #None unless enable_profiling() was called.
+        self.profiler: PhaseProfiler | None = None
 
     def _generate_schedule(self) -> ArrayList[ArrayList[Game]]:
         """
@@ -174,12 +406,145 @@ class Season:
         
         return weekly_games
 
-    def simulate_season(self) -> None:
+    def _generate_circle_schedule(self) -> ArrayList[ArrayList[Game]]:
+        """
+        Generates a double round-robin schedule with the circle (Berger) method.
+
+        The first half has every pairing once and the second half repeats it with home and away flipped,
+        like _generate_schedule. Each half takes the minimal N - 1 weeks for an even number of teams
+        (N weeks for an odd number, where every team sits out one week).
+
+        Return:
+            ArrayList[ArrayList[Game]]: The schedule of the season.
+                The outer array is the weeks in the season.
+                The inner array is the games for that given week.
+
+        Complexity:
+            Best Case Complexity: O(N^2)
+            Worst Case Complexity: O(N^2), N is the number of teams in the season.
+
+            Justification:
+            There are O(N) rounds, and each round pairs every team once in O(N) using _circle_pairings,
+            without any of the searching and removing done by the greedy generator.
+        """
+        weekly_games: ArrayList[ArrayList[Game]] = ArrayList()
+        flipped_weeks: ArrayList[ArrayList[Game]] = ArrayList()
+
+        for round_index in range(self._circle_rounds()):
+            current_week: ArrayList[Game] = ArrayList()
+            flipped_week: ArrayList[Game] = ArrayList()
+            for home, away in self._circle_pairings(round_index):
+                current_week.append(Game(self.teams[home], self.teams[away]))
+                flipped_week.append(Game(self.teams[away], self.teams[home]))
+            weekly_games.append(current_week)
+            flipped_weeks.append(flipped_week)
+
+        for flipped_week in flipped_weeks:
+            weekly_games.append(flipped_week)
+
+        return weekly_games
+
+    def _circle_rounds(self) -> int:
+        """
+        Returns the number of weeks in one half of a circle-method schedule.
+
+        Complexity: O(1)
+        """
+        num_teams = len(self.teams)
+        return num_teams - 1 if num_teams % 2 == 0 else num_teams
+
+    def _circle_pairings(self, round_index: int) -> Iterator[tuple[int, int]]:
+        """
+        Yields the (home, away) team indices of one round of the circle method.
+
+        Team 0 stays fixed while the others rotate one seat per round, and seat k plays seat M - 1 - k,
+        where M is the number of teams rounded up to even. With an odd number of teams the extra seat
+        is a bye and its game is skipped. The fixed team alternates home and away between rounds.
+
+        Complexity:
+            Best Case Complexity: O(N)
+            Worst Case Complexity: O(N), N is the number of teams in the season.
+        """
+        num_teams = len(self.teams)
+        seats = num_teams + num_teams % 2
+        rotating = seats - 1
+
+        def team_at(seat: int) -> int:
+            return 0 if seat == 0 else 1 + (seat - 1 + round_index) % rotating
+
+        for seat in range(seats // 2):
+            home, away = team_at(seat), team_at(seats - 1 - seat)
+            if home >= num_teams or away >= num_teams:
+                continue
+            if seat == 0 and round_index % 2 == 1:
+                home, away = away, home
+            yield home, away
+
+    def _circle_fixtures(self, round_index: int, flipped: bool = False) -> FixtureList:
         """
-        Simulates the season.
+        Returns one round of the circle method as a FixtureList, with home and away swapped if `flipped`.
 
         Complexity:
-            Assume GameSimulator.simulate() is O(1)
+            Best Case Complexity: O(N)
+            Worst Case Complexity: O(N), N is the number of teams in the season.
+        """
+        team_ids = array("I")
+        for home, away in self._circle_pairings(round_index):
+            if flipped:
+                home, away = away, home
+            team_ids.append(home)
+            team_ids.append(away)
+        return FixtureList(self.teams, team_ids)
+
+    def _generate_compact_circle_schedule(self) -> ArrayList[FixtureList]:
+        """
+        Generates the same schedule as _generate_circle_schedule, holding each week as a FixtureList.
+
+        Complexity:
+            Best Case Complexity: O(N^2)
+            Worst Case Complexity: O(N^2), N is the number of teams in the season.
+        """
+        weekly_games: ArrayList[FixtureList] = ArrayList()
+        for flipped in (False, True):
+            for round_index in range(self._circle_rounds()):
+                weekly_games.append(self._circle_fixtures(round_index, flipped))
+        return weekly_games
+
+    def _compact_schedule(self, schedule: ArrayList[ArrayList[Game]]) -> ArrayList[FixtureList]:
+        """
+        Converts every week of `schedule` into a FixtureList of team ids, i.e. positions in self.teams.
+
+        Complexity:
+            Best Case Complexity: O(N + G)
+            Worst Case Complexity: O(N + G)
+
+            N is the number of teams and G the number of games in the schedule.
+        """
+        team_index = {team.name: index for index, team in enumerate(self.teams)}
+        weekly_games: ArrayList[FixtureList] = ArrayList()
+        for week in schedule:
+            team_ids = array("I")
+            for game in week:
+                team_ids.append(team_index[game.home_team.name])
+                team_ids.append(team_index[game.away_team.name])
+            weekly_games.append(FixtureList(self.teams, team_ids))
+        return weekly_games
+
+    def simulate_season(self, rng: RandomStream | None = None, parallel: bool = False, workers: int | None = None) -> None:
+        """
+        Simulates the season, i.e. every week that has not been played yet.
+
+        Args:
+            rng (RandomStream or None): The generator for this season. Week w draws from rng.split(w),
+                and game i of that week from rng.split(w, i), so the results only depend on the generator
+                and never on the order the games are simulated in. None uses the global RandomGen,
+                or a randomly seeded RandomStream when `parallel` is set.
+            parallel (bool): Simulate each week's games on a process pool, see _play_week.
+                Gives exactly the same results as a serial run with the same `rng`.
+            workers (int or None): The number of worker processes when `parallel` is set. None uses every core.
+
+        Complexity:
+            Assume GameSimulator.simulate_batch() is O(1) per game
             Remember to define your variables in your complexity.
 
             Best Case Complexity: O(G log N)
@@ -191,58 +556,281 @@ class Season:
             Justification:
 
             Best Case:
-            The best case for this function is O(G log N). We assume that calling the simulate() function would cost
-            constant time and adding the result using the add_result() function in best case and player updates from 
-            LazyDoubleTable is also done in constant time. The updation of the leaderboard is done in O(log N) time 
-            using the index (O(1)) and delete_at_index (O(log N)) functions in best case. However, all this work is being done for
-            one game, so to find the overall best case complexity we multiply O(log N) by the total number of games 
-            in the season- O(G log N).
+            The best case for this function is O(G log N). We assume that simulating a game costs constant time,
+            and adding the result using the add_result() function and crediting the goal scorers are also done in
+            constant time. Moving a team on the Leaderboard skip list with update() takes O(log N) expected time.
+            All this work is done for each game, so the overall best case complexity is O(G log N).
+            In deferred mode the leaderboard is instead re-sorted once per week in O(N log N), which over the
+            W weeks of the season is O(W * N log N) = O(G log N) as every team plays every week.
 
             Worst Case:
-            The worst case for this function is O(G * N). We assume that calling the simulate() function would cost
-            constant time and adding the result using the add_result() function in worst case and player updates from 
-            LazyDoubleTable is also done in constant time. The updation of the leaderboard is done in O(N) time using the 
-            index (O(log N)) and delete_at_index (O(N)) functions in worst case. However, all this work is being done 
-            for one game, so to find the overall worst case complexity we multiply O(N) by the total number of games 
-            in the season- O(G log N).
-        """
-        for week in self.schedule:
-            for game in week:
-                # simulates the game between the home and away team.
-                game_simulate = GameSimulator.simulate(game.home_team, game.away_team)
-
-                # Process's game result for home and away team.
-                if game_simulate.home_goals > game_simulate.away_goals:
-                    result_home_team = TeamGameResult.WIN
-                    result_away_team = TeamGameResult.LOSS
-                
-                elif game_simulate.home_goals < game_simulate.away_goals:
-                    result_home_team = TeamGameResult.LOSS 
-                    result_away_team = TeamGameResult.WIN
+            The worst case for this function is O(G * N). It happens when the random levels of the Leaderboard
+            skip list degenerate into a linked list, so each update() walks O(N) nodes. This is done for each
+            game, resulting in an overall worst case complexity of O(G * N).
+        """
+        self.simulate_until(len(self.schedule), rng, parallel, workers)
 
-                else:
-                    result_home_team = result_away_team = TeamGameResult.DRAW
-
-                #add_result function to add the result to team's history.
-                game.home_team.add_result(result_home_team)
-                game.away_team.add_result(result_away_team)
-                
-                #add the home/away team's results to the leaderboard.
-                if game.home_team in self.leaderboard:
-                    self.leaderboard.delete_at_index(self.leaderboard.index(game.home_team))
-                self.leaderboard.add(game.home_team)
-                
-                if game.away_team in self.leaderboard:
-                    self.leaderboard.delete_at_index(self.leaderboard.index(game.away_team))
-                self.leaderboard.add(game.away_team)
-
-                #This is done to list out the players who scored goals.
-                for name in game_simulate.goal_scorers:
-                    if name in game.home_team.player_search:
-                        game.home_team.player_search[name].goals += 1
-                    elif name in game.away_team.player_search:
-                        game.away_team.player_search[name].goals += 1
+    def simulate_week(self, week: int | None = None, rng: RandomStream | None = None) -> None:
+        """
+        Plays the next week of the schedule.
+
+        Args:
+            week (int or None): The schedule position (1-based) to play, which must be the next unplayed week.
+                None plays the next unplayed week.
+            rng (RandomStream or None): The season's generator, see simulate_season.
+
+        Raises:
+            ValueError: When `week` is not the next unplayed week, or the season is over.
+
+        Complexity:
+            See _play_week.
+        """
+        if week is None:
+            week = self.current_week + 1
+        if week != self.current_week + 1 or week > len(self.schedule):
+            raise ValueError(f"The next week to play is week {self.current_week + 1}!")
+
+        self._play_week(self.schedule[week - 1], rng)
+        self.current_week = week
+
+    def simulate_until(self, week: int, rng: RandomStream | None = None,
+                       parallel: bool = False, workers: int | None = None) -> None:
+        """
+        Plays every unplayed week up to and including schedule position `week` (1-based).
+
+        The weeks draw from rng.split(week number), so stopping, checkpointing and resuming
+        with the same `rng` gives the same season as simulating it in one go.
+
+        Args:
+            week (int): The last week to play.
+            rng, parallel, workers: See simulate_season.
+
+        Raises:
+            ValueError: When `week` is outside the schedule.
+
+        Complexity:
+            See simulate_season, with G the number of games in the played weeks.
+        """
+        if not 0 <= week <= len(self.schedule):
+            raise ValueError("Please enter a week within the schedule!")
+        if parallel and rng is None:
+            rng = RandomStream()
+
+        if not parallel:
+            while self.current_week < week:
+                self.simulate_week(rng=rng)
+            return
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            while self.current_week < week:
+                self._play_week(self.schedule[self.current_week], rng, executor, workers)
+                self.current_week += 1
+
+    def _play_week(self, week: WeekOfGames, rng: RandomStream | None,
+                   executor: Executor | None = None, workers: int = 1) -> None:
+        """
+        Simulates one week of games and applies the results to the teams, leaderboard and goal scorers.
+
+        No team plays twice in a week, so the games are independent and may be simulated by `executor`.
+        The results are always applied afterwards in game order, so the outcome does not depend on
+        how the games were spread over the workers.
+
+        Args:
+            week (WeekOfGames): The week to play.
+            rng (RandomStream or None): The season's generator, split with the week number. None uses RandomGen.
+            executor (Executor or None): The pool to simulate the games on. None simulates them here.
+            workers (int): The number of chunks to split the week into for `executor`.
+
+        Complexity:
+            Best Case Complexity: O(M log N)
+            Worst Case Complexity: O(M * N)
+
+            M is the number of games in the week and N the number of teams; see simulate_season.
+        """
+        profiler = self.profiler
+        if profiler is not None:
+            started = perf_counter()
+
+        # simulates all the games of the week in one batch.
+        week_rng = None if rng is None else rng.split(week.week)
+        if executor is not None:
+            outcomes = GameSimulator.simulate_parallel(week, week_rng, executor, workers)
+        elif isinstance(week.games, FixtureList):
+            outcomes = GameSimulator.simulate_fixtures(self.teams, week.games.team_ids, week_rng)
+        else:
+            outcomes = GameSimulator.simulate_batch(week, week_rng)
+        games = list(week)
+
+        if profiler is not None:
+            profiler.record(PhaseProfiler.SIMULATE, week.week, perf_counter() - started, len(games))
+            started = perf_counter()
+
+        # Each phase runs over the whole week: no team plays twice in a week, so applying all results
+        # before moving anyone on the leaderboard ends in the same state as going game by game.
+        for index, game in enumerate(games):
+            home_goals = outcomes.home_goals[index]
+            away_goals = outcomes.away_goals[index]
+
+            # Process's game result for home and away team.
+            if home_goals > away_goals:
+                result_home_team = TeamGameResult.WIN
+                result_away_team = TeamGameResult.LOSS
+            
+            elif home_goals < away_goals:
+                result_home_team = TeamGameResult.LOSS 
+                result_away_team = TeamGameResult.WIN
+
+            else:
+                result_home_team = result_away_team = TeamGameResult.DRAW
+
+            #add_result function to add the result to team's history.
+            game.home_team.add_result(result_home_team)
+            game.away_team.add_result(result_away_team)
+
+        if profiler is not None:
+            profiler.record(PhaseProfiler.ADD_RESULT, week.week, perf_counter() - started, 2 * len(games))
+            started = perf_counter()
+
+        #move the home/away teams to their new leaderboard positions.
+        for game in games:
+            self.leaderboard.update(game.home_team)
+            self.leaderboard.update(game.away_team)
+
+        #a deferred leaderboard is re-sorted once the whole week has been played.
+        self.leaderboard.flush()
+
+        if profiler is not None:
+            profiler.record(PhaseProfiler.LEADERBOARD, week.week, perf_counter() - started, 2 * len(games))
+            started = perf_counter()
+
+        #The batch hands back the scoring players directly, so no name lookups are needed.
+        goals = 0
+        for index in range(len(games)):
+            for scorer in outcomes.scorers(index):
+                scorer.goals += 1
+                goals += 1
+
+        if profiler is not None:
+            profiler.record(PhaseProfiler.GOAL_SCORERS, week.week, perf_counter() - started, goals)
+
+    def enable_profiling(self) -> PhaseProfiler:
+        """
+        Starts recording time and call counts per phase and per week of the simulation.
+        The phases are simulating the games, Team.add_result, leaderboard maintenance and crediting goal scorers.
+
+        Returns:
+            PhaseProfiler: The profiler being recorded into, also available as self.profiler.
+
+        Complexity: O(1)
+        """
+        if self.profiler is None:
+            self.profiler = PhaseProfiler()
+        return self.profiler
+
+    def disable_profiling(self) -> PhaseProfiler | None:
+        """
+        Stops recording and returns the profiler with everything recorded so far.
+
+        Complexity: O(1)
+        """
+        profiler, self.profiler = self.profiler, None
+        return profiler
+
+    def monte_carlo(self, n_seasons: int, workers: int | None = None, seed: int | None = None) -> MonteCarloSummary:
+        """
+        Simulates `n_seasons` independent replicas of the rest of the schedule, starting from the current
+        points, and aggregates the final standings.
+
+        The replicas only work on plain copies of the team points and of the fixtures,
+        so the real Team objects, the leaderboard and the schedule are left untouched.
+        Replicas are spread over a process pool. Replica r draws from RandomStream(seed).split(r),
+        split per week and game exactly like simulate_season, so the summary does not depend on how
+        replicas are split between workers, and replica r ends with the same points as
+        simulate_season(RandomStream(seed).split(r)) would give.
+
+        Args:
+            n_seasons (int): The number of season replicas to simulate.
+            workers (int or None): The number of worker processes. None uses every core,
+                1 runs everything in this process.
+            seed (int or None): The root seed of the replicas. None picks a random one.
+
+        Returns:
+            MonteCarloSummary: Title probability, expected points and finishing position counts per team.
+
+        Complexity:
+            Best Case Complexity: O(R * (G + N log N) / K)
+            Worst Case Complexity: O(R * (G + N log N) / K)
+
+            R is the number of replicas, G the number of games in the schedule,
+            N the number of teams and K the number of workers.
+            Each replica plays every game once and then sorts the teams by points.
+        """
+        if n_seasons <= 0:
+            raise ValueError("Please enter a positive number of seasons!")
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if seed is None:
+            seed = random.randrange(2 ** 63)
+
+        names = tuple(team.name for team in self.teams)
+        points = array("l", (team.points for team in self.teams))
+        weeks = self._fixture_indices()
+
+        # Several chunks per worker keep the pool busy when some replicas finish early.
+        chunks = min(n_seasons, workers * 4)
+        bounds = [n_seasons * chunk // chunks for chunk in range(chunks + 1)]
+        jobs = [(names, points, weeks, seed, bounds[i], bounds[i + 1]) for i in range(chunks)]
 
+        if workers == 1:
+            results = [_simulate_replicas(*job) for job in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_simulate_replicas, *zip(*jobs)))
+
+        num_teams = len(names)
+        titles = [0] * num_teams
+        total_points = [0] * num_teams
+        position_counts = [[0] * num_teams for _ in range(num_teams)]
+        for chunk_titles, chunk_points, chunk_positions in results:
+            for team in range(num_teams):
+                titles[team] += chunk_titles[team]
+                total_points[team] += chunk_points[team]
+                for position in range(num_teams):
+                    position_counts[team][position] += chunk_positions[team * num_teams + position]
+
+        forecasts = [
+            TeamForecast(names[team], titles[team] / n_seasons, total_points[team] / n_seasons, position_counts[team])
+            for team in range(num_teams)
+        ]
+        return MonteCarloSummary(n_seasons, forecasts)
+
+    def _fixture_indices(self) -> list[tuple[int, array]]:
+        """
+        Flattens the unplayed weeks of the schedule into team indices, in schedule order.
+        Each week becomes its week number and the home and away index of every game,
+        where indices refer to positions in self.teams.
+
+        Complexity:
+            Best Case Complexity: O(N + G)
+            Worst Case Complexity: O(N + G)
+
+            N is the number of teams and G the number of games in the schedule.
+        """
+        team_index = {team.name: index for index, team in enumerate(self.teams)}
+        weeks = []
+        for index in range(self.current_week, len(self.schedule)):
+            week = self.schedule[index]
+            if isinstance(week.games, FixtureList):
+                weeks.append((week.week, week.games.team_ids))
+                continue
+            fixtures = array("l")
+            for game in week:
+                fixtures.append(team_index[game.home_team.name])
+                fixtures.append(team_index[game.away_team.name])
+            weeks.append((week.week, fixtures))
+        return weeks
 
     def delay_week_of_games(self, orig_week: int, new_week: int | None = None) -> None:
         """
@@ -252,6 +840,9 @@ class Season:
             orig_week (int): The original week to move the games from.
             new_week (int or None): The new week to move the games to. If this is None, it moves the games to the end of the season.
 
+        Raises:
+            ValueError: When either week has already been played.
+
         Complexity:
             Best Case Complexity: O(1)
             Worst Case Complexity: O(W)
@@ -268,6 +859,9 @@ class Season:
             The worst case of O(W) occurs when the new_week index is at the start of the list, and this cause all the other
             "W" weeks to be moved one index to the right, resulting in an overall worst case complexity of O(W).
         """
+        if orig_week <= self.current_week or (new_week is not None and new_week <= self.current_week):
+            raise ValueError("Weeks that have already been played cannot be moved!")
+
         # find the index of the week to delay.
         orig_week_index = orig_week - 1
 
@@ -282,6 +876,112 @@ class Season:
             self.schedule.insert(new_week_index, delay_week)
 
 
+    def checkpoint(self) -> dict:
+        """
+        Captures everything simulating changes as JSON-compatible data: how many weeks were played,
+        the order of the schedule's week numbers, the leaderboard order, and each team's points,
+        history and player goals and stats. The schedule itself is not stored since it is rebuilt
+        from the teams, so a checkpoint must be restored into a Season built from the same teams.
+
+        Complexity:
+            Best Case Complexity: O(W + N * C)
+            Worst Case Complexity: O(W + N * C)
+
+            W is the number of weeks, N the number of teams and C the cost of Team.checkpoint.
+        """
+        return {
+            "version": self.CHECKPOINT_VERSION,
+            "current_week": self.current_week,
+            "schedule": [self._week_number_at(index) for index in range(len(self.schedule))],
+            "leaderboard": [team.name for team in self.leaderboard],
+            "teams": [team.checkpoint() for team in self.teams],
+        }
+
+    def restore_checkpoint(self, checkpoint: dict) -> None:
+        """
+        Puts the season back in the state captured by checkpoint(), without replaying any week.
+
+        Raises:
+            ValueError: When the checkpoint has another version or teams that are not in this season.
+
+        Complexity:
+            Best Case Complexity: O(W log W + N log N + N * C)
+            Worst Case Complexity: O(W log W + N * N + N * C)
+
+            See checkpoint, with C the cost of Team.restore_checkpoint. Checking the schedule sorts the
+            week numbers, and rebuilding the leaderboard costs one Leaderboard.add per team.
+        """
+        if checkpoint.get("version") != self.CHECKPOINT_VERSION:
+            raise ValueError("Unsupported checkpoint version!")
+
+        teams_by_name = {team.name: team for team in self.teams}
+        if len(checkpoint["teams"]) != len(teams_by_name) or any(
+                team_checkpoint["name"] not in teams_by_name for team_checkpoint in checkpoint["teams"]):
+            raise ValueError("The checkpoint belongs to a season with different teams!")
+
+        for team_checkpoint in checkpoint["teams"]:
+            teams_by_name[team_checkpoint["name"]].restore_checkpoint(team_checkpoint)
+
+        self.leaderboard = Leaderboard(self.leaderboard.deferred)
+        for name in checkpoint["leaderboard"]:
+            self.leaderboard.add(teams_by_name[name])
+
+        self._reorder_schedule(checkpoint["schedule"])
+        self.current_week = checkpoint["current_week"]
+
+    def save_checkpoint(self, path: str) -> None:
+        """
+        Writes checkpoint() to `path` as compact JSON.
+
+        Complexity:
+            See checkpoint.
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.checkpoint(), file, separators=(",", ":"))
+
+    def load_checkpoint(self, path: str) -> None:
+        """
+        Restores the checkpoint saved at `path` by save_checkpoint().
+
+        Complexity:
+            See restore_checkpoint.
+        """
+        with open(path, encoding="utf-8") as file:
+            self.restore_checkpoint(json.load(file))
+
+    def _week_number_at(self, index: int) -> int:
+        """
+        Returns the week number at schedule position `index`, without building a lazy week.
+
+        Complexity: O(1)
+        """
+        if isinstance(self.schedule, LazySchedule):
+            return self.schedule.week_number_at(index)
+        return self.schedule[index].week
+
+    def _reorder_schedule(self, week_numbers: list[int]) -> None:
+        """
+        Puts the schedule's weeks in the order given by their week numbers.
+
+        Raises:
+            ValueError: When `week_numbers` is not an ordering of this schedule's weeks.
+
+        Complexity:
+            Best Case Complexity: O(W log W)
+            Worst Case Complexity: O(W log W), W is the number of weeks.
+        """
+        if sorted(week_numbers) != sorted(self._week_number_at(index) for index in range(len(self.schedule))):
+            raise ValueError("The checkpoint schedule does not match this season!")
+
+        if isinstance(self.schedule, LazySchedule):
+            self.schedule.reorder(week_numbers)
+            return
+
+        weeks = {week.week: week for week in self.schedule}
+        self.schedule = ArrayList()
+        for week_number in week_numbers:
+            self.schedule.append(weeks[week_number])
+
     def __len__(self) -> int:
         """
         Returns the number of teams in the season.
@@ -315,3 +1015,50 @@ class Season:
         """Returns a string representation of the Season object.
         Useful for debugging or when the Season is held in another data structure."""
         return str(self)
+
+
+def _simulate_replicas(names: tuple[str, ...], points: array, weeks: list[tuple[int, array]],
+                       seed: int, start: int, stop: int) -> tuple[list[int], list[int], list[int]]:
+    """
+    Worker for Season.monte_carlo: simulates replicas start..stop-1 and returns their aggregated standings.
+
+    Only the goal counts decide the standings, so goal scorers are not drawn here. They are drawn
+    after the goals from each game's stream, so skipping them leaves the goals unchanged.
+    Teams are ranked like Team.__lt__ does: most points first, ties broken by name.
+
+    Returns:
+        tuple: Title counts per team, total points per team and the flattened
+            team-by-position finishing counts.
+    """
+    num_teams = len(names)
+    titles = [0] * num_teams
+    total_points = [0] * num_teams
+    position_counts = [0] * (num_teams * num_teams)
+    win, draw = int(TeamGameResult.WIN), int(TeamGameResult.DRAW)
+    root = RandomStream(seed)
+
+    for replica in range(start, stop):
+        replica_rng = root.split(replica)
+        replica_points = list(points)
+
+        for week, fixtures in weeks:
+            week_rng = replica_rng.split(week)
+            for game in range(0, len(fixtures), 2):
+                choice = week_rng.split(game // 2).random_choice
+                home_goals = choice(GOAL_DISTRIBUTION)
+                away_goals = choice(GOAL_DISTRIBUTION)
+                if home_goals > away_goals:
+                    replica_points[fixtures[game]] += win
+                elif home_goals < away_goals:
+                    replica_points[fixtures[game + 1]] += win
+                else:
+                    replica_points[fixtures[game]] += draw
+                    replica_points[fixtures[game + 1]] += draw
+
+        standings = sorted(range(num_teams), key=lambda team: (-replica_points[team], names[team]))
+        titles[standings[0]] += 1
+        for position, team in enumerate(standings):
+            total_points[team] += replica_points[team]
+            position_counts[team * num_teams + position] += 1
+
+    return titles, total_points, position_counts
@@ -0,0 +1,458 @@
+from __future__ import annotations
+
+from array import array
+from typing import Callable, Iterable, Iterator, Mapping
+
+from data_structures.referential_array import ArrayR
+from lazy_double_table import LazyDoubleTable
+
+
+class StatSchema:
+    """
+    The stats of a league, stored column by column. Each stat name is interned to a column index the
+    first time it is set, and each player (see PlayerStats) owns one row.
+
+    Every row is `width` slots of two league-wide arrays, an int64 value and a uint32 stamp per slot,
+    so a player's stats cost 12 bytes per column and no per-player hash table: every stat name, its hash
+    and its hash table slot exist once per league. When a new column does not fit in the rows, the width
+    doubles and every row is copied once. Rows of players that are gone are cleared and handed out again.
+
+    Each row also has an epoch, starting at 1. A slot's stamp is 0 when the player does not have that
+    stat, and otherwise the row's epoch when the value was written. Bumping a row's epoch therefore
+    resets all its stats to 0 at once (see PlayerStats.reset): their stamps are stale, so their values
+    read as 0, while the non-zero stamps keep the stats present.
+
+    Columns are never removed: a stat deleted from one player may still be held by others.
+    """
+
+    INITIAL_WIDTH = 8
+
+    def __init__(self) -> None:
+        """
+        No complexity analysis is required for this function.
+        """
+        self.__columns: LazyDoubleTable[int] = LazyDoubleTable()
+        self.__names: list[str] = []
+        self.__width = self.INITIAL_WIDTH
+        self.__values = array("q")
+        self.__stamps = array("I")
+        self.__epochs = array("I")
+        self.__rows = 0
+        self.__free: list[int] = []
+
+    def __len__(self) -> int:
+        """
+        Returns the number of columns.
+        """
+        return len(self.__names)
+
+    @property
+    def width(self) -> int:
+        """
+        Returns the number of slots per row; row `r` starts at slot r * width of `values` and `stamps`.
+        """
+        return self.__width
+
+    @property
+    def values(self) -> array:
+        """
+        Returns the value array of every row. It is replaced when the schema widens or gains rows.
+        """
+        return self.__values
+
+    @property
+    def stamps(self) -> array:
+        """
+        Returns the stamp array of every row. It is replaced when the schema widens or gains rows.
+        """
+        return self.__stamps
+
+    @property
+    def epochs(self) -> array:
+        """
+        Returns the epoch of every row, indexed by row.
+        """
+        return self.__epochs
+
+    def __contains__(self, name: str) -> bool:
+        """
+        Checks whether `name` has a column.
+
+        :complexity: See LazyDoubleTable.__contains__.
+        """
+        return name in self.__columns
+
+    def __getitem__(self, name: str) -> int:
+        """
+        Returns the column of `name`.
+
+        :complexity: See LazyDoubleTable.__getitem__.
+        :raises KeyError: when `name` has no column.
+        """
+        return self.__columns[name]
+
+    def intern(self, name: str) -> int:
+        """
+        Returns the column of `name`, giving it the next column first when it has none.
+
+        Complexity:
+            Best Case Complexity: O(len(name)), when `name` is found on its first probe.
+            Worst Case Complexity: O(S + R * C), when the name table is probed through and the rows are widened,
+            S being the size of the name table, R the number of rows and C the number of columns.
+        """
+        try:
+            return self.__columns[name]
+        except KeyError:
+            column = len(self.__names)
+            if column >= self.__width:
+                self.__widen(2 * self.__width)
+            self.__columns[name] = column
+            self.__names.append(name)
+            return column
+
+    def name(self, column: int) -> str:
+        """
+        Returns the stat name of `column`.
+
+        Complexity: O(1)
+        """
+        return self.__names[column]
+
+    def names(self) -> ArrayR[str]:
+        """
+        Returns every stat name, in column order.
+
+        complexity: O(C), C is the number of columns.
+        """
+        res = ArrayR(len(self.__names))
+        for column, name in enumerate(self.__names):
+            res[column] = name
+        return res
+
+    def allocate_row(self) -> int:
+        """
+        Returns a row with no stats set, reusing a released row when there is one.
+
+        Complexity: O(W) amortised, W is the width.
+        """
+        if self.__free:
+            return self.__free.pop()
+
+        row = self.__rows
+        self.__rows += 1
+        self.__values.extend(array("q", bytes(8 * self.__width)))
+        self.__stamps.extend(array("I", bytes(4 * self.__width)))
+        self.__epochs.append(1)
+        return row
+
+    def release_row(self, row: int) -> None:
+        """
+        Clears `row` and keeps it for the next allocate_row.
+
+        Complexity: O(W), W is the width.
+        """
+        start, width = row * self.__width, self.__width
+        self.__values[start:start + width] = array("q", bytes(8 * width))
+        self.__stamps[start:start + width] = array("I", bytes(4 * width))
+        self.__free.append(row)
+
+    def __widen(self, width: int) -> None:
+        """
+        Copies every row into new arrays of `width` slots per row.
+
+        Complexity: O(R * W), R is the number of rows and W the new width.
+        """
+        old_width, old_values, old_stamps = self.__width, self.__values, self.__stamps
+        values = array("q", bytes(8 * width * self.__rows))
+        stamps = array("I", bytes(4 * width * self.__rows))
+        for row in range(self.__rows):
+            old, new = row * old_width, row * width
+            values[new:new + old_width] = old_values[old:old + old_width]
+            stamps[new:new + old_width] = old_stamps[old:old + old_width]
+
+        self.__width, self.__values, self.__stamps = width, values, stamps
+
+
+
+
+class PlayerStats:
+    """
+    One player's stats: a row of a StatSchema, keyed by stat name. It offers the parts of the
+    LazyDoubleTable interface that Player uses, and value_at for reading a column directly.
+
+    A stat's value is the one in its slot only while the slot's stamp matches the row's epoch, and 0
+    once the row has been reset since; see StatSchema.
+
+    The row belongs to this PlayerStats until release() hands it back to the schema, so two PlayerStats
+    never share a row. Stats that are dropped without release() give their row back when they are
+    garbage collected, which is best-effort: until then the row stays allocated.
+    """
+
+    __slots__ = ("__schema", "__row", "__length")
+
+    # Largest epoch a stamp can hold; a reset at this epoch rewrites the row's stamps instead.
+    MAX_EPOCH = 2 ** 32 - 1
+
+    def __init__(self, schema: StatSchema) -> None:
+        """
+        No complexity analysis is required for this function.
+        """
+        self.__schema = schema
+        self.__row = schema.allocate_row()
+        self.__length = 0
+
+    def release(self) -> None:
+        """
+        Clears the player's row and hands it back to the schema. The stats must not be used afterwards;
+        releasing them again does nothing.
+
+        Complexity: See StatSchema.release_row.
+        """
+        if self.__row is not None:
+            self.__schema.release_row(self.__row)
+            self.__row = None
+
+    def __del__(self) -> None:
+        """
+        Best-effort release for stats dropped without release(). When, and whether, this runs depends on
+        the garbage collector, so owners that replace or discard stats call release() themselves.
+        """
+        self.release()
+
+    @classmethod
+    def from_items(cls, items: Iterable[tuple[str, int]] | Mapping[str, int], size_hint: int | None = None,
+                   schema: StatSchema | None = None) -> PlayerStats:
+        """
+        Builds the stats of `items`, (name, value) pairs or a mapping, on `schema` (a new one when None).
+        `size_hint` is accepted for compatibility with LazyDoubleTable.from_items and is not needed.
+
+        Complexity: See update.
+        """
+        stats = cls(schema if schema is not None else StatSchema())
+        stats.update(items)
+        return stats
+
+    @property
+    def schema(self) -> StatSchema:
+        return self.__schema
+
+    def __len__(self) -> int:
+        """
+        Returns the number of stats the player has.
+        """
+        return self.__length
+
+    def is_empty(self) -> bool:
+        return self.__length == 0
+
+    def __slot(self, name: str) -> int:
+        """
+        Returns the slot of the stat `name` in the schema's arrays, when the player has that stat.
+
+        :complexity: See StatSchema.__getitem__.
+        :raises KeyError: when the player does not have the stat.
+        """
+        schema = self.__schema
+        slot = self.__row * schema.width + schema[name]
+        if not schema.stamps[slot]:
+            raise KeyError(name)
+        return slot
+
+    def __value(self, slot: int) -> int:
+        """
+        Returns the value in `slot`, 0 when it was written before the row's last reset.
+
+        Complexity: O(1)
+        """
+        schema = self.__schema
+        if schema.stamps[slot] != schema.epochs[self.__row]:
+            return 0
+        return schema.values[slot]
+
+    def __write(self, slot: int, data: int) -> None:
+        """
+        Writes `data` into `slot`, stamped with the row's epoch.
+
+        Complexity: O(1)
+        """
+        schema = self.__schema
+        schema.values[slot] = data
+        if not schema.stamps[slot]:
+            self.__length += 1
+        schema.stamps[slot] = schema.epochs[self.__row]
+
+    def __contains__(self, name: str) -> bool:
+        """
+        Checks whether the player has the stat `name`.
+
+        :complexity: See StatSchema.__getitem__.
+        """
+        try:
+            self.__slot(name)
+        except KeyError:
+            return False
+        return True
+
+    def __getitem__(self, name: str) -> int:
+        """
+        Returns the value of the stat `name`.
+
+        :complexity: See StatSchema.__getitem__, plus O(1) for the array reads.
+        :raises KeyError: when the player does not have the stat.
+        """
+        return self.__value(self.__slot(name))
+
+    def value_at(self, column: int) -> int:
+        """
+        Returns the value in `column`, 0 when the player does not have that stat.
+
+        Complexity: O(1)
+        """
+        return self.__value(self.__row * self.__schema.width + column)
+
+    def __setitem__(self, name: str, data: int) -> None:
+        """
+        Sets the stat `name` to `data`, interning `name` in the schema when it is new to the league.
+
+        :complexity: See StatSchema.intern, plus O(1) for the array writes.
+        :raises TypeError: when `data` is not an int.
+        :raises OverflowError: when `data` does not fit in 64 bits.
+        """
+        column = self.__schema.intern(name)
+        self.__write(self.__row * self.__schema.width + column, data)
+
+    def __delitem__(self, name: str) -> None:
+        """
+        Removes the stat `name` from the player. Its column stays in the schema.
+
+        :complexity: See StatSchema.__getitem__.
+        :raises KeyError: when the player does not have the stat.
+        """
+        slot = self.__slot(name)
+        self.__schema.values[slot] = 0
+        self.__schema.stamps[slot] = 0
+        self.__length -= 1
+
+    def update(self, items: Iterable[tuple[str, int]] | Mapping[str, int], size_hint: int | None = None) -> None:
+        """
+        Sets every (name, value) pair of `items`, or every item of a mapping. `size_hint` is accepted
+        for compatibility with LazyDoubleTable.update and is not needed.
+
+        Complexity: O(M) calls to __setitem__, M is the number of items.
+        """
+        if hasattr(items, "items"):
+            items = items.items()
+        for name, data in items:
+            self[name] = data
+
+    def reset(self) -> None:
+        """
+        Sets every stat the player has to 0, keeping them all present, by bumping the row's epoch.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(C), C is the number of columns; O(1) amortised.
+
+            Justification:
+            Stamps of the old epoch no longer match, so every value reads as 0 without being touched. Only when
+            the epoch reaches MAX_EPOCH are the row's stamps rewritten to start over, an O(C) reset that happens
+            once every MAX_EPOCH resets.
+        """
+        schema = self.__schema
+        epoch = schema.epochs[self.__row]
+        if epoch < self.MAX_EPOCH:
+            schema.epochs[self.__row] = epoch + 1
+            return
+
+        for _, slot in self.__columns():
+            schema.values[slot] = 0
+            schema.stamps[slot] = 1
+        schema.epochs[self.__row] = 1
+
+    def __columns(self) -> Iterator[tuple[int, int]]:
+        """
+        Yields the (column, slot) of every stat the player has, in column order.
+
+        complexity: O(C) for the whole iteration, C is the number of columns.
+        """
+        schema = self.__schema
+        start, stamps = self.__row * schema.width, schema.stamps
+        for column in range(len(schema)):
+            if stamps[start + column]:
+                yield column, start + column
+
+    def fill_values(self, data: int) -> None:
+        """
+        Sets the value of every stat the player has to `data`. See reset for setting them all to 0.
+
+        complexity: O(C), C is the number of columns.
+        """
+        for _, slot in self.__columns():
+            self.__write(slot, data)
+
+    def map_values(self, function: Callable[[int], int]) -> None:
+        """
+        Replaces the value of every stat the player has with function(value).
+
+        complexity: O(C), plus the cost of the calls to `function`.
+        """
+        for _, slot in self.__columns():
+            self.__write(slot, function(self.__value(slot)))
+
+    def iter_keys(self) -> Iterator[str]:
+        """
+        Yields the name of every stat the player has, in column order.
+
+        complexity: O(C) for the whole iteration.
+        """
+        for column, _ in self.__columns():
+            yield self.__schema.name(column)
+
+    def iter_values(self) -> Iterator[int]:
+        """
+        Yields the value of every stat the player has, in column order.
+
+        complexity: O(C) for the whole iteration.
+        """
+        for _, slot in self.__columns():
+            yield self.__value(slot)
+
+    def items(self) -> Iterator[tuple[str, int]]:
+        """
+        Yields every (name, value) pair the player has, in column order.
+
+        complexity: O(C) for the whole iteration.
+        """
+        for column, slot in self.__columns():
+            yield self.__schema.name(column), self.__value(slot)
+
+    def keys(self) -> ArrayR[str]:
+        """
+        Returns the name of every stat the player has.
+
+        complexity: O(C)
+        """
+        res = ArrayR(self.__length)
+        for i, name in enumerate(self.iter_keys()):
+            res[i] = name
+        return res
+
+    def values(self) -> ArrayR[int]:
+        """
+        Returns the value of every stat the player has.
+
+        complexity: O(C)
+        """
+        res = ArrayR(self.__length)
+        for i, data in enumerate(self.iter_values()):
+            res[i] = data
+        return res
+
+    def __str__(self) -> str:
+        """
+        Returns all the name/value pairs, in column order.
+        """
+        result = ""
+        for name, value in self.items():
+            result += "(" + str(name) + "," + str(value) + ")\n"
+        return result
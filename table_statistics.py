@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from typing import Any
+
+
+class TableStatistics:
+    """
+    Probe lengths, resizes and load of one hash table, recorded while statistics are enabled on it
+    (see LazyDoubleTable.enable_statistics and HashyDateTable.enable_statistics).
+
+    A lookup that finds its key is a hit; a lookup for a missing key, or an insert of a new key,
+    is a miss. The probe length of each is counted in a histogram, so a long tail of clustered
+    keys shows up even when the average looks healthy. Load factor and tombstones are read from
+    the table itself whenever a report is made.
+    """
+
+    def __init__(self, table: Any) -> None:
+        """
+        Args:
+            table: The hash table the numbers are recorded for.
+
+        No complexity analysis is required for this function.
+        """
+        self.table = table
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Forgets everything recorded so far.
+
+        Complexity: O(1)
+        """
+        self.hit_histogram: dict[int, int] = {}
+        self.miss_histogram: dict[int, int] = {}
+        self.max_probes = 0
+        self.rehashes = 0
+        self.rehash_seconds = 0.0
+
+    def record_hit(self, probes: int) -> None:
+        """
+        Records a lookup that found its key after `probes` slots.
+
+        Complexity: O(1)
+        """
+        self.hit_histogram[probes] = self.hit_histogram.get(probes, 0) + 1
+        if probes > self.max_probes:
+            self.max_probes = probes
+
+    def record_miss(self, probes: int) -> None:
+        """
+        Records a lookup or insert that found its key missing after `probes` slots.
+
+        Complexity: O(1)
+        """
+        self.miss_histogram[probes] = self.miss_histogram.get(probes, 0) + 1
+        if probes > self.max_probes:
+            self.max_probes = probes
+
+    def record_rehash(self, seconds: float) -> None:
+        """
+        Records a resize of the table that took `seconds`.
+
+        Complexity: O(1)
+        """
+        self.rehashes += 1
+        self.rehash_seconds += seconds
+
+    @staticmethod
+    def __summarise(histogram: dict[int, int]) -> tuple[int, float]:
+        """
+        Returns the number of lookups in `histogram` and their average probe length.
+
+        Complexity: O(P), P is the number of distinct probe lengths.
+        """
+        count = sum(histogram.values())
+        total = sum(probes * times for probes, times in histogram.items())
+        return count, total / count if count else 0.0
+
+    def report(self) -> dict:
+        """
+        Returns the recorded numbers, and the table's current load, as plain data:
+
+            {"length": int, "table_size": int, "load_factor": float, "tombstones": int,
+             "hits": int, "average_hit_probes": float, "hit_histogram": {probes: count},
+             "misses": int, "average_miss_probes": float, "miss_histogram": {probes: count},
+             "max_probes": int, "rehashes": int, "rehash_seconds": float}
+
+        Complexity: O(P), P is the number of distinct probe lengths recorded.
+        """
+        hits, average_hit = self.__summarise(self.hit_histogram)
+        misses, average_miss = self.__summarise(self.miss_histogram)
+        length = len(self.table)
+        table_size = self.table.table_size
+        return {
+            "length": length,
+            "table_size": table_size,
+            "load_factor": length / table_size,
+            "tombstones": getattr(self.table, "tombstones", 0),
+            "hits": hits,
+            "average_hit_probes": average_hit,
+            "hit_histogram": dict(sorted(self.hit_histogram.items())),
+            "misses": misses,
+            "average_miss_probes": average_miss,
+            "miss_histogram": dict(sorted(self.miss_histogram.items())),
+            "max_probes": self.max_probes,
+            "rehashes": self.rehashes,
+            "rehash_seconds": self.rehash_seconds,
+        }
+
+    def __str__(self) -> str:
+        """
+        Returns the report as a few readable lines.
+
+        Complexity analysis not required.
+        """
+        report = self.report()
+        return "\n".join([
+            f"load {report['length']}/{report['table_size']} ({report['load_factor']:.1%}), "
+            f"{report['tombstones']} tombstones",
+            f"hits {report['hits']} (avg {report['average_hit_probes']:.2f} probes), "
+            f"misses {report['misses']} (avg {report['average_miss_probes']:.2f} probes), "
+            f"max {report['max_probes']} probes",
+            f"rehashes {report['rehashes']} ({report['rehash_seconds']:.6f}s)",
+        ])
+
+    def __repr__(self) -> str:
+        return str(self)
@@ -8,12 +8,19 @@ from typing import Collection, TypeVar
 from data_structures import *
 from hashy_date_table import HashyDateTable
 from lazy_double_table import LazyDoubleTable
+from stat_schema import StatSchema
 
 T = TypeVar("T")
 
 
 class Team:
-    def __init__(self, team_name: str, initial_players: ArrayR[Player], history_length: int) -> None:
+    # The hash tables behind player lookup and blog posts. Any HashTable[str, V] with the same bulk API
+    # as LazyDoubleTable (from_items) can be used for players, e.g. RobinHoodTable or CuckooTable.
+    PLAYER_TABLE = LazyDoubleTable
+    POSTS_TABLE = HashyDateTable
+
+    def __init__(self, team_name: str, initial_players: ArrayR[Player], history_length: int,
+                 schema: StatSchema | None = None) -> None:
         """
         Constructor for the Team class
 
@@ -21,6 +28,8 @@ class Team:
             team_name (str): The name of the team
             initial_players (ArrayR[Player]): The players the team starts with initially
             history_length (int): The number of `GameResult`s to store in the history
+            schema (StatSchema): The stat columns of the team's league, a new one by default. The players' stats
+                are moved onto it, see Player.use_schema.
 
         Returns:
             None
@@ -33,11 +42,15 @@ class Team:
 
             Both best and worst case complexities are O(P) for the init function. Most of the operations
             in the init function are performed in constant time, except the part where the initial players are 
-            added into the Array of Linked Lists. We do this by calling the add_player() method which takes O(1)
-            time in both best and worst case. However, since we are meant to store all the player it takes O(P) * O(1)
-            time, simplfying the best and worst case complexity for the function to O(P), where P is the number of initial players.
+            added into the Array of Linked Lists, which takes O(1) per player. The hash table("player_search") is
+            built with PLAYER_TABLE.from_items, which sizes it once for all P players instead of rehashing at
+            every table size on the way, so filling it is O(P) as well. This simplifies the best and worst case
+            complexity for the function to O(P), where P is the number of initial players. (Moving the players'
+            stats onto the team's schema adds the cost of Player.use_schema for each of them, nothing when
+            they are on it already.)
         """
         self.name = team_name
+        self.schema = schema if schema is not None else StatSchema()
         self.points = 0
         self.history_length = history_length
 
@@ -48,13 +61,16 @@ class Team:
             self.players[i] = LinkedList()
         
         #used to aid process of lookup and deletion of players.
-        self.player_search = LazyDoubleTable()
+        self.player_search = self.PLAYER_TABLE.from_items(
+            ((player.name, player) for player in initial_players), len(initial_players)
+        )
 
         for player in initial_players:
-            self.add_player(player)
+            player.use_schema(self.schema)
+            self.players[self.__position_index(player.position)].append(player)
 
         self.history = CircularQueue(history_length)
-        self.posts = HashyDateTable()
+        self.posts = self.POSTS_TABLE()
 
     def add_player(self, player: Player) -> None:
         """
@@ -79,24 +95,55 @@ class Team:
             Worst Case:
             Worst case occurs if the hash table("player_search") needs to rehash due to hitting the load factor limit,
             requiring re-insertion of all entries, which takes O(S) time.
+            A player from another league also has their stats moved onto the team's schema, see Player.use_schema.
         """
-        if player.position == PlayerPosition.GOALKEEPER:
-            position_index = 0
+        player.use_schema(self.schema)
+        self.players[self.__position_index(player.position)].append(player)
+        self.player_search[player.name] = player 
+
+    def use_schema(self, schema: StatSchema) -> None:
+        """
+        Makes `schema` the stat columns of the team and moves every player's stats onto it, so that teams
+        playing in one season share one schema.
+
+        Args:
+            schema (StatSchema): The schema of the team's league
+
+        Complexity:
+            Best Case Complexity: O(1), when the team already uses `schema`.
+            Worst Case Complexity: O(P * U), P is the number of players and U the cost of Player.use_schema.
+        """
+        if schema is self.schema:
+            return
+        self.schema = schema
+        for player in self.player_search.iter_values():
+            player.use_schema(schema)
+
+    @staticmethod
+    def __position_index(position: PlayerPosition) -> int:
+        """
+        Returns the index of the LinkedList in `players` that holds players of `position`.
+
+        Raises:
+            ValueError: When the position is not a valid PlayerPosition.
+
+        Complexity:
+            Best Case Complexity: O(1)
+            Worst Case Complexity: O(1)
+        """
+        if position == PlayerPosition.GOALKEEPER:
+            return 0
         
-        elif player.position == PlayerPosition.DEFENDER:
-            position_index = 1
+        elif position == PlayerPosition.DEFENDER:
+            return 1
         
-        elif player.position == PlayerPosition.MIDFIELDER:
-            position_index = 2
+        elif position == PlayerPosition.MIDFIELDER:
+            return 2
         
-        elif player.position == PlayerPosition.STRIKER:
-            position_index = 3
-
-        else:
-            raise ValueError("Please enter a valid Player Position!")
+        elif position == PlayerPosition.STRIKER:
+            return 3
 
-        self.players[position_index].append(player)
-        self.player_search[player.name] = player 
+        raise ValueError("Please enter a valid Player Position!")
 
     def remove_player(self, player: Player) -> None:
         """
@@ -279,6 +326,42 @@ class Team:
 
         return team_results
     
+    def checkpoint(self) -> dict:
+        """
+        Returns the state the team builds up during a season as JSON-compatible data:
+        its points, its result history (oldest first) and the checkpoint of every player.
+
+        Complexity:
+            Best Case Complexity: O(H + P * C)
+            Worst Case Complexity: O(H + P * C)
+
+            H is the history length, P the number of players and C the number of stat columns, see Player.checkpoint.
+        """
+        history = self.get_history()
+        return {
+            "name": self.name,
+            "points": self.points,
+            "history": [int(result) for result in history] if history is not None else [],
+            "players": [player.checkpoint() for player in self.get_players()],
+        }
+
+    def restore_checkpoint(self, checkpoint: dict) -> None:
+        """
+        Replaces the team's points, history and player state with those saved by checkpoint().
+
+        Raises:
+            KeyError: When the checkpoint has a player that is not in the team.
+
+        Complexity:
+            See checkpoint.
+        """
+        self.points = checkpoint["points"]
+        self.history = CircularQueue(self.history_length)
+        for result in checkpoint["history"]:
+            self.history.append(TeamGameResult(result))
+        for player_checkpoint in checkpoint["players"]:
+            self.player_search[player_checkpoint["name"]].restore_checkpoint(player_checkpoint)
+
     def make_post(self, post_date: str, post_content: str) -> None:
         """
         Publish a team blog `post` for a particular `post_date`.
@@ -0,0 +1,79 @@
+import math
+import random
+import unittest
+
+from lazy_double_table import LazyDoubleTable
+from run_tests import COMPLEXITY_CLASSES, ComplexityTestCase, fit_complexity, parse_complexity
+
+
+def filled_table(size: int) -> tuple[LazyDoubleTable[int], list[str]]:
+    """
+    Returns a table of `size` keys, and 64 of its keys to look up.
+    """
+    keys = [f"key {index}" for index in range(size)]
+    table = LazyDoubleTable.from_items((key, index) for index, key in enumerate(keys))
+    return table, random.Random(size).choices(keys, k=64)
+
+
+class TestFitComplexity(unittest.TestCase):
+
+    def fitted(self, growth) -> str:
+        samples = [(2 ** exponent, 1e-6 * growth(2 ** exponent)) for exponent in range(4, 17, 2)]
+        return COMPLEXITY_CLASSES[fit_complexity(samples)[0]][0]
+
+    def test_neighbouring_classes(self):
+        """
+        #name(The fit tells neighbouring complexity classes apart)
+        """
+        self.assertEqual(self.fitted(lambda n: 1.0), "O(1)")
+        self.assertEqual(self.fitted(lambda n: math.log2(n)), "O(log N)")
+        self.assertEqual(self.fitted(lambda n: n), "O(N)")
+        self.assertEqual(self.fitted(lambda n: n * math.log2(n)), "O(N log N)")
+        self.assertEqual(self.fitted(lambda n: n * n), "O(N^2)")
+
+    def test_constant_overhead(self):
+        """
+        #name(A fixed cost per call does not hide linear growth)
+        """
+        self.assertEqual(self.fitted(lambda n: 50 + n), "O(N)")
+
+    def test_parse_complexity(self):
+        """
+        #name(Complexity tags are parsed regardless of spaces and case)
+        """
+        self.assertEqual(parse_complexity("o(n LOG n)"), 3)
+        self.assertRaises(ValueError, parse_complexity, "O(2^N)")
+
+
+class TestLazyDoubleTableComplexity(ComplexityTestCase):
+
+    def test_lookup(self):
+        """
+        #name(LazyDoubleTable lookups take constant time on average)
+        #complexity(O(1))
+        """
+        def lookup(state) -> None:
+            table, keys = state
+            for key in keys:
+                table[key]
+
+        self.assert_complexity(filled_table, lookup)
+
+    def test_keys(self):
+        """
+        #name(LazyDoubleTable.keys is linear in the number of entries)
+        #complexity(O(N))
+        """
+        self.assert_complexity(filled_table, lambda state: state[0].keys())
+
+    def test_detects_linear_scan(self):
+        """
+        #name(A linear scan declared as constant time fails)
+        #complexity(O(1))
+        """
+        with self.assertRaises(self.failureException):
+            self.assert_complexity(lambda size: list(range(size)), lambda values: -1 in values)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import sys
+import threading
+import unittest
+
+from concurrent_lazy_double_table import ConcurrentLazyDoubleTable
+
+KNOWN_KEYS = 200
+WRITES = 20000
+READERS = 4
+
+
+class TestConcurrentLazyDoubleTable(unittest.TestCase):
+
+    def setUp(self):
+        # Switch threads often, so reads land in the middle of inserts and rehashes.
+        self.switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+    def tearDown(self):
+        sys.setswitchinterval(self.switch_interval)
+
+    def test_reads_during_rehashes(self):
+        """
+        #name(Readers see the right value for every known key while a writer rehashes the table)
+        """
+        table = ConcurrentLazyDoubleTable()
+        for index in range(KNOWN_KEYS):
+            table[f"known {index}"] = index
+        statistics = table.enable_statistics()
+        errors: list[str] = []
+        reads = [0] * READERS
+        done = threading.Event()
+
+        def write() -> None:
+            try:
+                for index in range(WRITES):
+                    table[f"new {index}"] = index
+                    if index % 100 == 0:
+                        # Rewrites a known key with its own value, so it is always readable.
+                        table[f"known {index % KNOWN_KEYS}"] = index % KNOWN_KEYS
+            finally:
+                done.set()
+
+        def read(reader: int) -> None:
+            index = reader
+            while not done.is_set() or reads[reader] < KNOWN_KEYS:
+                key = f"known {index % KNOWN_KEYS}"
+                try:
+                    value = table[key]
+                except KeyError:
+                    errors.append(f"KeyError for {key}")
+                else:
+                    if value != index % KNOWN_KEYS:
+                        errors.append(f"{key} read as {value}")
+                    if key not in table:
+                        errors.append(f"{key} missing")
+                reads[reader] += 1
+                index += 1
+
+        threads = [threading.Thread(target=read, args=(reader,)) for reader in range(READERS)]
+        threads.append(threading.Thread(target=write))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertGreaterEqual(statistics.rehashes, 3)
+        self.assertTrue(all(reads))
+        self.assertEqual(table.version % 2, 0)
+        self.assertEqual(len(table), KNOWN_KEYS + WRITES)
+        self.assertTrue(all(table[f"new {index}"] == index for index in range(WRITES)))
+
+    def test_read_inside_write(self):
+        """
+        #name(The writing thread can read the table in the middle of its own write)
+        """
+        table = ConcurrentLazyDoubleTable()
+        table.update({"one": 1, "b": 2})
+        table.map_values(lambda value: value + ("b" in table) + ("missing" in table))
+        self.assertEqual((table["one"], table["b"]), (2, 3))
+        self.assertEqual(table.version % 2, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
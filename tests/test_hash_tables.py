@@ -0,0 +1,153 @@
+import itertools
+import unittest
+
+from cuckoo_table import CuckooTable
+from data_structures.referential_array import ArrayR
+from hashy_date_table import HashyDateTable
+from lazy_double_table import LazyDoubleTable
+from robin_hood_table import RobinHoodTable
+
+
+def colliding_keys(blocks: int) -> list[str]:
+    """
+    Returns the 2^blocks keys made of "Aa" and "BB" blocks, which all share one LazyDoubleTable.full_hash.
+    """
+    return ["".join(parts) for parts in itertools.product(("Aa", "BB"), repeat=blocks)]
+
+
+class TestLazyDoubleTable(unittest.TestCase):
+
+    def test_shrink_with_sparse_sizes(self):
+        """
+        #name(Deleting from a table with no smaller size to shrink to only rebuilds for tombstones)
+        """
+        table = LazyDoubleTable(sizes=(5, 1009))
+        statistics = table.enable_statistics()
+        for index in range(400):
+            table[f"key {index}"] = index
+        rehashes = statistics.rehashes
+
+        for index in range(397):
+            del table[f"key {index}"]
+        self.assertEqual(table.table_size, 1009)
+        self.assertLessEqual(statistics.rehashes - rehashes, 397 // int(1009 * LazyDoubleTable.TOMBSTONE_LIMIT) + 1)
+        self.assertEqual([table[f"key {index}"] for index in range(397, 400)], [397, 398, 399])
+
+    def test_shrink(self):
+        """
+        #name(Deleting most keys moves the table to a smaller size)
+        """
+        table = LazyDoubleTable()
+        for index in range(1000):
+            table[f"key {index}"] = index
+        table_size = table.table_size
+        for index in range(990):
+            del table[f"key {index}"]
+        self.assertLess(table.table_size, table_size)
+        self.assertEqual(len(table), 10)
+        self.assertTrue(all(table[f"key {index}"] == index for index in range(990, 1000)))
+
+
+class TestCuckooTable(unittest.TestCase):
+
+    def test_equal_full_hashes(self):
+        """
+        #name(Keys with equal full hashes do not make the cuckoo table fail or balloon)
+        """
+        keys = colliding_keys(6)
+        self.assertEqual(len({LazyDoubleTable().full_hash(key) for key in keys}), 1)
+
+        table = CuckooTable()
+        table["AaAa"] = table["AaBB"] = table["BBAa"] = 1
+        table["BBBB"] = 2
+        self.assertEqual(len(table), 4)
+        self.assertEqual(table["BBBB"], 2)
+
+        table = CuckooTable()
+        for index, key in enumerate(keys):
+            table[key] = index
+        self.assertEqual(len(table), len(keys))
+        self.assertTrue(all(table[key] == index for index, key in enumerate(keys)))
+        self.assertLessEqual(table.table_size, 4 * len(keys) / CuckooTable.LOAD_LIMIT)
+
+    def test_growth(self):
+        """
+        #name(The cuckoo table grows past its last predefined size, only as far as its load limit needs)
+        """
+        table = CuckooTable(sizes=(5, 13))
+        for index in range(4000):
+            table[f"key {index}"] = index
+        self.assertEqual(len(table), 4000)
+        self.assertEqual(table[f"key {3999}"], 3999)
+        self.assertLessEqual(table.table_size, 4 * 4000 / CuckooTable.LOAD_LIMIT)
+
+
+class TestRobinHoodTable(unittest.TestCase):
+
+    def test_growth(self):
+        """
+        #name(The Robin Hood table grows past its last predefined size)
+        """
+        table = RobinHoodTable(sizes=(5, 13))
+        for index in range(1000):
+            table[f"key {index}"] = index
+        self.assertEqual(len(table), 1000)
+        self.assertTrue(all(table[f"key {index}"] == index for index in range(1000)))
+
+        table.reserve(5000)
+        self.assertGreaterEqual(table.table_size * RobinHoodTable.LOAD_LIMIT, 5000)
+
+    def test_overwrite_does_not_rehash(self):
+        """
+        #name(Overwriting a key in a full Robin Hood table does not rehash it)
+        """
+        table = RobinHoodTable()
+        statistics = table.enable_statistics()
+        for index in range(int(table.table_size * RobinHoodTable.LOAD_LIMIT)):
+            table[f"key {index}"] = index
+        rehashes, table_size = statistics.rehashes, table.table_size
+
+        table["key 0"] = -1
+        self.assertEqual(statistics.rehashes, rehashes)
+        self.assertEqual(table.table_size, table_size)
+        self.assertEqual(table["key 0"], -1)
+
+
+class TestHashyDateTable(unittest.TestCase):
+
+    def test_base_interface(self):
+        """
+        #name(HashyDateTable keeps LinearProbeTable's storage and return types)
+        """
+        table = HashyDateTable()
+        self.assertTrue(table.is_empty())
+        table["01/01/2020"] = "post"
+        self.assertFalse(table.is_empty())
+        self.assertIsInstance(table.keys(), ArrayR)
+        self.assertIsInstance(table.values(), ArrayR)
+
+    def test_statistics(self):
+        """
+        #name(HashyDateTable records the probe length of every lookup and insert)
+        """
+        table = HashyDateTable()
+        statistics = table.enable_statistics()
+        table["01/01/2020"] = "a"   # new, 1 probe
+        table["01/01/2020"] = "b"   # replaced, 1 probe
+        table["2021-01-01"] = "c"   # new, hashes to the slot of 01/01/2020, 2 probes
+        self.assertEqual(table["2021-01-01"], "c")   # 2 probes
+        self.assertNotIn("02/01/2020", table)   # missing, its slot is taken by 2021-01-01, 2 probes
+
+        report = statistics.report()
+        self.assertEqual(report["hit_histogram"], {1: 1, 2: 1})
+        self.assertEqual(report["miss_histogram"], {1: 1, 2: 2})
+        self.assertEqual(report["rehashes"], 0)
+
+        for day in range(1, 250):
+            table[f"{1990 + day // 28}-{day % 12 + 1:02d}-{day % 28 + 1:02d}"] = "post"
+        self.assertEqual(statistics.report()["rehashes"], 1)
+        self.assertEqual(table["2021-01-01"], "c")
+
+
+if __name__ == "__main__":
+    unittest.main()
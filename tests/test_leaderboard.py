@@ -0,0 +1,126 @@
+import random
+import unittest
+
+from data_structures.referential_array import ArrayR
+from enums import PlayerPosition
+from leaderboard import Leaderboard
+from player import Player
+from team import Team
+
+
+def make_teams(count: int) -> list[Team]:
+    """
+    Returns `count` teams of one player each, named so that their order by name is their index.
+    """
+    teams = []
+    for index in range(count):
+        players = ArrayR(1)
+        players[0] = Player(f"Player {index:03d}", PlayerPosition.STRIKER, 20)
+        teams.append(Team(f"Team {index:03d}", players, 5))
+    return teams
+
+
+class TestLeaderboard(unittest.TestCase):
+
+    DEFERRED = False
+
+    def setUp(self):
+        self.random = random.Random(1008)
+        self.teams = make_teams(40)
+        self.leaderboard = Leaderboard(self.DEFERRED)
+        for team in self.teams:
+            self.leaderboard.add(team)
+
+    def expected(self, teams=None) -> list[Team]:
+        """
+        Returns the teams sorted like Team.__lt__: most points first, ties broken by name.
+        """
+        return sorted(self.teams if teams is None else teams, key=lambda team: (-team.points, team.name))
+
+    def assertMatches(self, expected: list[Team]):
+        leaderboard = self.leaderboard
+        self.assertEqual(len(leaderboard), len(expected))
+        self.assertEqual(list(leaderboard), expected)
+        for index, team in enumerate(expected):
+            self.assertIn(team, leaderboard)
+            self.assertEqual(leaderboard.rank(team), index + 1)
+            self.assertIs(leaderboard[index], team)
+            self.assertIs(leaderboard[index - len(expected)], team)
+        for k in (0, 1, 5, len(expected), len(expected) + 3):
+            self.assertEqual(list(leaderboard.top(k)), expected[:k])
+
+    def score(self, team: Team) -> None:
+        team.points += self.random.choice((0, 1, 3))
+        self.leaderboard.update(team)
+
+    def test_add(self):
+        """
+        #name(A new leaderboard orders equal points by name)
+        """
+        self.assertMatches(self.expected())
+
+    def test_random_updates(self):
+        """
+        #name(Rank, top(k) and iteration match a sorted list after every week of random results)
+        """
+        for _ in range(30):
+            for team in self.random.sample(self.teams, 20):
+                self.score(team)
+            self.assertMatches(self.expected())
+
+    def test_single_updates(self):
+        """
+        #name(Rank and top(k) match a sorted list after every single result)
+        """
+        for _ in range(200):
+            self.score(self.random.choice(self.teams))
+            expected = self.expected()
+            team = self.random.choice(self.teams)
+            self.assertEqual(self.leaderboard.rank(team), expected.index(team) + 1)
+            self.assertEqual(list(self.leaderboard.top(3)), expected[:3])
+        self.assertMatches(self.expected())
+
+    def test_remove_and_add(self):
+        """
+        #name(Removing and re-adding teams between results keeps the order)
+        """
+        present = list(self.teams)
+        for _ in range(100):
+            team = self.random.choice(self.teams)
+            if team in present and self.random.random() < 0.5:
+                self.leaderboard.remove(team)
+                present.remove(team)
+            elif team not in present:
+                self.leaderboard.add(team)
+                present.append(team)
+            else:
+                self.score(team)
+        self.assertMatches(self.expected(present))
+
+        last = self.leaderboard.delete_at_index(-1)
+        present.remove(last)
+        self.assertNotIn(last, self.leaderboard)
+        self.assertMatches(self.expected(present))
+
+    def test_errors(self):
+        """
+        #name(Adding a team twice, removing a missing team and reading past the end raise)
+        """
+        with self.assertRaises(ValueError):
+            self.leaderboard.add(self.teams[0])
+        self.leaderboard.remove(self.teams[0])
+        with self.assertRaises(ValueError):
+            self.leaderboard.remove(self.teams[0])
+        with self.assertRaises(ValueError):
+            self.leaderboard.rank(self.teams[0])
+        with self.assertRaises(IndexError):
+            self.leaderboard[len(self.teams) - 1]
+
+
+class TestDeferredLeaderboard(TestLeaderboard):
+
+    DEFERRED = True
+
+
+if __name__ == "__main__":
+    unittest.main()
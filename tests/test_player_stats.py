@@ -0,0 +1,227 @@
+import unittest
+
+from data_structures.referential_array import ArrayR
+from enums import PlayerPosition
+from player import Player
+from season import Season
+from stat_schema import PlayerStats, StatSchema
+from team import Team
+
+
+def make_team(name: str, count: int = 2) -> Team:
+    """
+    Returns a team of `count` strikers, each with a "goals" stat and a stat named after the team.
+    """
+    players = ArrayR(count)
+    for index in range(count):
+        player = Player(f"{name} {index}", PlayerPosition.STRIKER, 20)
+        player["goals"] = index
+        player[f"{name} caps"] = 10 + index
+        players[index] = player
+    return Team(name, players, 5)
+
+
+class TestPlayerInterface(unittest.TestCase):
+
+    def test_get_and_set(self):
+        """
+        #name(Player stats read, write, update and delete like a hash table of str to int)
+        """
+        player = Player("Kane", PlayerPosition.STRIKER, 30)
+        player["goals"] = 3
+        player["assists"] = 1
+        player["goals"] = 4
+        self.assertEqual(player["goals"], 4)
+        self.assertEqual(player["assists"], 1)
+        with self.assertRaises(KeyError):
+            player["saves"]
+
+        player.update_stats({"saves": 2, "goals": 5})
+        self.assertEqual(dict(player.stats.items()), {"goals": 5, "assists": 1, "saves": 2})
+        self.assertEqual(len(player.stats), 3)
+
+        del player.stats["assists"]
+        self.assertNotIn("assists", player.stats)
+        self.assertEqual(len(player.stats), 2)
+        self.assertEqual(sorted(player.stats.keys()), ["goals", "saves"])
+
+    def test_int64_values(self):
+        """
+        #name(Stats hold 64-bit integers only)
+        """
+        player = Player("Kane", PlayerPosition.STRIKER, 30)
+        player["big"] = 2 ** 63 - 1
+        player["small"] = -2 ** 63
+        self.assertEqual(player["big"], 2 ** 63 - 1)
+        self.assertEqual(player["small"], -2 ** 63)
+        with self.assertRaises(OverflowError):
+            player["goals"] = 2 ** 63
+        with self.assertRaises(TypeError):
+            player["goals"] = "three"
+
+
+class TestStatSchema(unittest.TestCase):
+
+    def test_intern(self):
+        """
+        #name(Each stat name gets one column per schema, shared by every row)
+        """
+        schema = StatSchema()
+        first, second = PlayerStats(schema), PlayerStats(schema)
+        first["goals"] = 1
+        second["assists"] = 2
+        second["goals"] = 3
+        self.assertEqual(len(schema), 2)
+        self.assertEqual(schema.intern("goals"), schema["goals"])
+        self.assertEqual(list(schema.names()), ["goals", "assists"])
+        self.assertEqual(first.value_at(schema["goals"]), 1)
+        self.assertEqual(first.value_at(schema["assists"]), 0)
+        self.assertNotIn("assists", first)
+
+    def test_widen(self):
+        """
+        #name(Adding columns past the width doubles it and keeps every row's values)
+        """
+        schema = StatSchema()
+        rows = [PlayerStats(schema) for _ in range(3)]
+        names = [f"stat {index}" for index in range(3 * StatSchema.INITIAL_WIDTH)]
+        for column, name in enumerate(names):
+            for index, stats in enumerate(rows):
+                if (column + index) % 2:
+                    stats[name] = column * 10 + index
+        self.assertEqual(schema.width, 4 * StatSchema.INITIAL_WIDTH)
+        for index, stats in enumerate(rows):
+            expected = {name: column * 10 + index for column, name in enumerate(names) if (column + index) % 2}
+            self.assertEqual(dict(stats.items()), expected)
+
+    def test_release(self):
+        """
+        #name(Released rows are cleared and handed to the next stats, and releasing twice does nothing)
+        """
+        schema = StatSchema()
+        first, second = PlayerStats(schema), PlayerStats(schema)
+        first["goals"] = 7
+        rows = len(schema.epochs)
+
+        first.release()
+        first.release()
+        third = PlayerStats(schema)
+        self.assertEqual(len(schema.epochs), rows)
+        self.assertNotIn("goals", third)
+        self.assertTrue(third.is_empty())
+
+        fourth = PlayerStats(schema)
+        self.assertEqual(len(schema.epochs), rows + 1)
+        second["goals"] = 1
+        self.assertNotIn("goals", fourth)
+
+
+class ShortEpochStats(PlayerStats):
+    # Wraps after two resets instead of four billion.
+    MAX_EPOCH = 3
+
+
+class ShortEpochPlayer(Player):
+    STATS_TABLE = ShortEpochStats
+
+
+class TestReset(unittest.TestCase):
+
+    def assertReset(self, player: Player, names: list[str]):
+        self.assertEqual(len(player.stats), len(names))
+        for name in names:
+            self.assertIn(name, player.stats)
+            self.assertEqual(player[name], 0)
+        self.assertEqual(dict(player.stats.items()), dict.fromkeys(names, 0))
+
+    def test_reset_keeps_stats(self):
+        """
+        #name(After reset_stats every stat set before it is still present with value 0)
+        """
+        player, other = Player("Kane", PlayerPosition.STRIKER, 30), Player("Son", PlayerPosition.STRIKER, 30)
+        other.use_schema(player.schema)
+        player.update_stats({"goals": 3, "assists": 2})
+        other["goals"] = 5
+
+        player.reset_stats()
+        self.assertReset(player, ["goals", "assists"])
+        self.assertEqual(other["goals"], 5)
+        self.assertNotIn("saves", player.stats)
+
+        player["goals"] = 1
+        player.reset_stats()
+        player.reset_stats()
+        self.assertReset(player, ["goals", "assists"])
+        player["saves"] = 4
+        self.assertEqual(dict(player.stats.items()), {"goals": 0, "assists": 0, "saves": 4})
+
+    def test_epoch_wrap(self):
+        """
+        #name(Resets keep working when the row's epoch wraps at MAX_EPOCH)
+        """
+        player = ShortEpochPlayer("Kane", PlayerPosition.STRIKER, 30)
+        player.update_stats({"goals": 3, "assists": 2})
+        for season in range(7):
+            player.reset_stats()
+            self.assertReset(player, ["goals", "assists"])
+            player["goals"] = season + 1
+            self.assertEqual(player["goals"], season + 1)
+            self.assertEqual(player["assists"], 0)
+        self.assertLessEqual(player.schema.epochs[0], ShortEpochStats.MAX_EPOCH)
+
+    def test_fill_values(self):
+        """
+        #name(fill_values sets every stat to the given value, 0 included)
+        """
+        player = Player("Kane", PlayerPosition.STRIKER, 30)
+        player.update_stats({"goals": 3, "assists": 2})
+        player.stats.fill_values(7)
+        self.assertEqual(dict(player.stats.items()), {"goals": 7, "assists": 7})
+        player.stats.fill_values(0)
+        self.assertReset(player, ["goals", "assists"])
+
+
+class TestLeagueSchema(unittest.TestCase):
+
+    def test_team_schema(self):
+        """
+        #name(A team moves its players' stats onto its schema, and so does add_player)
+        """
+        team = make_team("Reds")
+        players = list(team.get_players())
+        self.assertTrue(all(player.schema is team.schema for player in players))
+        self.assertEqual(players[1]["Reds caps"], 11)
+
+        newcomer = Player("Newcomer", PlayerPosition.DEFENDER, 19)
+        newcomer["tackles"] = 4
+        team.add_player(newcomer)
+        self.assertIs(newcomer.schema, team.schema)
+        self.assertIs(newcomer.stats.schema, team.schema)
+        self.assertEqual(newcomer["tackles"], 4)
+
+    def test_season_schema(self):
+        """
+        #name(Teams in one season share its schema, and two seasons keep their schemas apart)
+        """
+        first_teams, second_teams = ArrayR(2), ArrayR(2)
+        first_teams[0], first_teams[1] = make_team("Reds"), make_team("Blues")
+        second_teams[0], second_teams[1] = make_team("Greens"), make_team("Whites")
+        first, second = Season(first_teams), Season(second_teams)
+        self.assertIsNot(first.schema, second.schema)
+
+        for season in (first, second):
+            for team in season.teams:
+                self.assertIs(team.schema, season.schema)
+                for index, player in enumerate(team.get_players()):
+                    self.assertIs(player.stats.schema, season.schema)
+                    self.assertEqual(player["goals"], index)
+                    self.assertEqual(player[f"{team.name} caps"], 10 + index)
+
+        first.teams[0].get_players()[0]["yellow cards"] = 1
+        self.assertIn("yellow cards", first.schema)
+        self.assertNotIn("yellow cards", second.schema)
+        self.assertEqual(sorted(first.schema.names()), ["Blues caps", "Reds caps", "goals", "yellow cards"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+import os
+import tempfile
+import unittest
+
+from data_structures.referential_array import ArrayR
+from enums import PlayerPosition, ScheduleGenerator
+from player import Player
+from random_stream import RandomStream
+from season import Season
+from team import Team
+
+SEED = 1008
+
+
+def make_teams(count: int = 8, players_per_team: int = 8) -> ArrayR[Team]:
+    """
+    Returns the same `count` teams on every call, each with players in every position and a few stats.
+    """
+    positions = tuple(PlayerPosition)
+    teams = ArrayR(count)
+    for index in range(count):
+        players = ArrayR(players_per_team)
+        for number in range(players_per_team):
+            player = Player(f"T{index} P{number}", positions[number % len(positions)], 18 + number)
+            player.update_stats({"appearances": index + number, "caps": number})
+            players[number] = player
+        teams[index] = Team(f"Team {index:02d}", players, 5)
+    return teams
+
+
+class TestSeasonCheckpoint(unittest.TestCase):
+
+    # Season options to check resuming with: the default schedule, and a lazy circle schedule.
+    OPTIONS = ({}, {"schedule_generator": ScheduleGenerator.CIRCLE, "lazy_schedule": True})
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "season.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def play(self, options: dict, stop: int, delays=()) -> tuple[Season, Season]:
+        """
+        Plays one season in one go and another that stops after `stop` weeks, is saved, loaded into a
+        fresh Season of the same teams and finished. `delays` are delay_week_of_games arguments applied
+        to both seasons after `stop` weeks. Returns the (uninterrupted, resumed) seasons.
+        """
+        full = Season(make_teams(), **options)
+        full.simulate_until(stop, RandomStream(SEED))
+        for orig_week, new_week in delays:
+            full.delay_week_of_games(orig_week, new_week)
+        full.simulate_season(RandomStream(SEED))
+
+        interrupted = Season(make_teams(), **options)
+        interrupted.simulate_until(stop, RandomStream(SEED))
+        for orig_week, new_week in delays:
+            interrupted.delay_week_of_games(orig_week, new_week)
+        interrupted.save_checkpoint(self.path)
+
+        resumed = Season(make_teams(), **options)
+        resumed.load_checkpoint(self.path)
+        self.assertEqual(resumed.current_week, stop)
+        resumed.simulate_season(RandomStream(SEED))
+        return full, resumed
+
+    def assertSameSeason(self, full: Season, resumed: Season):
+        self.assertEqual([(team.name, team.points) for team in resumed.leaderboard],
+                         [(team.name, team.points) for team in full.leaderboard])
+        self.assertEqual(resumed.checkpoint(), full.checkpoint())
+
+    def test_resume(self):
+        """
+        #name(A season saved after some weeks and loaded into a fresh Season finishes like an uninterrupted one)
+        """
+        for options in self.OPTIONS:
+            for stop in (0, 3, 7):
+                with self.subTest(options=options, stop=stop):
+                    full, resumed = self.play(options, stop)
+                    self.assertSameSeason(full, resumed)
+                    self.assertTrue(any(team.points for team in full.teams))
+
+    def test_resume_after_delay(self):
+        """
+        #name(Weeks moved by delay_week_of_games before saving stay in their new place after loading)
+        """
+        for options in self.OPTIONS:
+            with self.subTest(options=options):
+                full, resumed = self.play(options, 4, delays=((5, None), (9, 6)))
+                self.assertSameSeason(full, resumed)
+                weeks = [resumed._week_number_at(index) for index in range(len(resumed.schedule))]
+                self.assertNotEqual(weeks, sorted(weeks))
+
+    def test_restore_keeps_stats(self):
+        """
+        #name(Restoring a checkpoint brings back the players' goals and stats)
+        """
+        season = Season(make_teams())
+        season.simulate_until(5, RandomStream(SEED))
+        checkpoint = season.checkpoint()
+
+        fresh = Season(make_teams())
+        fresh.teams[0].get_players()[0]["red cards"] = 2
+        fresh.restore_checkpoint(checkpoint)
+        for team, fresh_team in zip(season.teams, fresh.teams):
+            for player, fresh_player in zip(team.get_players(), fresh_team.get_players()):
+                self.assertEqual(fresh_player.goals, player.goals)
+                self.assertEqual(dict(fresh_player.stats.items()), dict(player.stats.items()))
+
+    def test_mismatched_checkpoint(self):
+        """
+        #name(Checkpoints of another version or other teams are refused)
+        """
+        checkpoint = Season(make_teams()).checkpoint()
+        with self.assertRaises(ValueError):
+            Season(make_teams(count=6)).restore_checkpoint(checkpoint)
+        with self.assertRaises(ValueError):
+            Season(make_teams()).restore_checkpoint(dict(checkpoint, version=Season.CHECKPOINT_VERSION + 1))
+
+
+if __name__ == "__main__":
+    unittest.main()